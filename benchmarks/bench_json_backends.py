@@ -0,0 +1,110 @@
+"""JSON 解码后端基准：各后端的解析吞吐量（MB/s）与峰值内存
+
+每个 (后端, 规模) 组合在独立子进程中运行，峰值内存互不干扰。
+测试数据与 test.json 结构相同，authors 列表扩展到指定行数。
+
+用法：
+    python benchmarks/bench_json_backends.py
+    python benchmarks/bench_json_backends.py --rows 10000 1000000 --repeat 5
+"""
+
+import argparse
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from core.json_backends import available_backends, get_backend  # noqa: E402
+from core.json_lazy import index_file  # noqa: E402
+from core.json_parse import parse_file  # noqa: E402
+
+NAMES = ["张三", "李四", "王五", "赵六", "Alice", "Bob"]
+
+
+def make_payload(path: Path, rows: int, seed: int = 0) -> None:
+    """生成与 test.json 同结构的测试文件（authors 含 rows 条记录）"""
+    rnd = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"name": "JSON处理工具", "version": "1.0", "authors": [')
+        for i in range(rows):
+            if i:
+                f.write(", ")
+            record = {"id": i + 1, "name": rnd.choice(NAMES), "age": rnd.randint(18, 80)}
+            f.write(json.dumps(record, ensure_ascii=False))
+        f.write('], "features": ["JSON解析", "Key排序", "Excel生成"]}')
+
+
+def peak_rss_mb() -> float | None:
+    """当前进程的峰值常驻内存（MB），平台不支持时返回 None"""
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+        except ImportError:
+            return None
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", info.rss) / 1024 / 1024
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def run_worker(mode: str, backend_name: str, path: str, repeat: int) -> dict:
+    """子进程：解析 repeat 次，取最短用时"""
+    backend = get_backend(backend_name)
+    baseline = peak_rss_mb()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if mode == "lazy":
+            doc = index_file(path, backend=backend)
+            doc.close()
+        else:
+            doc = parse_file(path, backend=backend)
+        best = min(best, time.perf_counter() - start)
+        del doc
+    size_mb = Path(path).stat().st_size / 1024 / 1024
+    peak = peak_rss_mb()
+    return {
+        "seconds": best,
+        "mb_per_s": size_mb / best if best else float("inf"),
+        "peak_rss_mb": None if peak is None else peak - (baseline or 0),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--worker", nargs=3, metavar=("MODE", "BACKEND", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(*args.worker, repeat=args.repeat)))
+        return
+
+    modes = [("full", name) for name in available_backends()] + [("lazy", "json")]
+    print(f"{'rows':>10} {'size MB':>8} {'mode':>6} {'backend':>9} {'seconds':>8} {'MB/s':>8} {'peak MB':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            path = Path(tmp) / f"authors_{rows}.json"
+            make_payload(path, rows)
+            size_mb = path.stat().st_size / 1024 / 1024
+            for mode, name in modes:
+                cmd = [sys.executable, __file__, "--repeat", str(args.repeat), "--worker", mode, name, str(path)]
+                result = json.loads(subprocess.run(cmd, capture_output=True, text=True, check=True).stdout)
+                peak = "n/a" if result["peak_rss_mb"] is None else f"{result['peak_rss_mb']:.1f}"
+                print(
+                    f"{rows:>10} {size_mb:>8.1f} {mode:>6} {name:>9} "
+                    f"{result['seconds']:>8.3f} {result['mb_per_s']:>8.1f} {peak:>8}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""可拖动排序列表基准：10k 行的填充、拖动与多选拖动
+
+用合成的鼠标事件（event_generate）驱动 panels.listview.VirtualListbox，
+并与逐行调用Tcl的旧版 Listbox 实现对比。需要可用的显示器。
+
+用法：
+    python benchmarks/bench_listview.py
+    python benchmarks/bench_listview.py --items 10000 --drags 200 --steps 20
+"""
+
+import argparse
+import random
+import sys
+import time
+import tkinter as tk
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from panels.listview import VirtualListbox  # noqa: E402
+
+
+class LegacyDragSortListbox(tk.Listbox):
+    """旧实现（对照组）：每次越过一行都 get / delete / insert / selection_set"""
+
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+        self.drag_index = None
+        self.bind("<Button-1>", self._on_click)
+        self.bind("<B1-Motion>", self._on_drag)
+
+    def _on_click(self, event):
+        self.drag_index = self.nearest(event.y)
+
+    def _on_drag(self, event):
+        if self.drag_index is None:
+            return
+        current_index = self.nearest(event.y)
+        if current_index != self.drag_index:
+            drag_item = self.get(self.drag_index)
+            self.delete(self.drag_index)
+            self.insert(current_index, drag_item)
+            self.drag_index = current_index
+            self.selection_set(current_index)
+
+
+def fill(widget, items):
+    if isinstance(widget, VirtualListbox):
+        widget.set_items(items)
+    else:
+        widget.delete(0, tk.END)
+        for item in items:
+            widget.insert(tk.END, item)
+
+
+def drag(widget, y_from, y_to, steps):
+    """按下 -> steps 次移动 -> 松开，每个事件后处理空闲任务（即真实界面中的重绘）"""
+    widget.event_generate("<Button-1>", x=10, y=y_from)
+    for step in range(1, steps + 1):
+        widget.event_generate("<B1-Motion>", x=10, y=y_from + (y_to - y_from) * step // steps)
+        widget.update_idletasks()
+    widget.event_generate("<ButtonRelease-1>", x=10, y=y_to)
+    widget.update()
+
+
+def run(widget, items, drags, steps, multi=False, seed=0):
+    rnd = random.Random(seed)
+    widget.pack(fill="both", expand=True)
+    start = time.perf_counter()
+    fill(widget, items)
+    widget.update()
+    filled = time.perf_counter() - start
+
+    height = widget.winfo_height()
+    if multi:
+        # 先选中若干行，再从其中一行开始拖动
+        for y in range(5, min(height, 200), 40):
+            widget.event_generate("<Button-1>", x=10, y=y)
+            widget.event_generate("<ButtonRelease-1>", x=10, y=y)
+        widget.update()
+    start = time.perf_counter()
+    for _ in range(drags):
+        y_from = 5 if multi else rnd.randrange(5, height - 5)
+        drag(widget, y_from, rnd.randrange(5, height - 5), steps)
+    dragged = time.perf_counter() - start
+    widget.pack_forget()
+    return filled, dragged / drags
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--drags", type=int, default=100)
+    parser.add_argument("--steps", type=int, default=20, help="每次拖动的移动事件数")
+    args = parser.parse_args()
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        sys.exit(f"需要可用的显示器：{e}")
+    root.geometry("300x600")
+    items = [f"key_{i}" for i in range(args.items)]
+
+    cases = [
+        ("Listbox（旧）", lambda: LegacyDragSortListbox(root, selectmode=tk.MULTIPLE), False),
+        ("VirtualListbox", lambda: VirtualListbox(root), False),
+        ("VirtualListbox 多选", lambda: VirtualListbox(root), True),
+    ]
+    print(f"{args.items} 行，每次拖动 {args.steps} 个移动事件，共 {args.drags} 次")
+    print(f"{'widget':<20} {'fill ms':>9} {'per drag ms':>12}")
+    for name, factory, multi in cases:
+        widget = factory()
+        filled, per_drag = run(widget, list(items), args.drags, args.steps, multi=multi)
+        print(f"{name:<20} {filled * 1000:>9.1f} {per_drag * 1000:>12.2f}")
+        widget.destroy()
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
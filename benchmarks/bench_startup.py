@@ -0,0 +1,100 @@
+"""启动耗时基准：导入阶段（-X importtime）与窗口创建阶段
+
+导入阶段不需要图形界面：在子进程中以 -X importtime 导入 main，
+汇总总耗时并列出累计耗时最多的模块，同时检查重量级依赖是否被提前导入。
+窗口阶段需要可用的显示器：测量 App() 创建到首次刷新完成、
+以及首次切换到各面板的耗时。
+
+用法：
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --top 20 --repeat 5 --window
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 启动时不应被导入的模块（只在导出 / 解析时才需要）
+DEFERRED_MODULES = ("pandas", "openpyxl", "pyarrow", "numpy", "panels.json_panel")
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)")
+
+_WINDOW_SCRIPT = """
+import json, time
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+app = main.App()
+app.update()
+shown = time.perf_counter()
+panels = {}
+for name in list(app.frame_mapping):
+    t = time.perf_counter()
+    app.select_frame_by_name(name)
+    app.update()
+    panels[name] = time.perf_counter() - t
+app.destroy()
+print(json.dumps({"import": imported - start, "window": shown - imported, "panels": panels}))
+"""
+
+
+def import_profile() -> list[tuple[str, int, int]]:
+    """子进程中导入 main，返回 [(模块, 自身微秒, 累计微秒)]"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us)))
+    return rows
+
+
+def window_timing() -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _WINDOW_SCRIPT], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=15, help="列出累计耗时最多的前N个模块")
+    parser.add_argument("--repeat", type=int, default=3, help="重复次数，取最短一次")
+    parser.add_argument("--window", action="store_true", help="同时测量窗口与面板切换（需要显示器）")
+    args = parser.parse_args()
+
+    profiles = [import_profile() for _ in range(args.repeat)]
+    best = min(profiles, key=lambda rows: next(cum for name, _s, cum in rows if name == "main"))
+    total = next(cum for name, _s, cum in best if name == "main")
+    print(f"import main: {total / 1000:.1f} ms（{args.repeat} 次取最短）\n")
+
+    print(f"{'cumulative ms':>14} {'self ms':>8}  module")
+    for name, self_us, cumulative_us in sorted(best, key=lambda row: -row[2])[: args.top]:
+        print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>8.1f}  {name}")
+
+    imported = {name for name, _s, _c in best}
+    eager = [name for name in DEFERRED_MODULES if name in imported]
+    print(f"\n启动时被提前导入的延迟模块：{', '.join(eager) if eager else '无'}")
+
+    if args.window:
+        timings = [window_timing() for _ in range(args.repeat)]
+        fastest = min(timings, key=lambda t: t["import"] + t["window"])
+        print(f"\n窗口创建：{fastest['window'] * 1000:.1f} ms")
+        for name, seconds in fastest["panels"].items():
+            print(f"首次切换到 {name}: {seconds * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
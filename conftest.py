@@ -0,0 +1 @@
+"""pytest 配置：把仓库根目录加入导入路径，测试中可以直接 import core / panels"""
@@ -0,0 +1,249 @@
+"""列式存储：把选中列表的记录按列转换成紧凑的类型化数组（与界面无关）
+
+进入列表时把各列从原始记录转换一次，之后导出、预览、统计都直接读列：
+- int / float / bool 列 -> array('q' / 'd' / 'b') + 有值掩码
+- 字符串列 -> 字典编码：array('i') 编码 + 去重后的字符串表，重复的值只存一份
+- 其余（嵌套、混合类型）-> 普通列表，保留原对象
+统计在数组上整体计算（安装了 numpy 时用 numpy），
+导出 Arrow / Parquet 时数组缓冲区直接交给 pyarrow。
+"""
+
+from array import array
+from collections import Counter
+from itertools import compress
+
+from core.json_parse import ParseCancelled
+from core.paths import compile_path
+
+# 逐块解码成行时每块的行数
+ROW_CHUNK = 5000
+
+KIND_INT = "int"
+KIND_FLOAT = "float"
+KIND_BOOL = "bool"
+KIND_STR = "str"
+KIND_OBJECT = "object"  # 嵌套 / 混合类型 / 全为空
+
+_NUMPY_DTYPES = {"q": "int64", "d": "float64", "b": "int8", "i": "int32"}
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:  # 可选依赖：没有时用标准库逐个计算
+        return None
+    return numpy
+
+
+def encode_column(values) -> "Column":
+    """把一列Python值（缺失为 None）编码成 Column"""
+    types = set(map(type, values))
+    has_null = type(None) in types
+    types.discard(type(None))
+    valid = bytes(value is not None for value in values) if has_null else None
+
+    if types == {str}:
+        lookup = {}
+        codes = array("i", [-1 if value is None else lookup.setdefault(value, len(lookup)) for value in values])
+        return Column(KIND_STR, codes, valid, list(lookup))
+    if types == {bool}:
+        return Column(KIND_BOOL, array("b", map(bool, values)), valid)
+    if types == {int}:
+        try:
+            return Column(KIND_INT, array("q", [0 if value is None else value for value in values]), valid)
+        except OverflowError:
+            pass  # 超出64位的整数：按对象列保存
+    elif types == {float} or types == {int, float}:
+        try:
+            return Column(KIND_FLOAT, array("d", [0.0 if value is None else value for value in values]), valid)
+        except OverflowError:
+            pass  # 超出双精度范围的整数（如 10**400）：按对象列保存
+    return Column(KIND_OBJECT, list(values), valid)
+
+
+class ColumnStats:
+    """一列的统计"""
+
+    def __init__(self, kind, count, nulls, distinct=None, minimum=None, maximum=None, mean=None, top=None):
+        self.kind = kind
+        self.count = count  # 有值的行数
+        self.nulls = nulls  # 缺失或为 null 的行数
+        self.distinct = distinct  # 不同取值的个数（字符串列）
+        self.minimum = minimum
+        self.maximum = maximum
+        self.mean = mean
+        self.top = top  # 出现最多的值及次数 (值, 次数)（字符串 / 布尔列）
+
+    def summary(self) -> str:
+        """一行中文摘要，用于信息栏"""
+        parts = [f"{self.kind}，{self.count} 个值，空值 {self.nulls}"]
+        if self.distinct is not None:
+            parts.append(f"{self.distinct} 种取值")
+        if self.minimum is not None:
+            parts.append(f"最小 {self.minimum:g}，最大 {self.maximum:g}，平均 {self.mean:g}")
+        if self.top is not None:
+            parts.append(f"最常见 {self.top[0]!r}（{self.top[1]} 次）")
+        return "，".join(parts)
+
+
+class Column:
+    """一列数据
+
+    Args:
+        kind: KIND_*
+        data: 类型化数组（字符串列为编码数组，-1 表示空值）；对象列为普通列表
+        valid: 每行一个字节，1 表示有值；None 表示全部有值
+        dictionary: 字符串列去重后的取值表
+    """
+
+    def __init__(self, kind, data, valid=None, dictionary=None):
+        self.kind = kind
+        self.data = data
+        self.valid = valid
+        self.dictionary = dictionary
+        # 编码 -1（空值）取到末尾的 None，解码时可以直接 map(__getitem__)
+        self._lookup = dictionary + [None] if dictionary is not None else None
+        self._stats = None
+
+    def __len__(self):
+        return len(self.data)
+
+    def values(self, start=0, stop=None) -> list:
+        """解码 [start, stop) 行为Python值，空值为 None"""
+        chunk = self.data[start:stop]
+        if self.kind == KIND_STR:
+            return list(map(self._lookup.__getitem__, chunk))
+        if self.kind == KIND_OBJECT:
+            return chunk
+        values = [v != 0 for v in chunk] if self.kind == KIND_BOOL else chunk.tolist()
+        if self.valid is None:
+            return values
+        return [value if present else None for value, present in zip(values, self.valid[start:stop])]
+
+    def _present(self):
+        """有值的行的原始数据（迭代器）"""
+        if self.kind == KIND_STR:
+            return (code for code in self.data if code >= 0)
+        return self.data if self.valid is None else compress(self.data, self.valid)
+
+    def stats(self, cancel_event=None) -> ColumnStats:
+        """整列统计（算一次后缓存）：数值列的范围与平均，字符串 / 布尔列的取值分布"""
+        if self._stats is None:
+            if cancel_event is not None and cancel_event.is_set():
+                raise ParseCancelled()
+            self._stats = self._compute_stats()
+        return self._stats
+
+    def _compute_stats(self):
+        total = len(self.data)
+        if self.kind == KIND_OBJECT:
+            nulls = total - sum(self.valid) if self.valid is not None else 0
+            return ColumnStats(self.kind, total - nulls, nulls)
+
+        np = _numpy()
+        if np is not None:
+            data = np.frombuffer(self.data, dtype=_NUMPY_DTYPES[self.data.typecode])
+            if self.kind == KIND_STR:
+                data = data[data >= 0]
+            elif self.valid is not None:
+                data = data[np.frombuffer(self.valid, dtype=np.bool_)]
+            count = len(data)
+            if self.kind in (KIND_STR, KIND_BOOL):
+                counts = np.bincount(data, minlength=1) if count else np.zeros(1, dtype=np.int64)
+                code = int(counts.argmax())
+                top = (self._decode(code), int(counts[code])) if count else None
+                return ColumnStats(self.kind, count, total - count, self._distinct(counts), top=top)
+            if not count:
+                return ColumnStats(self.kind, 0, total)
+            return ColumnStats(
+                self.kind,
+                count,
+                total - count,
+                minimum=data.min().item(),
+                maximum=data.max().item(),
+                mean=data.mean().item(),
+            )
+
+        present = list(self._present())
+        count = len(present)
+        if self.kind in (KIND_STR, KIND_BOOL):
+            counts = Counter(present)
+            top = counts.most_common(1)
+            top = (self._decode(top[0][0]), top[0][1]) if top else None
+            return ColumnStats(self.kind, count, total - count, len(counts) if self.kind == KIND_STR else None, top=top)
+        if not count:
+            return ColumnStats(self.kind, 0, total)
+        return ColumnStats(
+            self.kind, count, total - count, minimum=min(present), maximum=max(present), mean=sum(present) / count
+        )
+
+    def _decode(self, code):
+        return self.dictionary[code] if self.kind == KIND_STR else code != 0
+
+    def _distinct(self, counts):
+        return int((counts > 0).sum()) if self.kind == KIND_STR else None
+
+    def to_arrow(self):
+        """转换为 pyarrow 数组（复用数组缓冲区，字符串列为字典数组；对象列不适用）"""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        n = len(self.data)
+        if self.kind == KIND_OBJECT:
+            raise TypeError("对象列没有类型化的缓冲区")
+        if self.kind == KIND_STR:
+            codes = pa.Array.from_buffers(pa.int32(), n, [None, pa.py_buffer(self.data)])
+            validity = pc.not_equal(codes, -1).buffers()[1] if self.valid is not None else None
+            indices = pa.Array.from_buffers(pa.int32(), n, [validity, pa.py_buffer(self.data)])
+            return pa.DictionaryArray.from_arrays(indices, pa.array(self.dictionary, type=pa.string()))
+
+        validity = _bitmap(self.valid, n) if self.valid is not None else None
+        if self.kind == KIND_BOOL:
+            return pa.Array.from_buffers(pa.bool_(), n, [validity, _bitmap(self.data, n)])
+        arrow_type = pa.int64() if self.kind == KIND_INT else pa.float64()
+        return pa.Array.from_buffers(arrow_type, n, [validity, pa.py_buffer(self.data)])
+
+
+def _bitmap(flags, n):
+    """每行一个字节的 0/1 标记 -> Arrow 的位图缓冲区"""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    return pc.not_equal(pa.Array.from_buffers(pa.int8(), n, [None, pa.py_buffer(flags)]), 0).buffers()[1]
+
+
+class ColumnStore:
+    """选中列表的列式存储：构建时一次转换全部列，之后不再引用原始记录"""
+
+    def __init__(self, records, columns, progress=None, cancel_event=None):
+        rows = [item for item in records if isinstance(item, dict)]
+        self._length = len(rows)
+        self._columns = {}  # 路径 -> Column
+        for i, path in enumerate(columns):
+            if cancel_event is not None and cancel_event.is_set():
+                raise ParseCancelled()
+            self._columns[path] = encode_column(list(map(compile_path(path, None), rows)))
+            if progress is not None:
+                progress(i + 1, len(columns))
+
+    def __len__(self):
+        return self._length
+
+    def column(self, path) -> Column:
+        return self._columns[path]
+
+    def rows(self, columns, start=0, stop=None, convert=None) -> list:
+        """[start, stop) 行中指定列的值（按行），convert 只作用于对象列"""
+        decoded = []
+        for path in columns:
+            column = self._columns[path]
+            values = column.values(start, stop)
+            if convert is not None and column.kind == KIND_OBJECT:
+                values = list(map(convert, values))
+            decoded.append(values)
+        return list(map(list, zip(*decoded)))
+
+    def iter_rows(self, columns, convert=None, chunk=ROW_CHUNK):
+        """逐块解码、逐行产出指定列的值"""
+        for start in range(0, self._length, chunk):
+            yield from self.rows(columns, start, start + chunk, convert)
@@ -0,0 +1,177 @@
+"""解析结果缓存：按内容哈希查找，同一份JSON再次解析时直接复用
+
+内存中按 LRU 保留最近的解析结果（连同根节点的显示文本、检索索引等派生数据），
+估算的总占用超过预算时淘汰最久未用的；可选地把结果 pickle 到磁盘目录，
+之后（包括下次启动）打开同一份数据时直接反序列化，不再解析JSON。
+写磁盘在单独的后台线程中进行，不占用解析任务的时间。
+"""
+
+import gc
+import hashlib
+import mmap
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import xxhash
+except ImportError:  # 可选依赖：没有时用标准库的 blake2b
+    xxhash = None
+
+# 内存预算（MB），可用环境变量 PY_TOOLS_DOC_CACHE_MB 调整，0 表示不缓存
+MEMORY_BUDGET = int(os.environ.get("PY_TOOLS_DOC_CACHE_MB", "512")) * 1024 * 1024
+# 磁盘缓存目录（设置环境变量 PY_TOOLS_DOC_CACHE_DIR 后启用）及其容量上限
+SPILL_DIR = os.environ.get("PY_TOOLS_DOC_CACHE_DIR") or None
+DISK_BUDGET = 2 * 1024 * 1024 * 1024
+
+# 解析后的Python对象大约占源文本长度这么多倍的内存（字节），用于估算缓存占用
+MEMORY_FACTOR = 6
+
+
+def content_hash(data) -> str:
+    """str / bytes / memoryview 的内容哈希（有 xxhash 时用 xxh3_128，否则用 blake2b）"""
+    if isinstance(data, str):
+        data = data.encode("utf-8", "surrogatepass")
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def file_hash(path) -> str:
+    """文件内容的哈希（内存映射读取，不把文件读成 bytes）"""
+    with open(path, "rb") as f:
+        if f.seek(0, 2) == 0:
+            return content_hash(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return content_hash(view)
+
+
+class DocumentCache:
+    """解析结果的 LRU 缓存（线程安全，可在工作线程中调用）
+
+    Args:
+        budget: 内存预算（字节），按 MEMORY_FACTOR × 源文本长度估算每项的占用
+        spill_dir: 磁盘缓存目录，None 表示只缓存在内存中
+        disk_budget: 磁盘缓存容量上限（字节），超出时删除最久未用的文件
+    """
+
+    def __init__(self, budget=MEMORY_BUDGET, spill_dir=SPILL_DIR, disk_budget=DISK_BUDGET):
+        self.budget = budget
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        self.disk_budget = disk_budget
+        self._entries = OrderedDict()  # 内容哈希 -> (结果, 估算占用)
+        self._size = 0
+        self._lock = threading.Lock()
+        self._writer = None  # 写磁盘缓存的单线程执行器，第一次 spill 时创建
+
+    def get(self, key):
+        """取缓存的结果：先查内存，再查磁盘；没有时返回 None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[0]
+        loaded = self._load(key)
+        if loaded is None:
+            return None
+        size, value = loaded
+        self._remember(key, value, size)
+        return value
+
+    def put(self, key, value, source_size):
+        """把一份解析结果放进内存缓存；source_size 为源文本长度（写磁盘见 spill）"""
+        self._remember(key, value, source_size * MEMORY_FACTOR)
+
+    def spill(self, key, value, source_size):
+        """在后台线程中把解析结果写入磁盘缓存（未设置磁盘目录时忽略）"""
+        if self.spill_dir is None:
+            return
+        with self._lock:
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="doc-cache-spill")
+        self._writer.submit(self._spill, key, value, source_size * MEMORY_FACTOR)
+
+    def clear(self):
+        """清空内存中的缓存（磁盘缓存保留）"""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remember(self, key, value, size):
+        if size > self.budget:
+            return  # 单项超出预算：不放进内存
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old[1]
+            self._entries[key] = (value, size)
+            self._size += size
+            while self._size > self.budget:
+                _value, evicted = self._entries.popitem(last=False)[1]
+                self._size -= evicted
+
+    # ---------- 磁盘 ----------
+
+    def _path(self, key):
+        return self.spill_dir / f"{key}.pickle"
+
+    def _load(self, key):
+        if self.spill_dir is None:
+            return None
+        path = self._path(key)
+        gc_enabled = gc.isenabled()
+        gc.disable()  # 反序列化大量小对象时关闭GC，可快一倍以上
+        try:
+            with open(path, "rb") as f:
+                loaded = pickle.load(f)
+            os.utime(path)  # 按访问时间淘汰
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None  # 不存在或已损坏：重新解析
+        finally:
+            if gc_enabled:
+                gc.enable()
+        return loaded
+
+    def _spill(self, key, value, size):
+        path = self._path(key)
+        temp = None
+        try:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            # 先写临时文件再改名，其他进程不会读到写了一半的文件
+            with tempfile.NamedTemporaryFile(dir=self.spill_dir, suffix=".tmp", delete=False) as f:
+                temp = f.name
+                pickle.dump((size, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp, path)
+        except Exception:
+            # 目录不可写或结果无法序列化：删掉写了一半的临时文件，只缓存在内存中
+            if temp is not None:
+                try:
+                    os.unlink(temp)
+                except OSError:
+                    pass
+            return
+        self._prune_disk()
+
+    def _prune_disk(self):
+        """磁盘缓存超出容量时删除最久未用的文件"""
+        try:
+            files = [(entry.stat().st_mtime, entry.stat().st_size, entry) for entry in self.spill_dir.glob("*.pickle")]
+        except OSError:
+            return
+        total = sum(size for _mtime, size, _path in files)
+        for _mtime, size, path in sorted(files, key=lambda item: item[0]):
+            if total <= self.disk_budget:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+
+
+# 进程内共享的实例
+documents = DocumentCache()
@@ -0,0 +1,94 @@
+"""转换引擎：JSON文件 -> Excel / CSV / Parquet / Arrow
+
+与界面无关，供命令行批处理（json2excel.py）在子进程中调用，
+解析、按路径取列表、推断列、导出都复用界面使用的同一套模块。
+"""
+
+import time
+
+from core.columnar import ColumnStore
+from core.exporters import export_records
+from core.json_backends import get_backend
+from core.json_lazy import LazyJsonObject, index_file
+from core.navigator import PathNavigator, format_node_path
+from core.schema import infer_schema
+
+
+class ConvertResult:
+    """单个文件的转换结果（可在进程间传递）"""
+
+    def __init__(self, source, output, rows=0, columns=0, parse_seconds=0.0, export_seconds=0.0, error=None):
+        self.source = source
+        self.output = output
+        self.rows = rows  # 写出的数据行数
+        self.columns = columns  # 导出的列数
+        self.parse_seconds = parse_seconds  # 解析 + 取列表 + 推断列
+        self.export_seconds = export_seconds
+        self.error = error  # 失败原因，成功时为 None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def seconds(self) -> float:
+        return self.parse_seconds + self.export_seconds
+
+
+def load_list(doc, node_path) -> list:
+    """从文档中按节点路径（如 ("orders", "items")）取出展开后的记录列表
+
+    Raises:
+        ValueError: 根节点不是对象、Key不存在或不是列表
+    """
+    if not isinstance(doc, (dict, LazyJsonObject)):
+        raise ValueError("JSON根节点必须是对象（字典）类型")
+    if node_path[0] not in doc:
+        raise ValueError(f"找不到Key：{node_path[0]}")
+    records = PathNavigator(doc).records(node_path)
+    if not isinstance(records, list):
+        raise ValueError(f"{node_path[0]} 不是列表")
+    return records
+
+
+def convert_file(source, node_path, output, columns=None, flatten=False, fmt=None, backend=None) -> ConvertResult:
+    """转换一个JSON文件，出错时不抛异常，而是记录在结果中
+
+    只为顶层建立流式索引，真正解析的只有 node_path 第一步对应的列表。
+
+    Args:
+        source: JSON文件路径
+        node_path: 列表路径（Key元组，每一步展开一层列表）
+        output: 输出文件路径
+        columns: 要导出的列（路径字符串）；为 None 时使用推断出的全部列
+        flatten: 未指定 columns 时，是否按叶子路径展开嵌套字段
+        fmt: 导出格式（EXPORT_FORMATS 的名称）；为 None 时按输出文件扩展名判断
+        backend: JSON解码后端名称；为 None 时使用标准库 json（大整数不丢精度）
+    """
+    start = time.perf_counter()
+    parsed = None
+    try:
+        doc = index_file(source, backend=get_backend(backend))
+        try:
+            records = load_list(doc, node_path)
+            if columns is None:
+                columns = infer_schema(records, flatten=flatten).keys
+            if not columns:
+                raise ValueError(f"列表 {format_node_path(node_path)} 中没有对象类型的元素")
+            parsed = time.perf_counter()
+            columns = list(columns)
+            rows = export_records(output, ColumnStore(records, columns), columns, node_path[-1], fmt=fmt)
+        finally:
+            if isinstance(doc, LazyJsonObject):
+                doc.close()
+    except Exception as e:
+        elapsed = time.perf_counter() - start
+        return ConvertResult(source, output, parse_seconds=elapsed, error=str(e) or type(e).__name__)
+    return ConvertResult(
+        source,
+        output,
+        rows=rows,
+        columns=len(columns),
+        parse_seconds=parsed - start,
+        export_seconds=time.perf_counter() - parsed,
+    )
@@ -0,0 +1,250 @@
+"""列表数据导出（与界面无关，可在工作线程中调用）
+
+逐行从原始记录流式写出，不构建 DataFrame 等中间副本。
+各格式都先写到同目录下的临时文件，成功后再改名为目标文件：
+取消或出错时删除临时文件，目标文件不会留下写了一半的内容。
+"""
+
+import csv
+import functools
+import itertools
+import json
+import os
+import re
+import tempfile
+
+from core.columnar import KIND_OBJECT, ColumnStore
+from core.paths import compile_path
+
+# 每写这么多行回报一次进度并检查取消标记
+EXPORT_CHUNK_ROWS = 5000
+
+# Excel 单个工作表的最大行数（含表头）
+XLSX_MAX_ROWS = 1_048_576
+
+_INVALID_SHEET_CHARS = re.compile(r"[\[\]:*?/\\]")
+
+# 进程的 umask（导入时读取一次）：临时文件改名为目标文件前按它恢复普通文件的权限
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+class ExportCancelled(Exception):
+    """导出被用户取消"""
+
+
+def cell_value(value):
+    """嵌套的 dict / list 转为JSON文本，其余原样写出"""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def iter_rows(records, columns):
+    """按列（路径）顺序逐行产出记录中的值，跳过非字典元素；records 也可以是 ColumnStore"""
+    if isinstance(records, ColumnStore):
+        yield from records.iter_rows(columns, convert=cell_value)
+        return
+    accessors = [compile_path(path) for path in columns]
+    for item in records:
+        if isinstance(item, dict):
+            yield [cell_value(get(item)) for get in accessors]
+
+
+def has_rows(records) -> bool:
+    """列表中是否至少有一条可导出的记录"""
+    if isinstance(records, ColumnStore):
+        return len(records) > 0
+    return any(isinstance(item, dict) for item in records)
+
+
+class _Progress:
+    """按块回报进度、检查取消"""
+
+    def __init__(self, total, progress, cancel_event):
+        self.total = total
+        self.progress = progress
+        self.cancel_event = cancel_event
+
+    def step(self, done):
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise ExportCancelled()
+        if self.progress is not None:
+            self.progress(done, self.total)
+
+
+def atomic_output(writer):
+    """写出函数的装饰器：先写同目录的临时文件，成功后 os.replace 到目标路径"""
+
+    @functools.wraps(writer)
+    def wrapper(path, *args, **kwargs):
+        directory, name = os.path.split(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=os.path.splitext(name)[1], dir=directory)
+        os.close(fd)
+        try:
+            written = writer(tmp_path, *args, **kwargs)
+            os.chmod(tmp_path, 0o666 & ~_UMASK)  # mkstemp 创建的文件只有属主可读写
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        return written
+
+    return wrapper
+
+
+def safe_sheet_name(name: str) -> str:
+    """去掉Excel工作表名中的非法字符，并截断到31个字符"""
+    return _INVALID_SHEET_CHARS.sub("_", name)[:31] or "Sheet1"
+
+
+@atomic_output
+def write_xlsx(path, records, columns, sheet_name, progress=None, cancel_event=None) -> int:
+    """以只写模式流式写出xlsx，内存占用与行数无关
+
+    超过单表行数上限时自动续写到 "<sheet_name>_2"、"<sheet_name>_3" ……
+
+    Args:
+        path: 输出文件路径
+        records: 记录列表（list[dict]）
+        columns: 要导出的Key或嵌套路径（同时作为表头）
+        sheet_name: 工作表名
+        progress: 进度回调 progress(已写行数, 总记录数)
+        cancel_event: threading.Event，置位后抛出 ExportCancelled
+
+    Returns:
+        写出的数据行数
+    """
+    from openpyxl import Workbook  # 仅在导出时加载
+
+    tracker = _Progress(len(records), progress, cancel_event)
+    workbook = Workbook(write_only=True)
+    base_name = safe_sheet_name(sheet_name)
+    sheets = []
+    sheet_rows = XLSX_MAX_ROWS
+    written = 0
+    try:
+        for row in iter_rows(records, columns):
+            if sheet_rows >= XLSX_MAX_ROWS:
+                suffix = "" if not sheets else f"_{len(sheets) + 1}"
+                sheet = workbook.create_sheet(title=base_name[: 31 - len(suffix)] + suffix)
+                sheets.append(sheet)
+                sheet.append(columns)
+                sheet_rows = 1
+            sheet.append(row)
+            sheet_rows += 1
+            written += 1
+            if written % EXPORT_CHUNK_ROWS == 0:
+                tracker.step(written)
+        tracker.step(written)
+    except BaseException:
+        # 取消或出错：关闭已创建工作表的临时文件（输出的临时文件由 atomic_output 删除）
+        for sheet in sheets:
+            sheet.close()
+        raise
+    if not sheets:
+        workbook.create_sheet(title=base_name).append(columns)
+    workbook.save(path)
+    return written
+
+
+@atomic_output
+def write_csv(path, records, columns, name=None, progress=None, cancel_event=None) -> int:
+    """流式写出CSV（UTF-8 带BOM，Excel可直接打开中文），参数同 write_xlsx，name 不使用"""
+    tracker = _Progress(len(records), progress, cancel_event)
+    rows = iter_rows(records, columns)
+    written = 0
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        while True:
+            chunk = list(itertools.islice(rows, EXPORT_CHUNK_ROWS))
+            if not chunk:
+                break
+            writer.writerows(chunk)
+            written += len(chunk)
+            tracker.step(written)
+    return written
+
+
+def build_arrow_table(records, columns, progress=None, cancel_event=None):
+    """按列构建 pyarrow.Table（类型不一致的列转为字符串），进度按已完成的列数回报"""
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError("导出 Parquet / Arrow 需要安装 pyarrow") from None
+
+    store = records if isinstance(records, ColumnStore) else None
+    rows = None if store is not None else [item for item in records if isinstance(item, dict)]
+    tracker = _Progress(len(columns), progress, cancel_event)
+    arrays = []
+    for i, path in enumerate(columns):
+        if store is None:
+            arrays.append(_object_array(pa, list(map(compile_path(path, None), rows))))
+        else:
+            column = store.column(path)
+            arrays.append(_object_array(pa, column.data) if column.kind == KIND_OBJECT else column.to_arrow())
+        tracker.step(i + 1)
+    return pa.Table.from_arrays(arrays, names=list(columns))
+
+
+def _object_array(pa, values):
+    """一列Python值转为Arrow数组，类型不一致时整列转为字符串"""
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        return pa.array([None if v is None else _as_text(v) for v in values], type=pa.string())
+
+
+def _as_text(value):
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+@atomic_output
+def write_parquet(path, records, columns, name=None, progress=None, cancel_event=None) -> int:
+    """写出Parquet文件（zstd压缩），参数同 write_xlsx，name 不使用"""
+    import pyarrow.parquet as pq
+
+    table = build_arrow_table(records, columns, progress, cancel_event)
+    pq.write_table(table, path, compression="zstd")
+    return table.num_rows
+
+
+@atomic_output
+def write_arrow(path, records, columns, name=None, progress=None, cancel_event=None) -> int:
+    """写出Arrow IPC（Feather V2）文件，参数同 write_xlsx，name 不使用"""
+    import pyarrow as pa
+
+    table = build_arrow_table(records, columns, progress, cancel_event)
+    with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return table.num_rows
+
+
+# 导出格式：名称 -> (扩展名, 文件类型说明, 写出函数)
+EXPORT_FORMATS = {
+    "Excel": (".xlsx", "Excel文件", write_xlsx),
+    "CSV": (".csv", "CSV文件", write_csv),
+    "Parquet": (".parquet", "Parquet文件", write_parquet),
+    "Arrow": (".arrow", "Arrow IPC文件", write_arrow),
+}
+
+
+def format_for_path(path, default="Excel") -> str:
+    """按文件扩展名确定导出格式，无法识别时使用 default"""
+    ext = os.path.splitext(path)[1].lower()
+    for name, (format_ext, _label, _writer) in EXPORT_FORMATS.items():
+        if ext == format_ext:
+            return name
+    return default
+
+
+def export_records(path, records, columns, name, progress=None, cancel_event=None, fmt=None) -> int:
+    """按格式导出记录（fmt 为 None 时按扩展名判断），参数同 write_xlsx"""
+    writer = EXPORT_FORMATS[fmt or format_for_path(path)][2]
+    return writer(path, records, columns, name, progress=progress, cancel_event=cancel_event)
@@ -0,0 +1,81 @@
+"""JSON 解码后端：可选 orjson 等更快的实现，默认使用标准库 json"""
+
+import importlib
+import json
+
+# 按速度从快到慢排列
+BACKEND_PRIORITY = ("orjson", "simdjson", "ujson", "json")
+
+# 未指定后端时使用标准库：orjson 会把超出64位的整数不报错地解析为 float
+DEFAULT_BACKEND = "json"
+
+
+class JsonBackend:
+    """一个JSON解码后端；快速后端解析失败时改用标准库重新解析（报错带行列号）"""
+
+    def __init__(self, name, loads, accepts_memoryview):
+        self.name = name
+        self._loads = loads
+        self.accepts_memoryview = accepts_memoryview  # 能否直接解析 memoryview（无需复制）
+
+    @property
+    def is_stdlib(self) -> bool:
+        return self.name == "json"
+
+    def loads(self, data):
+        """解析 str / bytes / memoryview"""
+        if isinstance(data, memoryview) and not self.accepts_memoryview:
+            data = data.tobytes()
+        if self.is_stdlib:
+            return json.loads(data)
+        try:
+            return self._loads(data)
+        except ValueError:
+            if isinstance(data, memoryview):
+                data = data.tobytes()
+            return json.loads(data)
+
+    def __repr__(self):
+        return f"JsonBackend({self.name!r})"
+
+
+# 各后端的 loads 都接受 str 和 bytes；memoryview 只有 orjson 支持，其余先转成 bytes
+_FACTORIES = {
+    "orjson": lambda module: JsonBackend("orjson", module.loads, accepts_memoryview=True),
+    "simdjson": lambda module: JsonBackend("simdjson", module.loads, accepts_memoryview=False),
+    "ujson": lambda module: JsonBackend("ujson", module.loads, accepts_memoryview=False),
+    "json": lambda module: JsonBackend("json", module.loads, accepts_memoryview=False),
+}
+_cache = {}
+
+
+def _try_load(name):
+    if name not in _cache:
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            _cache[name] = None
+        else:
+            _cache[name] = _FACTORIES[name](module)
+    return _cache[name]
+
+
+def available_backends() -> list[str]:
+    """当前环境可用的后端名称（按速度排序）"""
+    return [name for name in BACKEND_PRIORITY if _try_load(name) is not None]
+
+
+def get_backend(name: str | None = None) -> JsonBackend:
+    """取指定后端；name 为 None 时返回默认后端（标准库 json）
+
+    Raises:
+        ValueError: 指定的后端未知或未安装
+    """
+    if name is None:
+        name = DEFAULT_BACKEND
+    if name not in _FACTORIES:
+        raise ValueError(f"未知的JSON后端：{name}")
+    backend = _try_load(name)
+    if backend is None:
+        raise ValueError(f"JSON后端未安装：{name}")
+    return backend
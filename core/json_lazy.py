@@ -0,0 +1,340 @@
+"""JSON 流式索引：只扫描顶层Key及其值的偏移，子树在访问时才解析"""
+
+import json
+import mmap
+import re
+from collections.abc import Mapping
+
+from core.json_parse import ParseCancelled, parse_incremental
+
+# 每扫描这么多字节回报一次进度并检查取消标记
+PROGRESS_STEP = 4 << 20
+
+# 跳过大容器时的分块大小：块内用C层字节操作整体判断，SLOW_CHUNK 以内才逐个括号扫描
+FAST_CHUNK_MIN = 64 << 10
+FAST_CHUNK_MAX = 8 << 20
+SLOW_CHUNK = 16 << 10
+
+# 值的类型标记（由值的首字符判断，无需解析）
+KIND_DICT = "dict"
+KIND_LIST = "list"
+KIND_STR = "str"
+KIND_SCALAR = "scalar"
+
+
+class _Patterns:
+    """str / bytes 两套正则（内存映射的文件按 bytes 扫描）"""
+
+    def __init__(self, cast):
+        self.cast = cast
+        self.whitespace = re.compile(cast(r"[ \t\n\r]*"))
+        self.string = re.compile(cast(r'"[^"\\]*(?:\\.[^"\\]*)*"'))
+        # 跳过非括号内容（字符串整体跳过，其中的括号不计入层级）
+        self.skip = re.compile(cast(r'[^"\[\]{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*'))
+        self.open_chars = frozenset(cast("[{"))
+        self.close_chars = frozenset(cast("]}"))
+        self.first_char_kind = {cast("{")[0]: KIND_DICT, cast("[")[0]: KIND_LIST, cast('"')[0]: KIND_STR}
+
+
+_STR_PATTERNS = _Patterns(str)
+_BYTES_PATTERNS = _Patterns(lambda s: s.encode("ascii"))
+
+_ESCAPE = re.compile(rb"\\.", re.DOTALL)
+_REDUCED_STRING = re.compile(rb'"[^"]*"')
+_NON_STRUCTURAL = bytes(c for c in range(256) if c not in b'"[]{}')
+_NORMALIZE_BRACKETS = bytes.maketrans(b"{}", b"[]")
+
+
+def _bracket_profile(cleaned):
+    """统计一块已去除转义的JSON（起止都在字符串外）中未配对的右括号数和左括号数
+
+    只保留引号和括号，去掉字符串后反复消去相邻的成对括号，剩下的形如 "]]][["。
+    """
+    reduced = cleaned.translate(_NORMALIZE_BRACKETS, _NON_STRUCTURAL)
+    # 相邻的两个引号要么是空串，要么连接前后两个字符串，直接删除不影响结果
+    reduced = reduced.replace(b'""', b"")
+    if b'"' in reduced:
+        reduced = _REDUCED_STRING.sub(b"", reduced)
+    while b"[]" in reduced:
+        reduced = reduced.replace(b"[]", b"")
+    opens = len(reduced.lstrip(b"]"))
+    return len(reduced) - opens, opens
+
+
+def _count_backslashes(buf, pos, backslash):
+    """pos 之前紧邻的连续反斜杠个数"""
+    count = 0
+    while pos - count - 1 >= 0 and buf[pos - count - 1 : pos - count] == backslash:
+        count += 1
+    return count
+
+
+def _error(msg, buf, pos):
+    """构造 JSONDecodeError（bytes 缓冲区时换算为字符行列号）"""
+    if isinstance(buf, str):
+        return json.JSONDecodeError(msg, buf, pos)
+    prefix = bytes(buf[:pos]).decode("utf-8", "replace")
+    return json.JSONDecodeError(msg, prefix, len(prefix))
+
+
+class LazyJsonObject(Mapping):
+    """顶层为对象的JSON文档，值按需解析并缓存
+
+    buf 可以是 str，也可以是内存映射的 bytes；只保存每个顶层值的 (起始, 结束, 类型)。
+    """
+
+    def __init__(self, buf, spans, scalars, owner=None, backend=None):
+        self._buf = buf
+        self._spans = spans  # key -> (start, end, kind)
+        self._values = scalars  # 已解析的值（标量在扫描时直接解析）
+        self._owner = owner  # 需要随文档一起关闭的资源（文件 / mmap）
+        self._backend = backend  # 解析子树使用的JSON后端
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            return self.load(key)
+
+    def load(self, key, progress=None, cancel_event=None):
+        """解析并缓存一个顶层值，参数同 parse_incremental（可在工作线程中调用）"""
+        if key in self._values:
+            return self._values[key]
+        start, end, _kind = self._spans[key]
+        chunk = self._buf[start:end]
+        backend = self._backend
+        if not isinstance(chunk, str) and (backend is None or backend.is_stdlib):
+            chunk = chunk.decode("utf-8")
+        value = parse_incremental(chunk, progress=progress, cancel_event=cancel_event, backend=backend)
+        self._values[key] = value
+        return value
+
+    def __iter__(self):
+        return iter(self._spans)
+
+    def __len__(self):
+        return len(self._spans)
+
+    def __contains__(self, key):
+        return key in self._spans
+
+    def kind(self, key) -> str:
+        """值的类型标记（不触发解析）"""
+        return self._spans[key][2]
+
+    def span_size(self, key) -> int:
+        """值在源文本中占用的长度"""
+        start, end, _kind = self._spans[key]
+        return end - start
+
+    def is_materialized(self, key) -> bool:
+        return key in self._values
+
+    def close(self):
+        """释放底层的文件映射"""
+        self._values.clear()
+        self._buf = None
+        if self._owner is not None:
+            for resource in self._owner:
+                resource.close()
+            self._owner = None
+
+
+def value_kind(doc, key) -> str:
+    """取顶层值的类型标记，兼容普通 dict 与 LazyJsonObject"""
+    if isinstance(doc, LazyJsonObject):
+        return doc.kind(key)
+    value = doc[key]
+    if isinstance(value, dict):
+        return KIND_DICT
+    if isinstance(value, list):
+        return KIND_LIST
+    if isinstance(value, str):
+        return KIND_STR
+    return KIND_SCALAR
+
+
+class _Scanner:
+    def __init__(self, buf, start, progress, cancel_event):
+        self.buf = buf
+        self.pos = start
+        self.total = len(buf)
+        self.p = _STR_PATTERNS if isinstance(buf, str) else _BYTES_PATTERNS
+        self.progress = progress
+        self.cancel_event = cancel_event
+        self.next_report = PROGRESS_STEP
+
+    def checkpoint(self, pos):
+        self.next_report = pos + PROGRESS_STEP
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise ParseCancelled()
+        if self.progress is not None:
+            self.progress(pos, self.total)
+
+    def skip_ws(self, pos):
+        return self.p.whitespace.match(self.buf, pos).end()
+
+    def expect(self, pos, char, msg):
+        if self.buf[pos : pos + 1] != self.p.cast(char):
+            raise _error(msg, self.buf, pos)
+        return pos + 1
+
+    def read_key(self, pos):
+        match = self.p.string.match(self.buf, pos)
+        if match is None:
+            raise _error("Expecting property name enclosed in double quotes", self.buf, pos)
+        return json.loads(match.group()), match.end()
+
+    def skip_container(self, pos):
+        """跳过一个对象/数组，返回其结束位置（按块跳过，不做完整语法校验）"""
+        depth, pos, step = 1, pos + 1, FAST_CHUNK_MIN
+        narrowed = None  # 正在缩小的块大小
+        while True:
+            end, cleaned = self._string_safe_chunk(pos, min(pos + step, self.total))
+            closes, opens = _bracket_profile(cleaned)
+            if closes >= depth:
+                size = end - pos
+                if size <= SLOW_CHUNK or (narrowed is not None and size >= narrowed):
+                    return self._walk(pos, depth)
+                narrowed, step = size, max(size // 4, 1)
+                continue
+            if end >= self.total:
+                raise _error("Expecting ',' delimiter", self.buf, self.total)
+            depth += opens - closes
+            pos, narrowed = end, None
+            step = min(max(step * 2, SLOW_CHUNK), FAST_CHUNK_MAX)
+            if pos >= self.next_report:
+                self.checkpoint(pos)
+
+    def _chunk_bytes(self, start, end):
+        chunk = self.buf[start:end]
+        return chunk.encode("utf-8", "surrogatepass") if isinstance(chunk, str) else chunk
+
+    def _string_safe_chunk(self, pos, end):
+        """取 [pos, end) 的块并去除转义，必要时调整 end 使其不落在字符串内部
+
+        pos 必须在字符串外；返回 (end, 去除转义后的块)。
+        """
+        cleaned = _ESCAPE.sub(b"", self._chunk_bytes(pos, end))
+        if end >= self.total or cleaned.count(b'"') % 2 == 0:
+            return end, cleaned
+        # 奇数个引号：最后一个未转义的引号开启了未结束的字符串，块在它之前截断
+        buf, quote, backslash = self.buf, self.p.cast('"'), self.p.cast("\\")
+        q = buf.rfind(quote, pos, end)
+        while q > pos and _count_backslashes(buf, q, backslash) % 2:
+            q = buf.rfind(quote, pos, q)
+        if q > pos:
+            end = q
+        else:
+            # 块以一个超长字符串开头：块延伸到该字符串结束
+            match = self.p.string.match(buf, pos)
+            if match is None:
+                raise _error("Unterminated string starting at", buf, pos)
+            end = match.end()
+        return end, _ESCAPE.sub(b"", self._chunk_bytes(pos, end))
+
+    def _walk(self, pos, depth):
+        """从 depth 层开始逐个括号扫描，返回容器结束位置"""
+        buf, p = self.buf, self.p
+        skip, open_chars, close_chars = p.skip.match, p.open_chars, p.close_chars
+        pos = skip(buf, pos).end()
+        while pos < self.total:
+            char = buf[pos]
+            if char in open_chars:
+                depth += 1
+            elif char in close_chars:
+                depth -= 1
+                if depth == 0:
+                    return pos + 1
+            else:
+                raise _error("Unterminated string starting at", buf, pos)
+            pos = skip(buf, pos + 1).end()
+        raise _error("Expecting ',' delimiter", buf, pos)
+
+    def scan_value(self, pos):
+        """返回 (start, end, kind, value)，标量直接解析"""
+        buf = self.buf
+        kind = self.p.first_char_kind.get(buf[pos]) if pos < self.total else None
+        if kind in (KIND_DICT, KIND_LIST):
+            return pos, self.skip_container(pos), kind, None
+        if kind == KIND_STR:
+            match = self.p.string.match(buf, pos)
+            if match is None:
+                raise _error("Unterminated string starting at", buf, pos)
+            return pos, match.end(), kind, json.loads(match.group())
+        # 数字 / true / false / null：按分隔符截取
+        end = pos
+        while end < self.total and buf[end : end + 1] not in self.p.cast(",}] \t\n\r"):
+            end += 1
+        try:
+            value = json.loads(buf[pos:end])
+        except json.JSONDecodeError:
+            raise _error("Expecting value", buf, pos) from None
+        return pos, end, KIND_SCALAR, value
+
+    def scan_object(self):
+        """扫描顶层对象，返回 (spans, scalars, 结束位置)"""
+        spans, scalars = {}, {}
+        pos = self.expect(self.skip_ws(self.pos), "{", "Expecting value")
+        pos = self.skip_ws(pos)
+        if self.buf[pos : pos + 1] == self.p.cast("}"):
+            return spans, scalars, pos + 1
+        while True:
+            key, pos = self.read_key(pos)
+            pos = self.expect(self.skip_ws(pos), ":", "Expecting ':' delimiter")
+            start, end, kind, value = self.scan_value(self.skip_ws(pos))
+            spans[key] = (start, end, kind)
+            if kind in (KIND_DICT, KIND_LIST):
+                scalars.pop(key, None)  # 重复Key以最后一个为准
+            else:
+                scalars[key] = value
+            if end >= self.next_report:
+                self.checkpoint(end)
+            pos = self.skip_ws(end)
+            char = self.buf[pos : pos + 1]
+            if char == self.p.cast("}"):
+                return spans, scalars, pos + 1
+            pos = self.skip_ws(self.expect(pos, ",", "Expecting ',' delimiter"))
+
+
+def _index(buf, start, progress, cancel_event, owner=None, backend=None):
+    scanner = _Scanner(buf, start, progress, cancel_event)
+    first = scanner.skip_ws(start)
+    if buf[first : first + 1] != scanner.p.cast("{"):
+        # 根节点不是对象：没有可索引的顶层Key，直接完整解析
+        return (backend or json).loads(buf[start:])
+    spans, scalars, end = scanner.scan_object()
+    end = scanner.skip_ws(end)
+    if end != len(buf):
+        raise _error("Extra data", buf, end)
+    if progress is not None:
+        progress(len(buf), len(buf))
+    return LazyJsonObject(buf, spans, scalars, owner, backend)
+
+
+def index_text(text, progress=None, cancel_event=None, backend=None):
+    """为JSON文本建立顶层索引，参数同 parse_incremental"""
+    return _index(text, 0, progress, cancel_event, backend=backend)
+
+
+def index_file(path, progress=None, cancel_event=None, backend=None):
+    """内存映射JSON文件并建立顶层索引；映射一直保留到文档 close()"""
+    f = open(path, "rb")  # noqa: SIM115  由 LazyJsonObject.close() 关闭
+    try:
+        if f.seek(0, 2) == 0:
+            raise json.JSONDecodeError("Expecting value", "", 0)
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except BaseException:
+        f.close()
+        raise
+    start = 3 if mm[:3] == b"\xef\xbb\xbf" else 0  # 跳过UTF-8 BOM
+    try:
+        doc = _index(mm, start, progress, cancel_event, owner=(mm, f), backend=backend)
+    except BaseException:
+        mm.close()
+        f.close()
+        raise
+    if not isinstance(doc, LazyJsonObject):
+        mm.close()
+        f.close()
+    return doc
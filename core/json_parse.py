@@ -0,0 +1,180 @@
+"""JSON 增量解析（与界面无关，可在工作线程中调用）"""
+
+import json
+import mmap
+import re
+from json.decoder import scanstring
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_WS_CHARS = frozenset(" \t\n\r")
+_DECODER = json.JSONDecoder()
+
+# 每解析这么多字符回报一次进度并检查取消标记
+PROGRESS_STEP = 1 << 20
+
+
+class ParseCancelled(Exception):
+    """解析被用户取消"""
+
+
+def read_json_file(path) -> str:
+    """通过内存映射读取JSON文件，只在内存中生成一份解码后的文本
+
+    文件内容由操作系统按页映射，不会先读成一份 bytes 再解码。
+    """
+    with open(path, "rb") as f:
+        if f.seek(0, 2) == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            start = 3 if view[:3] == b"\xef\xbb\xbf" else 0  # 跳过UTF-8 BOM
+            return str(view[start:], "utf-8")
+
+
+def parse_file(path, progress=None, cancel_event=None, backend=None):
+    """读取并解析JSON文件，参数同 parse_incremental
+
+    后端支持 memoryview 时直接解析内存映射的缓冲区，不生成解码后的文本。
+    """
+    if backend is None or backend.is_stdlib or not backend.accepts_memoryview:
+        text = read_json_file(path)
+        return parse_incremental(text, progress=progress, cancel_event=cancel_event, backend=backend)
+    with open(path, "rb") as f:
+        if f.seek(0, 2) == 0:
+            raise json.JSONDecodeError("Expecting value", "", 0)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            start = 3 if view[:3] == b"\xef\xbb\xbf" else 0  # 跳过UTF-8 BOM
+            with view[start:] as body:
+                value = backend.loads(body)
+    if progress is not None:
+        progress(1, 1)
+    return value
+
+
+class _Cursor:
+    """解析游标：记录位置，按步长回报进度、检查取消"""
+
+    def __init__(self, text, progress, cancel_event):
+        self.text = text
+        self.total = len(text)
+        self.progress = progress
+        self.cancel_event = cancel_event
+        self.next_report = PROGRESS_STEP
+
+    def skip_ws(self, pos):
+        return _WHITESPACE.match(self.text, pos).end()
+
+    def checkpoint(self, pos):
+        if pos < self.next_report:
+            return
+        self.next_report = pos + PROGRESS_STEP
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise ParseCancelled()
+        if self.progress is not None:
+            self.progress(pos, self.total)
+
+
+def parse_incremental(text, progress=None, cancel_event=None, max_depth=2, backend=None):
+    """分段解析JSON文本（结果与 json.loads 一致），段间回报进度、响应取消
+
+    Args:
+        text: JSON文本
+        progress: 进度回调 progress(已解析字符数, 总字符数)
+        cancel_event: threading.Event，置位后抛出 ParseCancelled
+        max_depth: 逐成员解析的容器层数
+        backend: core.json_backends.JsonBackend；非标准库后端一次解析整个文本，
+            速度更快，但解析期间不回报进度、不响应取消
+    """
+    if backend is not None and not backend.is_stdlib:
+        value = backend.loads(text)
+        if progress is not None:
+            progress(len(text), len(text))
+        return value
+    cursor = _Cursor(text, progress, cancel_event)
+    pos = cursor.skip_ws(0)
+    value, pos = _parse_value(cursor, pos, max_depth)
+    pos = cursor.skip_ws(pos)
+    if pos != cursor.total:
+        raise json.JSONDecodeError("Extra data", text, pos)
+    if progress is not None:
+        progress(cursor.total, cursor.total)
+    return value
+
+
+def _parse_value(cursor, pos, depth):
+    text = cursor.text
+    char = text[pos : pos + 1]
+    if depth > 0 and char == "{":
+        return _parse_object(cursor, pos + 1, depth - 1)
+    if depth > 0 and char == "[":
+        return _parse_array(cursor, pos + 1, depth - 1)
+    return _DECODER.raw_decode(text, pos)
+
+
+def _parse_object(cursor, pos, depth):
+    text = cursor.text
+    result = {}
+    pos = cursor.skip_ws(pos)
+    if text[pos : pos + 1] == "}":
+        return result, pos + 1
+    while True:
+        if text[pos : pos + 1] != '"':
+            raise json.JSONDecodeError("Expecting property name enclosed in double quotes", text, pos)
+        key, pos = scanstring(text, pos + 1)
+        pos = cursor.skip_ws(pos)
+        if text[pos : pos + 1] != ":":
+            raise json.JSONDecodeError("Expecting ':' delimiter", text, pos)
+        pos = cursor.skip_ws(pos + 1)
+        result[key], pos = _parse_value(cursor, pos, depth)
+        cursor.checkpoint(pos)
+        pos = cursor.skip_ws(pos)
+        char = text[pos : pos + 1]
+        if char == "}":
+            return result, pos + 1
+        if char != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, pos)
+        pos = cursor.skip_ws(pos + 1)
+
+
+def _parse_array(cursor, pos, depth):
+    text = cursor.text
+    result = []
+    append = result.append
+    skip_ws = cursor.skip_ws
+    pos = skip_ws(pos)
+    if text[pos : pos + 1] == "]":
+        return result, pos + 1
+    if depth == 0:
+        # 热路径：元素直接交给C解析器，避免逐层函数调用
+        scan_once = _DECODER.scan_once
+        checkpoint = cursor.checkpoint
+        while True:
+            try:
+                value, pos = scan_once(text, pos)
+            except StopIteration as err:
+                raise json.JSONDecodeError("Expecting value", text, err.value) from None
+            append(value)
+            if pos >= cursor.next_report:
+                checkpoint(pos)
+            char = text[pos : pos + 1]
+            if char in _WS_CHARS:
+                pos = skip_ws(pos)
+                char = text[pos : pos + 1]
+            if char == ",":
+                pos += 1
+                if text[pos : pos + 1] in _WS_CHARS:
+                    pos = skip_ws(pos)
+                continue
+            if char == "]":
+                return result, pos + 1
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, pos)
+    while True:
+        value, pos = _parse_value(cursor, pos, depth)
+        append(value)
+        cursor.checkpoint(pos)
+        pos = skip_ws(pos)
+        char = text[pos : pos + 1]
+        if char == "]":
+            return result, pos + 1
+        if char != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, pos)
+        pos = skip_ws(pos + 1)
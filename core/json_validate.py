@@ -0,0 +1,175 @@
+"""JSON 语法校验（与界面无关，可在工作线程中调用）
+
+前 max_depth 层容器逐个成员检查（更深的值交给C解析器一次完成），
+并在这些层的逗号之后记录"检查点"：(行号, 列号, 容器栈)。
+检查点之前的文本都已确认合法，编辑发生在检查点所在行之后时，
+下次校验只需要从该检查点开始的文本。
+"""
+
+import json
+import re
+import threading
+from bisect import bisect_left
+from json.decoder import scanstring
+
+from core.json_parse import ParseCancelled
+
+CHECKPOINT_CHARS = 64 * 1024  # 相邻检查点之间至少间隔的字符数
+_CLOSERS = {"{": "}", "[": "]"}
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+# 容器栈中的下一步
+_VALUE = 0  # 期待一个值
+_FIRST = 1  # 刚读过开括号：期待第一个成员或闭括号
+_MEMBER = 2  # 刚读过逗号：期待下一个成员
+_AFTER = 3  # 刚读完一个值：期待逗号、闭括号或文本结束
+
+
+class ValidationResult:
+    """一次校验的结果
+
+    Attributes:
+        error: 错误信息，合法时为 None
+        lineno / colno: 出错的行号与列号（均从1开始，相对整个文档）
+        resumed_line: 本次校验从第几行继续（1 表示从头校验）
+    """
+
+    def __init__(self, error=None, lineno=0, colno=0, resumed_line=1):
+        self.error = error
+        self.lineno = lineno
+        self.colno = colno
+        self.resumed_line = resumed_line
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class ResumePoint:
+    """续验的起点：文档的 lineno 行 col 列（行号从1、列号从0开始）及当时的容器栈"""
+
+    def __init__(self, version, lineno=1, col=0, stack=()):
+        self.version = version  # 取起点时的编辑版本，校验期间又有编辑时结果作废
+        self.lineno = lineno
+        self.col = col
+        self.stack = stack
+
+    @property
+    def index(self) -> str:
+        """Tk 文本索引，如 "12.0" """
+        return f"{self.lineno}.{self.col}"
+
+
+class JsonValidator:
+    """可续验的校验器：编辑后调用 edited，校验时从 resume_point 之后的文本继续
+
+    Args:
+        max_depth: 逐成员检查（并记录检查点）的容器层数
+    """
+
+    def __init__(self, max_depth=2):
+        self.max_depth = max_depth
+        self._lock = threading.Lock()  # 只保护检查点与版本号，不在校验期间持有
+        self._version = 0
+        self._checkpoints = []  # [(行号, 列号, 容器栈)]，按位置升序
+
+    def edited(self, lineno):
+        """lineno 行（及之后）被修改：丢弃该行及之后的检查点"""
+        with self._lock:
+            self._version += 1
+            keep = bisect_left(self._checkpoints, lineno, key=lambda checkpoint: checkpoint[0])
+            del self._checkpoints[keep:]
+
+    def resume_point(self) -> ResumePoint:
+        """最近的检查点（没有时为文档开头）"""
+        with self._lock:
+            if not self._checkpoints:
+                return ResumePoint(self._version)
+            return ResumePoint(self._version, *self._checkpoints[-1])
+
+    def validate(self, text, start=None, cancel_event=None) -> ValidationResult:
+        """校验从 start 开始的文本 text（start 为 None 时 text 是整个文档）
+
+        Raises:
+            ParseCancelled: cancel_event 已置位
+        """
+        if start is None:
+            start = ResumePoint(self._version)
+        checkpoints = []
+        try:
+            self._scan(text, start, checkpoints, cancel_event)
+        except json.JSONDecodeError as e:
+            colno = e.colno + start.col if e.lineno == 1 else e.colno
+            result = ValidationResult(e.msg, start.lineno + e.lineno - 1, colno, start.lineno)
+        else:
+            result = ValidationResult(resumed_line=start.lineno)
+        with self._lock:
+            if start.version == self._version:
+                self._checkpoints.extend(checkpoints)
+        return result
+
+    def _scan(self, text, start, checkpoints, cancel_event):
+        """从 start 开始检查到文本结束，途中追加检查点（行列号相对整个文档）"""
+        skip_ws = _WHITESPACE.match
+        stack = start.stack
+        state = _MEMBER if stack else _VALUE
+        pos = 0
+        next_checkpoint = CHECKPOINT_CHARS
+        # 检查点的行列号：已数过换行的位置、当前行号、当前行开头（相对 text，可为负）
+        counted, lineno, line_start = 0, start.lineno, -start.col
+        if cancel_event is not None and cancel_event.is_set():
+            raise ParseCancelled()
+        while True:
+            pos = skip_ws(text, pos).end()
+            char = text[pos : pos + 1]
+            if state == _FIRST:
+                if char == _CLOSERS[stack[-1]]:
+                    stack = stack[:-1]
+                    pos += 1
+                    state = _AFTER
+                    continue
+                state = _MEMBER
+            if state == _MEMBER:
+                if stack[-1] == "{":
+                    if char != '"':
+                        raise json.JSONDecodeError("Expecting property name enclosed in double quotes", text, pos)
+                    _key, pos = scanstring(text, pos + 1)
+                    pos = skip_ws(text, pos).end()
+                    if text[pos : pos + 1] != ":":
+                        raise json.JSONDecodeError("Expecting ':' delimiter", text, pos)
+                    pos = skip_ws(text, pos + 1).end()
+                    char = text[pos : pos + 1]
+                state = _VALUE
+            if state == _VALUE:
+                if char in _CLOSERS and len(stack) < self.max_depth:
+                    stack += (char,)
+                    pos += 1
+                    state = _FIRST
+                    continue
+                _value, pos = _DECODER.raw_decode(text, pos)
+                state = _AFTER
+                continue
+            # _AFTER
+            if not stack:
+                if pos != len(text):
+                    raise json.JSONDecodeError("Extra data", text, pos)
+                return
+            if char == ",":
+                pos += 1
+                state = _MEMBER
+                if cancel_event is not None and cancel_event.is_set():
+                    raise ParseCancelled()
+                if pos >= next_checkpoint:
+                    newlines = text.count("\n", counted, pos)
+                    if newlines:
+                        lineno += newlines
+                        line_start = text.rfind("\n", counted, pos) + 1
+                    counted = pos
+                    checkpoints.append((lineno, pos - line_start, stack))
+                    next_checkpoint = pos + CHECKPOINT_CHARS
+            elif char == _CLOSERS[stack[-1]]:
+                stack = stack[:-1]
+                pos += 1
+            else:
+                raise json.JSONDecodeError("Expecting ',' delimiter", text, pos)
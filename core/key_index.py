@@ -0,0 +1,79 @@
+"""Key检索索引：解析时建好，筛选时不再逐个扫描Key
+
+- 前缀：按小写排序的数组 + 二分查找
+- 子串：3-gram 倒排表。每个起始位置取一个 3-gram（末尾用 \\0 补齐），
+  长查询取各 3-gram 倒排表的交集后再核对；1~3 个字符的查询在排好序的
+  n-gram 表中二分出以它开头的 n-gram，合并它们的倒排表即可，无需核对。
+"""
+
+from bisect import bisect_left, bisect_right
+
+NGRAM = 3
+PREFIX_MARK = "^"  # 以此开头的查询按前缀匹配
+
+_PAD = "\0" * (NGRAM - 1)
+_MAX_CHAR = chr(0x10FFFF)
+
+
+def _prefix_range(sorted_items, prefix):
+    """有序列表中以 prefix 开头的元素的下标区间"""
+    lo = bisect_left(sorted_items, prefix)
+    return lo, bisect_right(sorted_items, prefix + _MAX_CHAR, lo)
+
+
+class KeyIndex:
+    """一组Key的检索索引（不区分大小写）"""
+
+    def __init__(self, keys):
+        self.keys = list(keys)
+        self._folded = [key.casefold() for key in self.keys]
+
+        # 前缀：排序后的小写Key，以及它们在 keys 中的下标
+        self._sorted_ids = sorted(range(len(self._folded)), key=self._folded.__getitem__)
+        self._sorted = [self._folded[i] for i in self._sorted_ids]
+
+        # 子串：3-gram -> 包含它的Key下标（升序）
+        postings = {}
+        for i, text in enumerate(self._folded):
+            padded = text + _PAD
+            for gram in set(map("".join, zip(padded, padded[1:], padded[2:]))):
+                if gram in postings:
+                    postings[gram].append(i)
+                else:
+                    postings[gram] = [i]
+        self._postings = postings
+        self._grams = sorted(postings)
+
+    def prefix(self, query) -> list:
+        """以 query 开头的Key下标"""
+        lo, hi = _prefix_range(self._sorted, query.casefold())
+        return self._sorted_ids[lo:hi]
+
+    def substring(self, query):
+        """包含 query 的Key下标（可迭代对象，无序）"""
+        query = query.casefold()
+        if len(query) <= NGRAM:
+            lo, hi = _prefix_range(self._grams, query)
+            if hi - lo == 1:
+                return self._postings[self._grams[lo]]
+            return set().union(*map(self._postings.__getitem__, self._grams[lo:hi]))
+        postings = sorted(
+            (self._postings.get(query[j : j + NGRAM], ()) for j in range(len(query) - NGRAM + 1)), key=len
+        )
+        candidates = set(postings[0]).intersection(*postings[1:])
+        return [i for i in candidates if query in self._folded[i]]
+
+    def search(self, query):
+        """按查询筛选，返回匹配的Key集合；空查询返回 None（不筛选）
+
+        以 "^" 开头时按前缀匹配，否则按子串匹配。
+        """
+        query = query.strip()
+        if query.startswith(PREFIX_MARK):
+            query = query[len(PREFIX_MARK) :]
+            ids = self.prefix(query) if query else None
+        else:
+            ids = self.substring(query) if query else None
+        if ids is None:
+            return None
+        return set(map(self.keys.__getitem__, ids))
@@ -0,0 +1,168 @@
+"""多层列表导航：沿 orders[*].items[*] 形式的路径逐层进入列表
+
+每个访问过的节点缓存其记录和推断的结构（Key集合、类型），
+在面包屑中前进 / 后退只是查表，不会重新扫描数据。
+"""
+
+from itertools import chain
+
+from core.columnar import ColumnStore
+from core.json_lazy import KIND_LIST, LazyJsonObject, value_kind
+from core.key_index import KeyIndex
+from core.paths import compile_path
+from core.schema import infer_schema
+from core.sorting import KeySorter, root_size, root_type
+
+LIST_TAG = " [LIST]"  # 列表类型Key的显示标记
+
+
+def format_node_path(path) -> str:
+    """节点路径的显示文本，如 ("orders", "items") -> "orders[*].items[*]" """
+    return ".".join(f"{key}[*]" for key in path)
+
+
+def parse_node_path(text: str) -> tuple:
+    """format_node_path 的逆操作，也接受省略 [*] 的单个Key，如 "authors" -> ("authors",)
+
+    Raises:
+        ValueError: 路径为空
+    """
+    text = text.strip()
+    if text.endswith("[*]"):
+        text = text[:-3]
+    if not text:
+        raise ValueError("列表路径不能为空")
+    return tuple(text.split("[*]."))
+
+
+def strip_list_tag(label: str) -> str:
+    """去掉显示文本中的列表标记，得到Key（或路径）"""
+    return label[: -len(LIST_TAG)] if label.endswith(LIST_TAG) else label
+
+
+class ListNode:
+    """路径上的一个列表节点：展开后的全部记录及其结构"""
+
+    def __init__(self, path, records, schema, progress=None, cancel_event=None):
+        self.path = path  # Key（路径字符串）元组，每一步都展开一层列表
+        self.records = records
+        self.schema = schema
+        # 显示文本在构建节点时一次算好，刷新 / 排序时直接查表
+        self.labels = {key: key + LIST_TAG if self.is_list(key) else key for key in schema.keys}
+        self.index = KeyIndex(schema.keys)  # 筛选框用的检索索引
+        self.order = list(schema.keys)  # 当前显示顺序（排序 / 拖动后保留，返回该节点时不变）
+        fields = schema.fields
+        self.sorter = KeySorter(lambda key: fields[key].main_type, lambda key: fields[key].present)
+        # 列式存储：导出 / 预览 / 统计都按列读取
+        self.store = ColumnStore(records, schema.keys, progress, cancel_event)
+
+    @property
+    def key(self) -> str:
+        """最后一步的Key（用作工作表名 / 默认文件名）"""
+        return self.path[-1]
+
+    @property
+    def title(self) -> str:
+        return format_node_path(self.path)
+
+    @property
+    def keys(self) -> list:
+        return self.schema.keys
+
+    @property
+    def flattened(self) -> bool:
+        return self.schema.flattened
+
+    def is_list(self, key) -> bool:
+        """该字段的主要类型是否为列表（可以继续进入）"""
+        stats = self.schema.fields.get(key)
+        return stats is not None and stats.main_type == "list"
+
+    def label(self, key) -> str:
+        return self.labels[key]
+
+
+class PathNavigator:
+    """记录当前路径并缓存已访问节点
+
+    build 可在工作线程中调用（只读缓存）；remember / 路径切换在主线程调用。
+    """
+
+    def __init__(self, doc):
+        self.doc = doc  # dict 或 LazyJsonObject
+        self.path = ()  # 当前路径，() 表示根节点（主Key列表）
+        self._records = {}  # 路径 -> 展开后的记录列表（与是否展开嵌套无关）
+        self._nodes = {}  # (路径, 是否展开嵌套) -> ListNode
+        self._root_labels = None
+        self._root_index = None
+        self.root_sorter = KeySorter(lambda key: root_type(doc, key), lambda key: root_size(doc, key))
+
+    @property
+    def root_labels(self) -> dict:
+        """根节点各Key的显示文本（列表类型加标记），每次解析只计算一次"""
+        if self._root_labels is None:
+            self._root_labels = {
+                key: key + LIST_TAG if value_kind(self.doc, key) == KIND_LIST else key for key in self.doc.keys()
+            }
+        return self._root_labels
+
+    @property
+    def root_index(self) -> KeyIndex:
+        """根节点Key的检索索引"""
+        if self._root_index is None:
+            self._root_index = KeyIndex(self.doc.keys())
+        return self._root_index
+
+    def fresh(self):
+        """同一文档的新导航器：只共享根节点的显示文本与检索索引（只读）"""
+        navigator = PathNavigator(self.doc)
+        navigator._root_labels = self.root_labels
+        navigator._root_index = self.root_index
+        return navigator
+
+    def __getstate__(self):
+        """pickle 时只保存文档与根节点的派生数据（排序器含闭包，节点缓存可以重建）"""
+        return {"doc": self.doc, "root_labels": self._root_labels, "root_index": self._root_index}
+
+    def __setstate__(self, state):
+        self.__init__(state["doc"])
+        self._root_labels = state["root_labels"]
+        self._root_index = state["root_index"]
+
+    def prepare(self):
+        """预先计算根节点的显示文本和检索索引（在解析的工作线程中调用）"""
+        self.root_labels
+        self.root_index
+        return self
+
+    def is_root_list(self, key) -> bool:
+        """根节点的Key是否为列表"""
+        return self.root_labels.get(key, key) != key
+
+    def node(self, path, flatten):
+        """已缓存的节点，未访问过时返回 None"""
+        return self._nodes.get((path, flatten))
+
+    def records(self, path, progress=None, cancel_event=None) -> list:
+        """路径对应的记录：根Key直接取列表，之后每一步把各记录中该字段的列表相接"""
+        cached = self._records.get(path)
+        if cached is not None:
+            return cached
+        if len(path) == 1:
+            if isinstance(self.doc, LazyJsonObject):
+                return self.doc.load(path[0], progress=progress, cancel_event=cancel_event)
+            return self.doc[path[0]]
+        parent = self.records(path[:-1], progress, cancel_event)
+        get = compile_path(path[-1], None)
+        values = map(get, (item for item in parent if type(item) is dict))
+        return list(chain.from_iterable(value for value in values if type(value) is list))
+
+    def build(self, path, flatten, progress=None, cancel_event=None) -> ListNode:
+        """取得记录并推断结构（耗时操作，可在工作线程中调用）"""
+        records = self.records(path, progress, cancel_event)
+        schema = infer_schema(records, progress=progress, cancel_event=cancel_event, flatten=flatten)
+        return ListNode(path, records, schema, progress, cancel_event)
+
+    def remember(self, node: ListNode):
+        self._records[node.path] = node.records
+        self._nodes[(node.path, node.flattened)] = node
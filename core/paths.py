@@ -0,0 +1,111 @@
+"""嵌套路径：address.city、tags[0] 形式的列路径解析、编译与记录展开"""
+
+import json
+import re
+from operator import methodcaller
+
+# 展开嵌套记录时的默认限制
+FLATTEN_MAX_DEPTH = 4  # 最多展开的层数
+FLATTEN_MAX_LIST_ITEMS = 5  # 每个列表最多展开的元素个数
+
+_PLAIN_KEY = re.compile(r"[^.\[\]\"]+")
+_STEP = re.compile(r'\.?([^.\[\]"]+)|\[(\d+)\]|\[("(?:[^"\\]|\\.)*")\]')
+
+
+def format_path(steps) -> str:
+    """把路径步骤格式化为路径字符串：根层Key原样返回，嵌套路径中的特殊Key写成 ["a.b"]"""
+    if len(steps) == 1 and isinstance(steps[0], str):
+        return steps[0]
+    parts = []
+    for step in steps:
+        if isinstance(step, int):
+            parts.append(f"[{step}]")
+        elif _PLAIN_KEY.fullmatch(step):
+            parts.append(f".{step}" if parts else step)
+        else:
+            parts.append(f"[{json.dumps(step, ensure_ascii=False)}]")
+    return "".join(parts)
+
+
+def parse_path(path: str) -> tuple:
+    """解析路径字符串为步骤元组，如 "orders[0].id" -> ("orders", 0, "id")
+
+    Raises:
+        ValueError: 路径格式错误
+    """
+    steps = []
+    pos = 0
+    while pos < len(path):
+        match = _STEP.match(path, pos)
+        # 第一个Key前不能有"."，之后的Key前必须有"."
+        if match is None or (match.group(1) is not None and (path[pos] == ".") != bool(steps)):
+            raise ValueError(f"无效的路径：{path!r}（位置 {pos}）")
+        key, index, quoted = match.groups()
+        if key is not None:
+            steps.append(key)
+        elif index is not None:
+            steps.append(int(index))
+        else:
+            steps.append(json.loads(quoted))
+        pos = match.end()
+    if not steps:
+        raise ValueError("路径不能为空")
+    return tuple(steps)
+
+
+def compile_path(path: str, default=""):
+    """把路径编译为取值函数 accessor(record)，缺失时返回 default（优先作根层Key）"""
+    try:
+        steps = parse_path(path)
+    except ValueError:
+        steps = (path,)
+    if len(steps) == 1 and isinstance(steps[0], str):
+        return methodcaller("get", steps[0], default)
+
+    def accessor(record):
+        if type(record) is dict and path in record:
+            return record[path]
+        value = record
+        for step in steps:
+            if isinstance(step, int):
+                if type(value) is not list or step >= len(value):
+                    return default
+                value = value[step]
+            else:
+                if type(value) is not dict:
+                    return default
+                value = value.get(step, default)
+                if value is default:
+                    return default
+        return value
+
+    return accessor
+
+
+def flatten_record(record, max_depth=FLATTEN_MAX_DEPTH, max_list_items=FLATTEN_MAX_LIST_ITEMS) -> dict:
+    """把嵌套记录展开为 {路径: 叶子值}
+
+    dict 逐层展开；list 展开前 max_list_items 个元素；超过 max_depth 层或
+    空容器原样作为叶子值。
+    """
+    flat = {}
+
+    def walk(value, steps, depth):
+        if depth < max_depth and value:
+            if type(value) is dict:
+                for key, child in value.items():
+                    walk(child, (*steps, key), depth + 1)
+                return
+            if type(value) is list:
+                for index, child in enumerate(value[:max_list_items]):
+                    walk(child, (*steps, index), depth + 1)
+                return
+        path = format_path(steps)
+        if len(steps) > 1 and path in record:
+            # 与根层Key同名（如根层的 "a.b" 与 a 下的 b）：每一步都加引号，两列都保留
+            path = "".join(f"[{json.dumps(step, ensure_ascii=False)}]" for step in steps)
+        flat[path] = value
+
+    for key, value in record.items():
+        walk(value, (key,), 1)
+    return flat
@@ -0,0 +1,141 @@
+"""列表结构推断：扫描全部（或抽样的）记录，统计每个Key的出现率、空值数与类型分布"""
+
+from collections import Counter
+from itertools import chain
+from operator import methodcaller
+
+from core.json_parse import ParseCancelled
+from core.paths import flatten_record, format_path
+
+# 记录数超过该值时等间隔抽样
+SCHEMA_SAMPLE_LIMIT = 200_000
+
+# 每处理这么多条记录回报一次进度并检查取消标记
+SCHEMA_CHUNK = 20_000
+
+# Python类型 -> JSON类型名
+TYPE_NAMES = {
+    str: "str",
+    int: "int",
+    float: "float",
+    bool: "bool",
+    type(None): "null",
+    dict: "dict",
+    list: "list",
+}
+
+
+class FieldStats:
+    """单个Key的统计"""
+
+    def __init__(self, key, scanned):
+        self.key = key
+        self.scanned = scanned  # 参与统计的记录数
+        self.present = 0  # 出现次数
+        self.types = Counter()  # JSON类型名 -> 次数
+
+    @property
+    def nulls(self) -> int:
+        return self.types["null"]
+
+    @property
+    def presence_ratio(self) -> float:
+        return self.present / self.scanned if self.scanned else 0.0
+
+    @property
+    def main_type(self) -> str:
+        """出现最多的非空类型（全为空时为 "null"）"""
+        for name, _count in self.types.most_common():
+            if name != "null":
+                return name
+        return "null"
+
+    def __repr__(self):
+        return f"FieldStats({self.key!r}, present={self.present}, types={dict(self.types)})"
+
+
+class ListSchema:
+    """列表的推断结构，fields 按Key首次出现的顺序排列
+
+    Key 均为路径字符串（见 core.paths），可直接交给 compile_path 取值。
+    """
+
+    def __init__(self, fields, total, scanned, dict_count, flattened=False):
+        self.fields = fields  # 路径 -> FieldStats
+        self.total = total  # 列表总长度
+        self.scanned = scanned  # 参与统计的元素数
+        self.dict_count = dict_count  # 参与统计的元素中字典的个数
+        self.flattened = flattened  # 是否按叶子路径展开了嵌套记录
+
+    @property
+    def keys(self) -> list:
+        return list(self.fields)
+
+    @property
+    def sampled(self) -> bool:
+        return self.scanned < self.total
+
+    def summary(self) -> str:
+        """一行中文摘要，用于信息栏"""
+        text = f"{self.total} 条记录，{len(self.fields)} 个字段"
+        if self.sampled:
+            text += f"（抽样 {self.scanned} 条）"
+        partial = sum(1 for stats in self.fields.values() if stats.present < self.dict_count)
+        if partial:
+            text += f"，{partial} 个字段非每条都有"
+        return text
+
+
+class _Missing:
+    """记录中缺少该Key时的占位类型"""
+
+
+_MISSING = _Missing()
+
+
+def _sample(records, sample_limit):
+    if sample_limit is None or len(records) <= sample_limit:
+        return records
+    step = -(-len(records) // sample_limit)  # 向上取整，保证不超过上限
+    return records[::step]
+
+
+def infer_schema(
+    records, sample_limit=SCHEMA_SAMPLE_LIMIT, progress=None, cancel_event=None, flatten=False
+) -> ListSchema:
+    """推断 list[dict] 的结构（Key取所有记录的并集，按块统计类型）
+
+    Args:
+        records: 列表数据
+        sample_limit: 超过该长度时等间隔抽样；None 表示全部扫描
+        progress: 进度回调 progress(已处理条数, 总条数)
+        cancel_event: threading.Event，置位后抛出 ParseCancelled
+        flatten: True 时先把每条记录展开为叶子路径（address.city、tags[0]）再统计
+    """
+    sample = _sample(records, sample_limit)
+    type_counts = {}  # key -> Counter(类型 -> 次数)，按Key首次出现的顺序
+    dict_count = 0
+    for start in range(0, len(sample), SCHEMA_CHUNK):
+        if cancel_event is not None and cancel_event.is_set():
+            raise ParseCancelled()
+        dicts = [item for item in sample[start : start + SCHEMA_CHUNK] if isinstance(item, dict)]
+        if flatten:
+            dicts = [flatten_record(item) for item in dicts]
+        dict_count += len(dicts)
+        for key in dict.fromkeys(chain.from_iterable(dicts)):
+            if key not in type_counts:
+                type_counts[key] = Counter()
+        for key, counts in type_counts.items():
+            counts.update(map(type, map(methodcaller("get", key, _MISSING), dicts)))
+        if progress is not None:
+            progress(min(start + SCHEMA_CHUNK, len(sample)), len(sample))
+
+    fields = {}
+    for key, counts in type_counts.items():
+        path = key if flatten else format_path((key,))
+        stats = fields[path] = FieldStats(path, dict_count)
+        for value_type, count in counts.items():
+            if value_type is not _Missing:
+                stats.present += count
+                stats.types[TYPE_NAMES.get(value_type, value_type.__name__)] += count
+    return ListSchema(fields, len(records), len(sample), dict_count, flatten)
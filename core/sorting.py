@@ -0,0 +1,103 @@
+"""Key排序：字母 / 自然 / 类型 / 大小 / 拼音
+
+每种模式的排序键在第一次使用时为整组Key算好并缓存；
+同一模式下切换升序 / 降序只反转列表，已是目标顺序时不做任何事。
+"""
+
+import re
+
+from core.json_lazy import LazyJsonObject
+from core.schema import TYPE_NAMES
+
+SORT_PLAIN = "字母"
+SORT_NATURAL = "自然"
+SORT_TYPE = "类型"
+SORT_SIZE = "大小"
+SORT_PINYIN = "拼音"
+SORT_MODES = (SORT_PLAIN, SORT_NATURAL, SORT_TYPE, SORT_SIZE, SORT_PINYIN)
+
+# 按类型排序时的先后顺序（流式索引中未解析的数字 / 布尔 / null 记为 scalar）
+TYPE_ORDER = {"dict": 0, "list": 1, "str": 2, "int": 3, "float": 4, "scalar": 5, "bool": 6, "null": 7}
+
+_DIGITS = re.compile(r"(\d+)")
+
+
+def natural_key(text: str) -> tuple:
+    """自然排序键："item2" < "item10"，不区分大小写"""
+    parts = _DIGITS.split(text.casefold())
+    # split 的结果中奇数位置一定是数字串，同一位置的类型总是一致，可以直接比较
+    parts[1::2] = map(int, parts[1::2])
+    return tuple(parts)
+
+
+def _pinyin_converter():
+    try:
+        from pypinyin import lazy_pinyin
+    except ImportError:
+        raise ImportError("拼音排序需要安装 pypinyin") from None
+    return lazy_pinyin
+
+
+def root_type(doc, key) -> str:
+    """顶层值的类型名（流式索引中未解析的值不触发解析）"""
+    if isinstance(doc, LazyJsonObject) and not doc.is_materialized(key):
+        return doc.kind(key)
+    value = doc[key]
+    return TYPE_NAMES.get(type(value), type(value).__name__)
+
+
+def root_size(doc, key) -> int:
+    """顶层值的大小：列表 / 对象的元素个数；流式索引中为源文本长度（不触发解析）"""
+    if isinstance(doc, LazyJsonObject):
+        return doc.span_size(key)
+    value = doc[key]
+    return len(value) if isinstance(value, (dict, list)) else 0
+
+
+class KeySorter:
+    """一组Key的排序器
+
+    Args:
+        type_of: key -> 类型名
+        size_of: key -> 大小（列表长度 / 子树大小 / 出现次数）
+    """
+
+    def __init__(self, type_of, size_of):
+        self.type_of = type_of
+        self.size_of = size_of
+        self._tables = {}  # 模式 -> {key: 排序键}
+        self.state = None  # 当前顺序对应的 (模式, 是否降序)；手动拖动后为 None
+
+    def _table(self, mode, keys) -> dict:
+        table = self._tables.get(mode)
+        if table is None:
+            if mode == SORT_PLAIN:
+                table = dict(zip(keys, keys))
+            elif mode == SORT_NATURAL:
+                table = dict(zip(keys, map(natural_key, keys)))
+            elif mode == SORT_TYPE:
+                table = {key: (TYPE_ORDER.get(self.type_of(key), len(TYPE_ORDER)), natural_key(key)) for key in keys}
+            elif mode == SORT_SIZE:
+                table = {key: (self.size_of(key), natural_key(key)) for key in keys}
+            elif mode == SORT_PINYIN:
+                to_pinyin = _pinyin_converter()
+                table = {key: (tuple(to_pinyin(key.casefold())), key) for key in keys}
+            else:
+                raise ValueError(f"未知的排序方式：{mode}")
+            self._tables[mode] = table
+        return table
+
+    def sort(self, keys, mode, reverse=False) -> bool:
+        """原地排序 keys；已是目标顺序时返回 False"""
+        if self.state == (mode, reverse):
+            return False
+        if self.state == (mode, not reverse):
+            keys.reverse()
+        else:
+            keys.sort(key=self._table(mode, keys).__getitem__, reverse=reverse)
+        self.state = (mode, reverse)
+        return True
+
+    def invalidate(self):
+        """顺序被手动改变（拖动）后调用，下次排序重新按排序键排序"""
+        self.state = None
@@ -6,6 +6,76 @@ import customtkinter as ctk
 ctk.set_appearance_mode("light")
 ctk.set_default_color_theme("blue")
 
+FRAME_MS = 16  # 拖拽时每帧（约60fps）最多移动一次影子
+GHOST_FILL = "#5a9bd5"  # 影子颜色
+GHOST_BORDER = "#1f6aa5"
+HOVER_COLOR = "#cfe3f7"  # 鼠标所在的可放置容器的高亮背景
+GRID_CELL = 64  # 空间索引的网格边长（像素）
+
+
+class DropTargetIndex:
+    """可放置容器的空间索引：缓存容器矩形并按网格查找，<Configure> 时失效重建"""
+
+    def __init__(self, root, cell=GRID_CELL):
+        self.root = root
+        self.cell = cell
+        self.targets = []
+        self._watched = set()  # 容器及其祖先控件的路径名，它们变化时索引失效
+        self._origin = (0, 0)  # 主窗口客户区左上角的屏幕坐标
+        self._rects = None  # [(x1, y1, x2, y2, 容器)]，相对主窗口；None 表示需要重建
+        self._grid = {}  # (列, 行) -> 与该网格相交的矩形下标
+        # <Configure> 会沿 bindtags 传到顶层窗口，在这里统一过滤
+        root.bind("<Configure>", self._on_configure, add="+")
+
+    def register(self, container):
+        """登记一个可放置的容器"""
+        self.targets.append(container)
+        widget = container
+        while widget is not None:
+            self._watched.add(str(widget))
+            widget = widget.master
+        self._rects = None
+
+    def _on_configure(self, event):
+        if str(event.widget) in self._watched:
+            self._rects = None
+
+    def _rebuild(self):
+        ox, oy = self.root.winfo_rootx(), self.root.winfo_rooty()
+        self._origin = (ox, oy)
+        self._rects = []
+        self._grid = {}
+        for container in self.targets:
+            if not container.winfo_ismapped():
+                continue
+            x1, y1 = container.winfo_rootx() - ox, container.winfo_rooty() - oy
+            x2, y2 = x1 + container.winfo_width(), y1 + container.winfo_height()
+            index = len(self._rects)
+            self._rects.append((x1, y1, x2, y2, container))
+            for col in range(x1 // self.cell, x2 // self.cell + 1):
+                for row in range(y1 // self.cell, y2 // self.cell + 1):
+                    self._grid.setdefault((col, row), []).append(index)
+
+    def origin(self):
+        """主窗口客户区左上角的屏幕坐标（缓存值，窗口移动后 <Configure> 时刷新）"""
+        if self._rects is None:
+            self._rebuild()
+        return self._origin
+
+    def hit(self, x_root, y_root):
+        """屏幕坐标所在的容器（嵌套时取最内层），不在任何容器内时返回 None"""
+        if self._rects is None:
+            self._rebuild()
+        x, y = x_root - self._origin[0], y_root - self._origin[1]
+        best, best_area = None, None
+        for index in self._grid.get((x // self.cell, y // self.cell), ()):
+            x1, y1, x2, y2, container = self._rects[index]
+            if x1 < x < x2 and y1 < y < y2:
+                area = (x2 - x1) * (y2 - y1)
+                if best is None or area < best_area:
+                    best, best_area = container, area
+        return best
+
 
 class DraggableWidgetApp(ctk.CTk):
     def __init__(self):
@@ -14,31 +84,40 @@ class DraggableWidgetApp(ctk.CTk):
         self.geometry("800x500")
 
         # 拖拽相关变量
-        self.dragged_widget = None  # 当前被拖拽的控件
+        self.dragged_widget = None  # 当前被拖拽的控件（拖拽期间保持原样，不销毁）
         self.start_x = 0  # 鼠标相对于控件的x偏移
         self.start_y = 0  # 鼠标相对于控件的y偏移
         self.start_container = None  # 起始容器
-        self.widget_text = ""  # 被拖拽控件的文本
         self.is_dragging = False  # 拖拽状态标记（屏蔽hover事件）
+        self.ghost = None  # 跟随鼠标移动的画布"影子"
+        self.pointer = None  # 最近一次鼠标位置（屏幕坐标），每帧最多处理一次
+        self.motion_pending = False
+        self.drop_index = DropTargetIndex(self)  # 可放置容器的空间索引
+        self.hover_target = None  # 当前高亮的容器
+        self.hover_restore_color = None  # 高亮前的背景色
 
         # 创建主布局
         self._create_main_layout()
 
     def _create_main_layout(self):
-        """创建主界面布局：左侧源容器，右侧目标容器"""
-        main_frame = ctk.CTkFrame(self)
-        main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        """创建主布局：左侧源容器，右侧目标容器（按钮用 pack(in_=容器) 放入）"""
+        self.main_frame = ctk.CTkFrame(self)
+        self.main_frame.pack(fill="both", expand=True, padx=20, pady=20)
 
         # 左侧源容器
-        self.source_frame = ctk.CTkFrame(main_frame, width=350, height=400, fg_color="#f0f0f0")
+        self.source_frame = ctk.CTkFrame(self.main_frame, width=350, height=400, fg_color="#f0f0f0")
         self.source_frame.pack(side="left", fill="both", expand=True, padx=10, pady=10)
         ctk.CTkLabel(self.source_frame, text="源容器（可拖拽控件到右侧）", text_color="#333").pack(pady=10)
 
         # 右侧目标容器
-        self.target_frame = ctk.CTkFrame(main_frame, width=350, height=400, fg_color="#e8e8e8")
+        self.target_frame = ctk.CTkFrame(self.main_frame, width=350, height=400, fg_color="#e8e8e8")
         self.target_frame.pack(side="right", fill="both", expand=True, padx=10, pady=10)
         ctk.CTkLabel(self.target_frame, text="目标容器（接收拖拽的控件）", text_color="#333").pack(pady=10)
 
+        # 可放置的容器
+        for container in (self.source_frame, self.target_frame):
+            self.drop_index.register(container)
+
         # 创建可拖拽控件
         self._create_draggable_widgets()
 
@@ -49,114 +128,113 @@ class DraggableWidgetApp(ctk.CTk):
         # 可拖拽按钮2
         self._create_safe_draggable_btn("可拖拽按钮2", self.source_frame)
 
-    def _create_safe_draggable_btn(self, text, parent):
-        """创建安全的可拖拽按钮（屏蔽销毁后的hover事件）"""
-
-        # 创建自定义按钮，重写hover事件避免报错
-        class SafeCTkButton(ctk.CTkButton):
-            def __init__(self, master, text, app_ref):
-                super().__init__(master, text=text, width=200, height=50)
-                self.app_ref = app_ref  # 引用主应用，判断拖拽状态
-                self.is_destroyed = False  # 标记是否已销毁
-
-            def _on_enter(self, event=None):
-                """重写hover进入事件：仅在非拖拽/未销毁时执行"""
-                if not self.app_ref.is_dragging and not self.is_destroyed:
-                    try:
-                        super()._on_enter(event)
-                    except tk.TclError:
-                        pass
-
-            def _on_leave(self, event=None):
-                """重写hover离开事件：仅在非拖拽/未销毁时执行"""
-                if not self.app_ref.is_dragging and not self.is_destroyed:
-                    try:
-                        super()._on_leave(event)
-                    except tk.TclError:
-                        pass
-
-            def destroy(self):
-                """重写销毁方法：标记状态，避免后续事件报错"""
-                self.is_destroyed = True
-                # 先解除所有事件绑定
-                self.unbind("<Enter>")
-                self.unbind("<Leave>")
-                self.unbind("<Button-1>")
-                self.unbind("<B1-Motion>")
-                self.unbind("<ButtonRelease-1>")
-                # 延迟销毁（避免事件队列残留）
-                self.after(10, super().destroy)
-
-        # 创建安全按钮并绑定拖拽事件
-        btn = SafeCTkButton(parent, text, self)
-        btn.pack(pady=10)
+    def _create_safe_draggable_btn(self, text, container):
+        """创建可拖拽按钮并放入容器（按钮的父控件是 main_frame，以便在容器间移动）"""
+        btn = SafeCTkButton(self.main_frame, text, self)
+        btn.pack(in_=container, pady=10)
 
         # 绑定拖拽事件
         btn.bind("<Button-1>", self._on_drag_start)
         btn.bind("<B1-Motion>", self._on_drag_motion)
         btn.bind("<ButtonRelease-1>", self._on_drag_end)
+        return btn
 
     def _on_drag_start(self, event):
-        """拖拽开始：标记状态，记录初始信息"""
+        """拖拽开始：记录初始信息，创建跟随鼠标的影子"""
         self.is_dragging = True  # 标记拖拽中，屏蔽hover事件
-        self.dragged_widget = event.widget
-        self.start_x = event.x
-        self.start_y = event.y
-        self.start_container = self.dragged_widget.master
-        self.widget_text = self.dragged_widget.cget("text")
-
-        # 提升控件层级
-        self.dragged_widget.tk.call("raise", self.dragged_widget._w)
+        # 事件可能来自按钮内部的画布 / 文字，向上找到按钮本身
+        widget = event.widget
+        while widget is not None and not isinstance(widget, SafeCTkButton):
+            widget = widget.master
+        if widget is None:
+            self.is_dragging = False
+            return
+        self.dragged_widget = widget
+        self.start_x = event.x_root - widget.winfo_rootx()
+        self.start_y = event.y_root - widget.winfo_rooty()
+        self.start_container = widget.pack_info()["in"]
+        self.ghost = self._create_ghost(widget)
+        self.pointer = (event.x_root, event.y_root)
+        self._move_ghost()
+
+    def _create_ghost(self, widget):
+        """用一个轻量画布画出按钮的外形，拖拽期间只移动它"""
+        width, height = widget.winfo_width(), widget.winfo_height()
+        ghost = tk.Canvas(self, width=width, height=height, highlightthickness=0, bd=0, bg=GHOST_BORDER)
+        ghost.create_rectangle(1, 1, width - 2, height - 2, fill=GHOST_FILL, outline="")
+        ghost.create_text(width // 2, height // 2, text=widget.cget("text"), fill="#ffffff")
+        return ghost
 
     def _on_drag_motion(self, event):
-        """拖拽过程：平滑移动控件"""
+        """拖拽过程：只记录鼠标位置，每帧最多移动一次影子"""
         if not self.dragged_widget or not self.is_dragging:
             return
-
-        # 计算新位置（绝对坐标）
-        x = self.dragged_widget.winfo_pointerx() - self.start_x
-        y = self.dragged_widget.winfo_pointery() - self.start_y
-        # 转换为相对父容器坐标
-        x -= self.dragged_widget.master.winfo_rootx()
-        y -= self.dragged_widget.master.winfo_rooty()
-
-        # 移动控件
-        self.dragged_widget.pack_forget()
-        self.dragged_widget.place(x=x, y=y)
+        self.pointer = (event.x_root, event.y_root)
+        if not self.motion_pending:
+            self.motion_pending = True
+            self.after(FRAME_MS, self._move_ghost)
+
+    def _move_ghost(self):
+        self.motion_pending = False
+        if self.ghost is None:
+            return
+        ox, oy = self.drop_index.origin()
+        self.ghost.place(x=self.pointer[0] - self.start_x - ox, y=self.pointer[1] - self.start_y - oy)
+        self.ghost.lift()
+        self._set_hover(self.drop_index.hit(*self.pointer))
+
+    def _set_hover(self, container):
+        """高亮鼠标所在的容器（只在目标变化时修改两个容器的颜色）"""
+        if container is self.hover_target:
+            return
+        if self.hover_target is not None:
+            self.hover_target.configure(fg_color=self.hover_restore_color)
+        self.hover_target = container
+        if container is not None:
+            self.hover_restore_color = container.cget("fg_color")
+            container.configure(fg_color=HOVER_COLOR)
 
     def _on_drag_end(self, event):
-        """拖拽结束：判断位置，重建控件"""
+        """拖拽结束：移除影子，把原控件重新 pack 到落点所在的容器（只 pack 一次）"""
         if not self.dragged_widget:
             self.is_dragging = False
             return
 
-        # 1. 获取鼠标落点
-        mouse_x = event.x_root
-        mouse_y = event.y_root
-
-        # 2. 判断是否在目标容器内
-        target_x1 = self.target_frame.winfo_rootx()
-        target_y1 = self.target_frame.winfo_rooty()
-        target_x2 = target_x1 + self.target_frame.winfo_width()
-        target_y2 = target_y1 + self.target_frame.winfo_height()
-        in_target = (target_x1 < mouse_x < target_x2) and (target_y1 < mouse_y < target_y2)
+        if self.ghost is not None:
+            self.ghost.destroy()
+        self._set_hover(None)
 
-        # 3. 销毁原控件（安全销毁）
-        self.dragged_widget.destroy()
+        # 落在其他容器内时移动过去，否则留在原容器
+        target = self.drop_index.hit(event.x_root, event.y_root)
+        if target is not None and str(target) != str(self.start_container):
+            self.dragged_widget.pack(in_=target, pady=10)
 
-        # 4. 重建控件到目标容器
-        if in_target:
-            self._create_safe_draggable_btn(self.widget_text, self.target_frame)
-        else:
-            self._create_safe_draggable_btn(self.widget_text, self.start_container)
-
-        # 5. 重置拖拽状态
+        # 重置拖拽状态
         self.is_dragging = False
         self.dragged_widget = None
+        self.ghost = None
+        self.pointer = None
         self.start_x = 0
         self.start_y = 0
         self.start_container = None
-        self.widget_text = ""
+
+
+class SafeCTkButton(ctk.CTkButton):
+    """拖拽期间屏蔽hover事件的按钮"""
+
+    def __init__(self, master, text, app_ref):
+        super().__init__(master, text=text, width=200, height=50)
+        self.app_ref = app_ref  # 引用主应用，判断拖拽状态
+
+    def _on_enter(self, event=None):
+        """重写hover进入事件：仅在非拖拽时执行"""
+        if not self.app_ref.is_dragging:
+            super()._on_enter(event)
+
+    def _on_leave(self, event=None):
+        """重写hover离开事件：仅在非拖拽时执行"""
+        if not self.app_ref.is_dragging:
+            super()._on_leave(event)
 
 
 if __name__ == "__main__":
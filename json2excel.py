@@ -0,0 +1,139 @@
+"""命令行批量转换：JSON -> Excel / CSV / Parquet / Arrow（无界面，多进程并行）
+
+用法：
+    python json2excel.py "data/*.json" --list authors
+    python json2excel.py "data/**/*.json" --list "orders[*].items[*]" --columns sku price --format CSV --out out/
+    python json2excel.py a.json b.json --list authors --flatten --workers 4
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from core.engine import convert_file
+from core.exporters import EXPORT_FORMATS
+from core.json_backends import available_backends
+from core.navigator import parse_node_path
+
+
+def glob_root(pattern) -> str:
+    """通配符之前的目录部分，如 "data/**/*.json" -> "data"；没有通配符时为所在目录"""
+    parts = Path(pattern).parts
+    fixed = next((i for i, part in enumerate(parts) if glob.has_magic(part)), len(parts) - 1)
+    return str(Path(*parts[:fixed])) if fixed else "."
+
+
+def expand_sources(patterns) -> dict[str, str]:
+    """展开通配符（支持 **），去重并保持顺序；没有通配符的参数原样保留
+
+    Returns:
+        {源文件: 根目录}，根目录为通配符之前的目录部分
+    """
+    sources = {}
+    for pattern in patterns:
+        root = glob_root(pattern)
+        if glob.has_magic(pattern):
+            matches = [path for path in sorted(glob.glob(pattern, recursive=True)) if os.path.isfile(path)]
+        else:
+            matches = [pattern]
+        for path in matches:
+            sources.setdefault(path, root)
+    return sources
+
+
+def output_path(source, root, out_dir, ext) -> str:
+    """输出文件路径：默认在源文件旁；指定输出目录时保留相对根目录的子目录"""
+    source = Path(source)
+    if not out_dir:
+        return str(source.with_suffix(ext))
+    relative = Path(os.path.relpath(source, root))
+    if relative.parts[:1] == ("..",):
+        relative = Path(source.name)  # 不在根目录之下（如 ../x.json）：只用文件名
+    return str(Path(out_dir) / relative.with_suffix(ext))
+
+
+def find_collisions(outputs) -> dict[str, list[str]]:
+    """多个源文件对应同一个输出文件的情况：{输出文件: [源文件, ...]}"""
+    targets = {}
+    for source, output in outputs.items():
+        targets.setdefault(os.path.normcase(os.path.abspath(output)), []).append(source)
+    return {target: sources for target, sources in targets.items() if len(sources) > 1}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("patterns", nargs="+", help="JSON文件或通配符（如 \"data/**/*.json\"）")
+    parser.add_argument("--list", required=True, dest="node_path", help="列表路径，如 orders[*].items[*]")
+    parser.add_argument("--columns", nargs="+", help="要导出的列（如 id address.city），默认全部")
+    parser.add_argument("--flatten", action="store_true", help="未指定 --columns 时展开嵌套字段")
+    parser.add_argument("--format", choices=list(EXPORT_FORMATS), default="Excel", help="导出格式")
+    parser.add_argument("--out", help="输出目录（默认与源文件同目录）")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="并行进程数")
+    parser.add_argument(
+        "--backend",
+        choices=available_backends(),
+        help="JSON解码后端（默认 json；orjson 更快，但超出64位的整数会变成浮点数）",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        args.node_path = parse_node_path(args.node_path)
+    except ValueError as e:
+        parser.error(str(e))
+    args.sources = expand_sources(args.patterns)
+    if not args.sources:
+        parser.error("没有匹配的文件")
+
+    # 先确定全部输出文件：两个源文件写到同一个输出文件时，后完成的会覆盖先完成的
+    ext = EXPORT_FORMATS[args.format][0]
+    args.outputs = {source: output_path(source, root, args.out, ext) for source, root in args.sources.items()}
+    collisions = find_collisions(args.outputs)
+    if collisions:
+        lines = [f"  {target} <- {', '.join(sources)}" for target, sources in collisions.items()]
+        parser.error("以下源文件会写到同一个输出文件，请调整 --out：\n" + "\n".join(lines))
+    return args
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    for output in args.outputs.values():
+        os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+
+    jobs = [
+        (source, args.node_path, output, args.columns, args.flatten, args.format, args.backend)
+        for source, output in args.outputs.items()
+    ]
+    start = time.perf_counter()
+    failed = 0
+
+    def report(result):
+        nonlocal failed
+        if result.ok:
+            print(
+                f"OK    {result.source} -> {result.output}  {result.rows} 行 × {result.columns} 列  "
+                f"解析 {result.parse_seconds:.2f}s  导出 {result.export_seconds:.2f}s"
+            )
+        else:
+            failed += 1
+            print(f"FAIL  {result.source}  {result.error}  ({result.seconds:.2f}s)", file=sys.stderr)
+
+    workers = max(1, min(args.workers, len(jobs)))
+    if workers == 1:
+        for job in jobs:
+            report(convert_file(*job))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for future in as_completed([pool.submit(convert_file, *job) for job in jobs]):
+                report(future.result())
+
+    elapsed = time.perf_counter() - start
+    print(f"完成 {len(jobs) - failed}/{len(jobs)} 个文件，{workers} 个进程，总耗时 {elapsed:.2f} 秒")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
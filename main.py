@@ -1,12 +1,9 @@
 """Initialize the App class."""
 
-from pathlib import Path
-
 import customtkinter as ctk
-from PIL import Image
 
-from panels.home_panel import HomePanel
-from panels.json_panel import JsonPanel
+from panels.image_cache import images
+from panels.registry import registered_panels
 
 
 class App(ctk.CTk):
@@ -26,13 +23,13 @@ class App(ctk.CTk):
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(1, weight=1)
 
-        image_path = Path(__file__).resolve().parent / "test_images"
-        self.logo_image = ctk.CTkImage(Image.open(image_path / "ctk_logo_single.png"), size=(15, 15))
+        self.logo_image = images.ctk_image("ctk_logo_single", size=(15, 15))
 
         # create navigation frame
+        panels = registered_panels()
         self.navigation_frame = ctk.CTkFrame(self, corner_radius=0)
         self.navigation_frame.grid(row=0, column=0, sticky="nsew")
-        self.navigation_frame.grid_rowconfigure(4, weight=1)
+        self.navigation_frame.grid_rowconfigure(len(panels) + 1, weight=1)
 
         self.navigation_frame_label = ctk.CTkLabel(
             self.navigation_frame,
@@ -43,52 +40,46 @@ class App(ctk.CTk):
         )
         self.navigation_frame_label.grid(row=0, column=0, padx=0, pady=0)
 
-        self.home_button = self.sidebar_btn(
-            self.navigation_frame,
-            name="Home",
-            dark_image_name="home_dark",
-            light_image_name="home_light",
-            command=lambda: self.select_frame_by_name("home"),
-            grid=(1, 0),
-        )
+        # one sidebar button per registered panel; panels are created lazily on first selection
+        self.panel_specs = {spec.name: spec for spec in panels}
+        self.frame_mapping = {}  # name -> (button, frame or None)
+        for row, spec in enumerate(panels, start=1):
+            button = self.sidebar_btn(
+                self.navigation_frame,
+                name=spec.title,
+                dark_image_name=spec.icon[0],
+                light_image_name=spec.icon[1],
+                command=lambda name=spec.name: self.select_frame_by_name(name),
+                grid=(row, 0),
+            )
+            self.frame_mapping[spec.name] = (button, None)
+        self.current_frame_name = None
+        self._warm_up_pending = False
 
-        self.json_button = self.sidebar_btn(
-            self.navigation_frame,
-            name="json",
-            dark_image_name="chat_dark",
-            light_image_name="chat_light",
-            command=lambda: self.select_frame_by_name("json"),
-            grid=(2, 0),
-        )
-
-        self.frame_3_button = self.sidebar_btn(
-            self.navigation_frame,
-            name="Frame 3",
-            dark_image_name="add_user_dark",
-            light_image_name="add_user_light",
-            command=lambda: self.select_frame_by_name("frame_3"),
-            grid=(3, 0),
-        )
-        # create home frame
-        self.home_panel = HomePanel(self)
-        self.json_panel = JsonPanel(self)
-        self.third_panel = ctk.CTkFrame(self, corner_radius=0, fg_color="transparent")
-        self.frame_mapping = {
-            "home": (self.home_button, self.home_panel),
-            "json": (self.json_button, self.json_panel),
-            "frame_3": (self.frame_3_button, self.third_panel),
-        }
         # select default frame
-        self.select_frame_by_name("home")
+        self.select_frame_by_name(panels[0].name)
+
+    def get_frame(self, name: str) -> ctk.CTkFrame:
+        """Return the panel for name, building it on first access."""
+        button, frame = self.frame_mapping[name]
+        if frame is None:
+            frame = self.panel_specs[name].create(self)
+            self.frame_mapping[name] = (button, frame)
+        return frame
+
+    def _warm_up(self) -> None:
+        """Build the next not-yet-created panel in sidebar order while the UI is idle."""
+        self._warm_up_pending = False
+        names = list(self.frame_mapping)
+        start = names.index(self.current_frame_name)
+        for name in names[start + 1 :] + names[:start]:
+            if self.frame_mapping[name][1] is None:
+                self.get_frame(name)
+                return
 
     def icon(self, dark_image_name: str, light_image_name: str, size: tuple[int, int] = (20, 20)) -> ctk.CTkImage:
-        """Create a CTkImage with dark and light images."""
-        image_path = Path(__file__).resolve().parent / "test_images"
-        return ctk.CTkImage(
-            light_image=Image.open(image_path / f"{dark_image_name}.png"),
-            dark_image=Image.open(image_path / f"{light_image_name}.png"),
-            size=size,
-        )
+        """Create a CTkImage with dark and light images (decoded once, shared via the image cache)."""
+        return images.ctk_image(dark_image_name, light_image_name, size=size)
 
     def sidebar_btn(
         self,
@@ -128,13 +119,20 @@ class App(ctk.CTk):
         self.geometry(f"{width}x{height}+{x}+{y}")
 
     def select_frame_by_name(self, name: str) -> None:
-        """Select frame by name."""
-        for frame_name, (button, frame) in self.frame_mapping.items():
-            button.configure(fg_color=("gray75", "gray25") if frame_name == name else "transparent")
-            if frame_name == name:
-                frame.grid(row=0, column=1, sticky="nsew")
-            else:
-                frame.grid_forget()
+        """Select frame by name (only the outgoing and incoming panels are touched)."""
+        if name == self.current_frame_name:
+            return
+        if self.current_frame_name is not None:
+            button, frame = self.frame_mapping[self.current_frame_name]
+            button.configure(fg_color="transparent")
+            frame.grid_forget()
+        frame = self.get_frame(name)
+        self.frame_mapping[name][0].configure(fg_color=("gray75", "gray25"))
+        frame.grid(row=0, column=1, sticky="nsew")
+        self.current_frame_name = name
+        if not self._warm_up_pending:
+            self._warm_up_pending = True
+            self.after_idle(self._warm_up)
 
 
 if __name__ == "__main__":
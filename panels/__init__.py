@@ -0,0 +1,13 @@
+"""内置面板（只声明，不导入面板模块）"""
+
+from panels.registry import register_panel
+
+register_panel("home", "Home", ("home_dark", "home_light"), "panels.home_panel:HomePanel")
+register_panel("json", "json", ("chat_dark", "chat_light"), "panels.json_panel:JsonPanel")
+register_panel(
+    "frame_3",
+    "Frame 3",
+    ("add_user_dark", "add_user_light"),
+    "customtkinter:CTkFrame",
+    options={"corner_radius": 0, "fg_color": "transparent"},
+)
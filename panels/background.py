@@ -0,0 +1,111 @@
+"""后台任务：耗时操作放到工作线程池执行，结果经队列 + after() 轮询回到Tk主线程"""
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# 全局工作线程池（解析、导出等任务共用）
+_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="py_tools-worker")
+
+POLL_INTERVAL_MS = 50  # 轮询结果队列的间隔
+
+
+class BackgroundTask:
+    """在工作线程中执行 func(task, *args)，回调全部在Tk主线程触发
+
+    func 通过 task.report 回报进度、通过 task.cancel_event 感知取消；
+    wait_on_cancel 为 True 时等工作线程结束后才回调 on_cancel。
+    """
+
+    def __init__(
+        self,
+        widget,
+        func,
+        *args,
+        on_success=None,
+        on_error=None,
+        on_progress=None,
+        on_cancel=None,
+        wait_on_cancel=False,
+    ):
+        self.widget = widget
+        self.func = func
+        self.args = args
+        self.on_success = on_success
+        self.on_error = on_error
+        self.on_progress = on_progress  # on_progress(done, total, elapsed)
+        self.on_cancel = on_cancel
+        self.wait_on_cancel = wait_on_cancel
+
+        self.cancel_event = threading.Event()
+        self._queue = queue.Queue()
+        self._progress = (0, 0)
+        self._start_time = 0.0
+        self._finished = False
+
+    @property
+    def elapsed(self) -> float:
+        """已用时（秒）"""
+        return time.perf_counter() - self._start_time
+
+    @property
+    def running(self) -> bool:
+        return not self._finished
+
+    @property
+    def cancelling(self) -> bool:
+        """已请求取消、正在等待工作线程结束"""
+        return self.cancel_event.is_set() and not self._finished
+
+    def start(self):
+        """提交到线程池并开始轮询"""
+        self._start_time = time.perf_counter()
+        _EXECUTOR.submit(self._run)
+        self.widget.after(POLL_INTERVAL_MS, self._poll)
+        return self
+
+    def report(self, done, total):
+        """工作线程调用：回报进度（只保留最新值，不入队）"""
+        self._progress = (done, total)
+
+    def cancel(self):
+        """Tk主线程调用：请求取消"""
+        if self._finished or self.cancel_event.is_set():
+            return
+        self.cancel_event.set()
+        if self.wait_on_cancel:
+            return  # 由 _poll 在工作线程结束后回调 on_cancel
+        self._finished = True
+        if self.on_cancel:
+            self.on_cancel()
+
+    def _run(self):
+        try:
+            result = self.func(self, *self.args)
+        except BaseException as e:  # noqa: BLE001  异常交给主线程处理
+            self._queue.put(("error", e))
+        else:
+            self._queue.put(("success", result))
+
+    def _poll(self):
+        if self._finished:
+            return
+        try:
+            kind, payload = self._queue.get_nowait()
+        except queue.Empty:
+            if self.on_progress and not self.cancel_event.is_set():
+                self.on_progress(*self._progress, self.elapsed)
+            self.widget.after(POLL_INTERVAL_MS, self._poll)
+            return
+
+        self._finished = True
+        if self.cancel_event.is_set():
+            # wait_on_cancel：工作线程已结束，结果（或取消异常）丢弃
+            if self.on_cancel:
+                self.on_cancel()
+        elif kind == "success":
+            if self.on_success:
+                self.on_success(payload)
+        elif self.on_error:
+            self.on_error(payload)
@@ -0,0 +1,93 @@
+"""图片缓存：每个素材只解码一次，只保留缩放后的小图
+
+按 (名称, 尺寸, 模式) 缓存缩小后的 PIL 图片，CTkImage 也按 (浅色, 深色, 尺寸) 复用；
+可选地把缩小后的图片持久化到磁盘，下次启动直接读取几百字节的小图，不再解码原图。
+"""
+
+import os
+from pathlib import Path
+
+import customtkinter as ctk
+from PIL import Image
+
+ASSET_DIR = Path(__file__).resolve().parent.parent / "test_images"
+
+# 缩略图的磁盘缓存目录（设置环境变量 PY_TOOLS_THUMB_DIR 后启用，默认只缓存在内存中）
+THUMB_DIR = os.environ.get("PY_TOOLS_THUMB_DIR") or None
+
+# 按显示尺寸的几倍保存，高DPI缩放时 CTkImage 只需从小图缩放
+HIDPI_FACTOR = 2
+
+
+class ImageCache:
+    """进程内的图片缓存
+
+    Args:
+        asset_dir: 素材目录
+        thumb_dir: 缩略图缓存目录，None 表示不写磁盘
+    """
+
+    def __init__(self, asset_dir, thumb_dir=None):
+        self.asset_dir = Path(asset_dir)
+        self.thumb_dir = Path(thumb_dir) if thumb_dir else None
+        self._images = {}  # (名称, 尺寸, 模式) -> PIL.Image
+        self._ctk_images = {}  # (浅色名称, 深色名称, 尺寸) -> CTkImage
+
+    def _source(self, name) -> Path:
+        path = self.asset_dir / name
+        return path if path.suffix else path.with_suffix(".png")
+
+    def _thumb_path(self, source, pixels, mode):
+        """缩略图文件名包含原图的修改时间和大小，原图更新后自动失效"""
+        if self.thumb_dir is None:
+            return None
+        stat = source.stat()
+        return self.thumb_dir / f"{source.stem}_{pixels[0]}x{pixels[1]}_{mode}_{stat.st_mtime_ns}_{stat.st_size}.png"
+
+    def get(self, name, size, mode="RGBA") -> Image.Image:
+        """取缩放到 size（× HIDPI_FACTOR）的图片"""
+        key = (name, tuple(size), mode)
+        image = self._images.get(key)
+        if image is None:
+            image = self._images[key] = self._load(name, key[1], mode)
+        return image
+
+    def _load(self, name, size, mode):
+        source = self._source(name)
+        pixels = (size[0] * HIDPI_FACTOR, size[1] * HIDPI_FACTOR)
+        thumb = self._thumb_path(source, pixels, mode)
+        if thumb is not None and thumb.exists():
+            try:
+                with Image.open(thumb) as image:
+                    image.load()
+                    return image
+            except OSError:
+                pass  # 缩略图损坏：重新生成
+
+        with Image.open(source) as image:
+            image.draft(mode, pixels)  # JPEG 可直接按缩小的尺寸解码
+            resized = image.convert(mode).resize(pixels, Image.LANCZOS)
+
+        if thumb is not None:
+            try:
+                thumb.parent.mkdir(parents=True, exist_ok=True)
+                resized.save(thumb)
+            except OSError:
+                pass  # 缓存目录不可写时只在内存中缓存
+        return resized
+
+    def ctk_image(self, light_name, dark_name=None, size=(20, 20)) -> ctk.CTkImage:
+        """取（共享的）CTkImage，切换主题时 CTkImage 自行在两张小图间切换，不会重新解码"""
+        key = (light_name, dark_name, tuple(size))
+        image = self._ctk_images.get(key)
+        if image is None:
+            image = self._ctk_images[key] = ctk.CTkImage(
+                light_image=self.get(light_name, size),
+                dark_image=self.get(dark_name, size) if dark_name else None,
+                size=size,
+            )
+        return image
+
+
+# 进程内共享的实例
+images = ImageCache(ASSET_DIR, THUMB_DIR)
@@ -0,0 +1,258 @@
+"""JSON文本框的语法高亮与折叠
+
+高亮是增量的：文本框的 insert / delete / replace 被拦截下来，只把改动涉及的行记为"脏行"，
+空闲时只给可见区域内的脏行重新打标签（每次最多 CHUNK_LINES 行，剩余的下次再做），
+滚动到别处时再处理新露出来的脏行。粘贴 20MB 的文本也只会给屏幕上的几十行打标签。
+
+JSON 字符串不能跨行，所以每行可以独立分词，不需要保存行间状态。
+"""
+
+import re
+
+CHUNK_LINES = 200  # 每次空闲回调最多处理的行数
+MAX_LINE_CHARS = 20000  # 超长行（压缩过的JSON）只高亮开头这么多字符
+
+# 标签名 -> 前景色
+TOKEN_COLORS = {
+    "json_key": "#9cdcfe",
+    "json_string": "#ce9178",
+    "json_number": "#b5cea8",
+    "json_literal": "#569cd6",
+    "json_punct": "#d4d4d4",
+}
+FOLD_MARK_COLOR = "#3a3d41"  # 已折叠行的背景色
+ERROR_LINE_COLOR = "#4b1818"  # 语法错误所在行的背景色
+ERROR_CHAR_COLOR = "#f44336"  # 语法错误位置的字符
+
+_TOKEN = re.compile(
+    r'(?P<json_key>"(?:[^"\\]|\\.)*"(?=\s*:))'
+    r'|(?P<json_string>"(?:[^"\\]|\\.)*"?)'
+    r"|(?P<json_number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)"
+    r"|(?P<json_literal>\b(?:true|false|null)\b)"
+    r"|(?P<json_punct>[{}\[\]])"
+)
+# 查找配对括号时跳过字符串
+_BRACKET = re.compile(r'"(?:[^"\\\n]|\\.)*"|[\[\]{}]')
+_OPENERS = "{["
+
+
+class JsonHighlighter:
+    """给 CTkTextbox 加上JSON高亮与折叠（Ctrl+单击以 { 或 [ 结尾的行切换折叠）
+
+    Args:
+        textbox: CTkTextbox
+        on_edit: 文本被修改（插入 / 删除 / 替换）后的回调 on_edit(改动开始的行号)
+    """
+
+    def __init__(self, textbox, on_edit=None):
+        self.text = textbox._textbox  # 底层的 tk.Text
+        self.on_edit = on_edit
+        self._dirty = []  # 尚未打标签的行区间 [(起始行, 结束行)]，有序且互不重叠
+        self._job = None
+        self._folds = {}  # 折叠起始行的标签名 -> None（标签本身随文本移动）
+        self._fold_seq = 0
+
+        for tag, color in TOKEN_COLORS.items():
+            self.text.tag_configure(tag, foreground=color)
+        self.text.tag_configure("json_fold_mark", background=FOLD_MARK_COLOR)
+        self.text.tag_configure("json_error_line", background=ERROR_LINE_COLOR)
+        self.text.tag_configure("json_error_char", background=ERROR_CHAR_COLOR, underline=True)
+
+        # 拦截 Text 的 Tcl 命令：记录改动的行并在滚动后刷新可见区域
+        self._orig = self.text._w + "_orig"
+        self.text.tk.call("rename", self.text._w, self._orig)
+        self.text.tk.createcommand(self.text._w, self._dispatch)
+        self.text.bind("<Configure>", lambda _e: self._schedule(), add="+")
+        self.text.bind("<Control-Button-1>", self._on_fold_click, add="+")
+        self._mark(1, self._line("end"))
+
+    def _call(self, *args):
+        return self.text.tk.call(self._orig, *args)
+
+    def _line(self, index) -> int:
+        return int(str(self._call("index", index)).split(".")[0])
+
+    def _edit_line(self, index) -> int:
+        """编辑位置所在的行；"end" 处的插入 / 删除实际发生在最后一个换行之前"""
+        return min(self._line(index), self._line("end - 1 chars"))
+
+    def _dispatch(self, *args):
+        """Text 命令的代理：按改动前后的总行数之差更新脏行区间"""
+        op = args[0] if args else ""
+        if op not in ("insert", "delete", "replace"):
+            result = self._call(*args)
+            if op in ("yview", "see") and len(args) > 1:
+                self._schedule()
+            return result
+
+        first = self._edit_line(args[1])
+        before = self._line("end")
+        result = self._call(*args)
+        delta = self._line("end") - before
+        if op == "insert":
+            self._inserted(first, delta)
+        elif op == "delete":
+            self._deleted(first, first - delta)
+        else:
+            inserted = sum(chunk.count("\n") for chunk in args[3::2])
+            self._deleted(first, first + inserted - delta)
+            self._inserted(first, inserted)
+        self._schedule()
+        if self.on_edit is not None:
+            self.on_edit(first)
+        return result
+
+    def _inserted(self, line, newlines):
+        """line 行插入了 newlines 个换行：之后的区间下移，改动的行记为脏"""
+        if newlines:
+            self._dirty = [(a + newlines if a > line else a, b + newlines if b >= line else b) for a, b in self._dirty]
+        self._mark(line, line + newlines)
+
+    def _deleted(self, first, last):
+        """删除了 first 行到 last 行之间的内容：被删的行并入 first，之后的区间上移"""
+        removed = last - first
+        if removed:
+            self._dirty = [
+                (a if a <= first else max(first, a - removed), b if b <= first else max(first, b - removed))
+                for a, b in self._dirty
+            ]
+        self._mark(first, first)
+
+    def _mark(self, first, last):
+        """把 [first, last] 并入脏行区间"""
+        merged = []
+        for a, b in sorted(self._dirty + [(first, last)]):
+            if merged and a <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], b))
+            else:
+                merged.append((a, b))
+        self._dirty = merged
+
+    def _schedule(self):
+        if self._job is None and self._dirty:
+            self._job = self.text.after_idle(self._refresh)
+
+    def _visible_lines(self):
+        first = self._line("@0,0")
+        last = self._line(f"@0,{self.text.winfo_height()}")
+        return first, last
+
+    def _refresh(self):
+        """空闲时给可见区域内的脏行打标签，一次最多 CHUNK_LINES 行"""
+        self._job = None
+        if not self.text.winfo_exists():
+            return
+        top, bottom = self._visible_lines()
+        budget = CHUNK_LINES
+        remaining = []
+        for a, b in self._dirty:
+            lo, hi = max(a, top), min(b, bottom, max(a, top) + budget - 1)
+            if budget <= 0 or lo > hi:
+                remaining.append((a, b))
+                continue
+            self._highlight(lo, hi)
+            budget -= hi - lo + 1
+            # 区间中没处理的部分仍是脏的
+            if a < lo:
+                remaining.append((a, lo - 1))
+            if hi < b:
+                remaining.append((hi + 1, b))
+        self._dirty = remaining
+        if budget <= 0:
+            self._schedule()  # 可见区域还没处理完，下次空闲继续
+
+    def _highlight(self, first, last):
+        """重新给 first~last 行打标签（每种标签一次 tag add 调用）"""
+        start, end = f"{first}.0", f"{last}.end"
+        for tag in TOKEN_COLORS:
+            self._call("tag", "remove", tag, start, end)
+        ranges = {tag: [] for tag in TOKEN_COLORS}
+        for line_no, line in enumerate(str(self._call("get", start, end)).split("\n"), first):
+            for match in _TOKEN.finditer(line, 0, MAX_LINE_CHARS):
+                ranges[match.lastgroup] += (f"{line_no}.{match.start()}", f"{line_no}.{match.end()}")
+        for tag, indices in ranges.items():
+            if indices:
+                self._call("tag", "add", tag, *indices)
+
+    # ---------- 语法错误 ----------
+
+    def mark_error(self, lineno, colno) -> str:
+        """标出语法错误所在的行与字符（行列号从1开始），返回出错位置的索引"""
+        self.clear_error()
+        index = f"{lineno}.{colno - 1}"
+        self._call("tag", "add", "json_error_line", f"{lineno}.0", f"{lineno}.0 + 1 lines")
+        self._call("tag", "add", "json_error_char", index, f"{index} + 1 chars")
+        return index
+
+    def clear_error(self):
+        self._call("tag", "remove", "json_error_line", "1.0", "end")
+        self._call("tag", "remove", "json_error_char", "1.0", "end")
+
+    def error_index(self):
+        """当前标出的错误位置（随编辑移动）；没有错误时返回 None"""
+        ranges = self._call("tag", "ranges", "json_error_char")
+        return str(ranges[0]) if ranges else None
+
+    def reveal(self, index):
+        """展开包含 index 的折叠，然后滚动到该位置并把光标放过去"""
+        for tag in self._call("tag", "names", index):
+            if str(tag) in self._folds:
+                self._unfold(str(tag))
+        self._call("mark", "set", "insert", index)
+        self._call("see", index)
+        self.text.focus_set()
+
+    # ---------- 折叠 ----------
+
+    def _on_fold_click(self, event):
+        self.toggle_fold(self._line(f"@{event.x},{event.y}"))
+        return "break"
+
+    def toggle_fold(self, line) -> bool:
+        """折叠 / 展开以 { 或 [ 结尾的行；该行不可折叠时返回 False"""
+        for tag in self._call("tag", "names", f"{line}.end"):
+            if str(tag) in self._folds:
+                self._unfold(str(tag))
+                return True
+
+        text = str(self._call("get", f"{line}.0", f"{line}.end")).rstrip()
+        if not text or text[-1] not in _OPENERS:
+            return False
+        start = f"{line}.{len(text)}"
+        end = self._matching_bracket(start)
+        if end is None:
+            return False
+
+        self._fold_seq += 1
+        tag = f"json_fold{self._fold_seq}"
+        self._folds[tag] = None
+        self.text.tag_configure(tag, elide=True)
+        self._call("tag", "add", tag, start, end)
+        self._call("tag", "add", "json_fold_mark", f"{line}.0", f"{line}.end")
+        return True
+
+    def _matching_bracket(self, start):
+        """start 处（开括号之后）对应的闭括号的位置；括号不配对时返回 None"""
+        rest = str(self._call("get", start, "end"))
+        depth = 1
+        for match in _BRACKET.finditer(rest):
+            token = match.group()
+            if token in _OPENERS:
+                depth += 1
+            elif token in "]}":
+                depth -= 1
+                if depth == 0:
+                    return self._call("index", f"{start} + {match.start()} chars")
+        return None
+
+    def _unfold(self, tag):
+        first = self._call("tag", "ranges", tag)
+        if first:
+            line = self._line(first[0])
+            self._call("tag", "remove", "json_fold_mark", f"{line}.0", f"{line}.end")
+        self._call("tag", "delete", tag)
+        del self._folds[tag]
+
+    def unfold_all(self):
+        for tag in list(self._folds):
+            self._unfold(tag)
@@ -1,11 +1,23 @@
 """Json Panel"""
 
 import json
-import re
-from tkinter import END, MULTIPLE, Listbox, filedialog, messagebox
+import os
+from tkinter import END, StringVar, filedialog, messagebox
 
 import customtkinter as ctk
-import pandas as pd
+
+from core.doc_cache import content_hash, documents, file_hash
+from core.exporters import EXPORT_FORMATS, ExportCancelled, export_records, format_for_path, has_rows
+from core.json_backends import available_backends, get_backend
+from core.json_lazy import LazyJsonObject, index_file, index_text
+from core.json_parse import ParseCancelled, parse_file, parse_incremental
+from core.json_validate import JsonValidator
+from core.navigator import PathNavigator, format_node_path, strip_list_tag
+from core.sorting import SORT_MODES
+from panels.background import BackgroundTask
+from panels.json_highlight import JsonHighlighter
+from panels.listview import VirtualListbox, move_block
+from panels.tableview import VirtualTable
 
 # 全局字体配置（统一美化）
 CTK_FONT_MAIN = ("Microsoft YaHei UI", 12)  # 主要字体
@@ -18,49 +30,16 @@ BG_COLOR_MAIN = "#242424"  # 面板主背景
 BG_COLOR_CONTENT = "#1e1e1e"  # JSON输入框/信息栏背景
 BG_COLOR_SELECT = "#404040"  # 选中项背景
 
+PREVIEW_CHARS = 64 * 1024  # 打开文件时文本框中显示的预览字符数
+# 解码后端菜单：显示文本 -> 后端名称。默认标准库 json（分段解析，有进度、可取消）；
+# 其余后端更快，但无进度、不能取消，超出64位的整数可能变成浮点数
+BACKEND_LABELS = {
+    name if name == "json" else f"{name}（快，不可取消，大整数丢精度）": name
+    for name in sorted(available_backends(), key=lambda name: name != "json")
+}
 
-class DragSortListbox(Listbox):
-    """支持拖动排序的Listbox子类（适配深色主题）"""
-
-    def __init__(self, master, **kwargs):
-        default_kwargs = {
-            "bg": BG_COLOR_CONTENT,  # 统一使用内容背景色
-            "fg": "#f0f0f0",  # 浅白色文字
-            "selectbackground": BG_COLOR_SELECT,  # 选中项背景
-            "selectforeground": "#ffffff",  # 选中项文字
-            "activestyle": "none",  # 取消选中虚线框
-            "bd": 0,  # 去掉边框
-            "highlightthickness": 0,  # 去掉聚焦边框
-            "font": CTK_FONT_MONO,  # 统一等宽字体
-            "relief": "flat",  # 扁平样式
-        }
-        default_kwargs.update(kwargs)
-        super().__init__(master, **default_kwargs)
-
-        self.drag_index = None  # 记录拖动项的初始索引
-        self.bind("<Button-1>", self._on_click)
-        self.bind("<B1-Motion>", self._on_drag)
-
-    def _on_click(self, event):
-        """鼠标点击时记录选中项索引"""
-        self.drag_index = self.nearest(event.y)
-
-    def _on_drag(self, event):
-        """鼠标拖动时调整选中项位置"""
-        if self.drag_index is None:
-            return
-        current_index = self.nearest(event.y)
-        if current_index != self.drag_index:
-            # 获取拖动项的内容
-            drag_item = self.get(self.drag_index)
-            # 删除原位置项
-            self.delete(self.drag_index)
-            # 插入到新位置
-            self.insert(current_index, drag_item)
-            # 更新拖动索引
-            self.drag_index = current_index
-            # 保持选中状态
-            self.selection_set(current_index)
+FILTER_DEBOUNCE_MS = 150  # 筛选框停止输入这么久后才刷新列表
+VALIDATE_DEBOUNCE_MS = 400  # 文本框停止编辑这么久后才在后台校验语法
 
 
 class JsonPanel(ctk.CTkFrame):
@@ -75,6 +54,19 @@ class JsonPanel(ctk.CTkFrame):
         self.grid_columnconfigure(0, weight=4)  # 左侧占4份
         self.grid_columnconfigure(1, weight=1)  # 右侧占1份
 
+        self.task = None  # 正在执行的后台任务（解析 / 加载列表 / 导出）
+        self.json_file_path = None  # 通过"打开文件"加载的JSON文件（为None时解析文本框内容）
+        self.navigator = None  # 多层列表导航（缓存访问过的节点），重新解析时重建
+        self.current_node = None  # 当前显示的列表节点，None 表示主Key列表
+        self.visible_keys = []  # 列表中显示的Key（筛选后），与列表行一一对应
+        self._filter_query = ""  # 已生效的筛选条件
+        self._filter_job = None  # 等待执行的筛选（防抖）
+        self.validator = JsonValidator()  # 文本框语法校验（从上次的检查点续验）
+        self._validate_job = None  # 等待执行的校验（防抖）
+        self._validate_task = None  # 正在执行的校验
+        self._syntax_error = None  # 最近一次校验发现的错误（ValidationResult）
+        self._stats_task = None  # 正在统计选中列的后台任务
+
         self.init_left_panel()  # 左侧JSON输入面板
         self.init_right_panel()  # 右侧Key列表+操作面板
         self.init_info_bar()  # 底部信息提示栏
@@ -83,6 +75,7 @@ class JsonPanel(ctk.CTkFrame):
         """初始化左侧JSON输入面板（占4/5）"""
         left_frame = ctk.CTkFrame(self, fg_color=BG_COLOR_MAIN, corner_radius=8)
         left_frame.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
+        self.left_frame = left_frame
 
         # 左侧面板布局配置
         left_frame.grid_rowconfigure(1, weight=1)  # JSON输入框占满剩余空间
@@ -114,7 +107,51 @@ class JsonPanel(ctk.CTkFrame):
             width=120,
             height=36,
         )
-        self.parse_btn.grid(row=0, column=1, sticky="e")
+        self.parse_btn.grid(row=0, column=5, sticky="e")
+
+        # JSON解码后端（默认 json：分段解析，支持进度与取消）
+        self.backend_menu = ctk.CTkOptionMenu(
+            top_frame,
+            values=list(BACKEND_LABELS),
+            font=CTK_FONT_SMALL,
+            dropdown_font=CTK_FONT_SMALL,
+            width=150,
+            height=30,
+        )
+        self.backend_menu.grid(row=0, column=1, padx=(0, 10), sticky="e")
+
+        # 流式索引开关：只扫描顶层Key，列表在进入时才解析（适合超大文件）
+        self.lazy_switch = ctk.CTkSwitch(top_frame, text="流式索引", font=CTK_FONT_SMALL)
+        self.lazy_switch.grid(row=0, column=2, padx=(0, 10), sticky="e")
+
+        # 打开文件按钮（大文件直接按路径解析，不经过文本框）
+        self.open_btn = ctk.CTkButton(
+            top_frame,
+            text="打开文件…",
+            command=self.open_json_file,
+            font=CTK_FONT_MAIN,
+            fg_color="#607d8b",
+            hover_color="#455a64",
+            corner_radius=6,
+            width=100,
+            height=36,
+        )
+        self.open_btn.grid(row=0, column=3, padx=(0, 5), sticky="e")
+
+        # 取消解析按钮（仅在后台解析时显示）
+        self.cancel_btn = ctk.CTkButton(
+            top_frame,
+            text="取消",
+            command=self.cancel_task,
+            font=CTK_FONT_MAIN,
+            fg_color="#f44336",
+            hover_color="#d32f2f",
+            corner_radius=6,
+            width=80,
+            height=36,
+        )
+        self.cancel_btn.grid(row=0, column=4, padx=(0, 5), sticky="e")
+        self.cancel_btn.grid_remove()
 
         # 第二行：JSON输入文本框（占满剩余空间）
         self.json_textbox = ctk.CTkTextbox(
@@ -127,6 +164,50 @@ class JsonPanel(ctk.CTkFrame):
             corner_radius=6,
         )
         self.json_textbox.grid(row=1, column=0, padx=15, pady=(0, 15), sticky="nsew")
+        self.json_textbox.bind("<<Modified>>", self._on_textbox_modified)
+        # 语法高亮（只处理改动的行和可见区域）与折叠（Ctrl+单击以 { 或 [ 结尾的行）
+        self.highlighter = JsonHighlighter(self.json_textbox, on_edit=self._on_text_edited)
+
+        # 第三行：选中列表内部Key后的数据预览（只绘制可见单元格）
+        self.preview_frame = ctk.CTkFrame(left_frame, fg_color="transparent")
+        self.preview_frame.grid(row=2, column=0, padx=15, pady=(0, 15), sticky="nsew")
+        self.preview_frame.grid_rowconfigure(1, weight=1)
+        self.preview_frame.grid_columnconfigure(0, weight=1)
+
+        self.preview_label = ctk.CTkLabel(
+            self.preview_frame, text="", font=CTK_FONT_SMALL, text_color="#aaaaaa", anchor="w"
+        )
+        self.preview_label.grid(row=0, column=0, sticky="w", pady=(0, 5))
+        preview_close_btn = ctk.CTkButton(
+            self.preview_frame,
+            text="关闭预览",
+            command=self.hide_preview,
+            font=CTK_FONT_SMALL,
+            fg_color="#607d8b",
+            hover_color="#455a64",
+            corner_radius=4,
+            width=70,
+            height=22,
+        )
+        preview_close_btn.grid(row=0, column=1, columnspan=2, sticky="e", pady=(0, 5))
+
+        preview_yscroll = ctk.CTkScrollbar(self.preview_frame)
+        preview_yscroll.grid(row=1, column=2, sticky="ns")
+        preview_xscroll = ctk.CTkScrollbar(self.preview_frame, orientation="horizontal")
+        preview_xscroll.grid(row=2, column=0, columnspan=2, sticky="ew")
+        self.preview_table = VirtualTable(
+            self.preview_frame,
+            font=CTK_FONT_MONO,
+            bg=BG_COLOR_CONTENT,
+            fg="#f0f0f0",
+            header_bg=BG_COLOR_SELECT,
+            yscrollcommand=preview_yscroll.set,
+            xscrollcommand=preview_xscroll.set,
+        )
+        self.preview_table.grid(row=1, column=0, columnspan=2, sticky="nsew")
+        preview_yscroll.configure(command=self.preview_table.yview)
+        preview_xscroll.configure(command=self.preview_table.xview)
+        self.preview_frame.grid_remove()
 
     def init_right_panel(self):
         """初始化右侧Key列表+操作面板（占1/5）"""
@@ -134,7 +215,7 @@ class JsonPanel(ctk.CTkFrame):
         right_frame.grid(row=0, column=1, padx=(0, 10), pady=10, sticky="nsew")
 
         # 右侧面板布局配置
-        right_frame.grid_rowconfigure(2, weight=1)  # Key列表占满剩余空间
+        right_frame.grid_rowconfigure(4, weight=1)  # Key列表占满剩余空间
         right_frame.grid_columnconfigure(0, weight=1)
 
         # 第一行：标题 + 返回主Key + 升序 + 降序（同一行）
@@ -155,11 +236,11 @@ class JsonPanel(ctk.CTkFrame):
         btn_group_frame = ctk.CTkFrame(row1_frame, fg_color="transparent")
         btn_group_frame.grid(row=0, column=1, sticky="e")
 
-        # 返回主Key按钮
+        # 返回上级按钮（第一层列表返回主Key）
         self.back_btn = ctk.CTkButton(
             btn_group_frame,
-            text="返回主Key",
-            command=self.back_to_main_keys,
+            text="返回上级",
+            command=self.go_back,
             font=CTK_FONT_SMALL,
             fg_color="#ff9800",
             hover_color="#f57c00",
@@ -170,6 +251,17 @@ class JsonPanel(ctk.CTkFrame):
         )
         self.back_btn.pack(side="left", padx=(0, 5))
 
+        # 排序方式（自然排序："item2" 在 "item10" 之前；类型 / 大小 / 拼音）
+        self.sort_menu = ctk.CTkOptionMenu(
+            btn_group_frame,
+            values=list(SORT_MODES),
+            font=CTK_FONT_SMALL,
+            dropdown_font=CTK_FONT_SMALL,
+            width=70,
+            height=30,
+        )
+        self.sort_menu.pack(side="left", padx=(0, 5))
+
         # 升序按钮
         sort_asc_btn = ctk.CTkButton(
             btn_group_frame,
@@ -198,12 +290,13 @@ class JsonPanel(ctk.CTkFrame):
         )
         sort_desc_btn.pack(side="left")
 
-        # 第二行：生成Excel按钮（末尾/右侧）
+        # 第二行：展开嵌套开关（左），导出格式与生成按钮（右）；第0列占满剩余宽度
         row2_frame = ctk.CTkFrame(right_frame, fg_color="transparent")
         row2_frame.grid(row=1, column=0, padx=15, pady=(0, 10), sticky="ew")
         row2_frame.grid_columnconfigure(0, weight=1)
+        row2_frame.grid_columnconfigure((1, 2), weight=0)
 
-        generate_btn = ctk.CTkButton(
+        self.generate_btn = ctk.CTkButton(
             row2_frame,
             text="生成 Excel",
             command=self.generate_excel,
@@ -214,12 +307,63 @@ class JsonPanel(ctk.CTkFrame):
             height=36,
             width=120,
         )
-        generate_btn.grid(row=0, column=1, sticky="e")
+        self.generate_btn.grid(row=0, column=2, sticky="e")
 
-        # 第三行：Key列表框（拖动排序）
-        self.key_listbox = DragSortListbox(right_frame, selectmode=MULTIPLE, font=CTK_FONT_MONO, relief="flat")
-        self.key_listbox.grid(row=2, column=0, padx=15, pady=(0, 15), sticky="nsew")
+        # 导出格式（Excel有行数上限且较慢，大列表可选 CSV / Parquet / Arrow）
+        self.format_menu = ctk.CTkOptionMenu(
+            row2_frame,
+            values=list(EXPORT_FORMATS),
+            command=lambda fmt: self.generate_btn.configure(text=f"生成 {fmt}"),
+            font=CTK_FONT_SMALL,
+            dropdown_font=CTK_FONT_SMALL,
+            width=90,
+            height=30,
+        )
+        self.format_menu.grid(row=0, column=1, padx=(0, 5), sticky="e")
+
+        # 展开嵌套开关：列表内部Key显示为叶子路径（address.city、tags[0]）
+        self.flatten_switch = ctk.CTkSwitch(
+            row2_frame, text="展开嵌套", command=self.on_flatten_toggle, font=CTK_FONT_SMALL
+        )
+        self.flatten_switch.grid(row=0, column=0, sticky="w")
+
+        # 第三行：面包屑（当前路径，点击跳回对应层级）
+        self.breadcrumb_frame = ctk.CTkFrame(right_frame, fg_color="transparent")
+        self.breadcrumb_frame.grid(row=2, column=0, padx=15, pady=(0, 5), sticky="ew")
+        self._render_breadcrumb()
+
+        # 第四行：Key筛选框（解析时建好索引，内容停止变化后筛选）
+        self.filter_entry = ctk.CTkEntry(right_frame, font=CTK_FONT_SMALL, height=30)
+        self.filter_entry.grid(row=3, column=0, padx=15, pady=(0, 5), sticky="ew")
+        # 变量挂在内部的 tk.Entry 上：键入、粘贴、剪切、程序修改都会触发筛选；
+        # 传给 CTkEntry 的 textvariable 会禁用占位文字，所以挂好变量后再设置占位文字
+        self.filter_var = StringVar(self)
+        self.filter_entry._entry.configure(textvariable=self.filter_var)
+        self.filter_entry.configure(placeholder_text="筛选Key（^开头为前缀匹配）")
+        self.filter_var.trace_add("write", self._on_filter_changed)
+
+        # 第五行：Key列表（虚拟列表，拖动排序；列表内部双击 [LIST] 字段进入下一层）
+        list_frame = ctk.CTkFrame(right_frame, fg_color="transparent")
+        list_frame.grid(row=4, column=0, padx=15, pady=(0, 15), sticky="nsew")
+        list_frame.grid_rowconfigure(0, weight=1)
+        list_frame.grid_columnconfigure(0, weight=1)
+
+        key_scrollbar = ctk.CTkScrollbar(list_frame)
+        key_scrollbar.grid(row=0, column=1, sticky="ns")
+        self.key_listbox = VirtualListbox(
+            list_frame,
+            font=CTK_FONT_MONO,
+            bg=BG_COLOR_CONTENT,  # 统一使用内容背景色
+            fg="#f0f0f0",  # 浅白色文字
+            selectbackground=BG_COLOR_SELECT,  # 选中项背景
+            selectforeground="#ffffff",  # 选中项文字
+            yscrollcommand=key_scrollbar.set,
+            on_reorder=self.on_keys_reordered,
+        )
+        self.key_listbox.grid(row=0, column=0, sticky="nsew")
+        key_scrollbar.configure(command=self.key_listbox.yview)
         self.key_listbox.bind("<<ListboxSelect>>", self.on_key_select)
+        self.key_listbox.bind("<Double-Button-1>", self.on_key_double_click)
 
     def init_info_bar(self):
         """初始化底部信息提示栏"""
@@ -235,59 +379,269 @@ class JsonPanel(ctk.CTkFrame):
         )
         self.info_label.pack(fill="x", padx=20, pady=5)
 
-    def update_info(self, text: str, is_success: bool = True):
+        # 跳到语法错误按钮（仅在文本框有语法错误时显示）
+        self.error_btn = ctk.CTkButton(
+            self.info_frame,
+            text="跳到错误",
+            command=self.jump_to_error,
+            font=CTK_FONT_SMALL,
+            fg_color="#f44336",
+            hover_color="#d32f2f",
+            corner_radius=4,
+            width=70,
+            height=22,
+        )
+
+    def update_info(self, text: str, is_success: bool | None = True):
         """更新底部信息栏内容
         Args:
             text: 提示文本
-            is_success: True=成功（绿色），False=失败（红色）
+            is_success: True=成功（绿色），False=失败（红色），None=进行中（灰色）
         """
-        color = "#4caf50" if is_success else "#f44336"
+        if is_success is None:
+            color = "#aaaaaa"
+        else:
+            color = "#4caf50" if is_success else "#f44336"
         self.info_label.configure(text=text, text_color=color)
 
-    def parse_json(self):
-        """解析输入的JSON文本"""
+    def open_json_file(self):
+        """选择JSON文件：文本框只显示预览，解析时直接读取文件"""
+        file_path = filedialog.askopenfilename(
+            filetypes=[("JSON文件", "*.json"), ("所有文件", "*.*")],
+            title="打开JSON文件",
+        )
+        if not file_path:
+            return
+
         try:
-            # 清空列表
-            self.key_listbox.delete(0, END)
+            with open(file_path, encoding="utf-8-sig", errors="replace") as f:
+                preview = f.read(PREVIEW_CHARS)
+                truncated = bool(f.read(1))
+        except OSError as e:
+            err_msg = f"打开文件失败：{e!s}"
+            messagebox.showerror("错误", err_msg)
+            self.update_info(err_msg, False)
+            return
 
-            # 获取文本框内容
-            json_text = self.json_textbox.get("1.0", END).strip()
-            if not json_text:
+        self.highlighter.unfold_all()
+        self.json_textbox.delete("1.0", END)
+        self.json_textbox.insert("1.0", preview)
+        if truncated:
+            self.json_textbox.insert(END, "\n\n……（仅显示文件开头预览，解析时读取完整文件）")
+        self.json_textbox.edit_modified(False)
+        self.json_file_path = file_path
+        self.parse_json()
+
+    def _on_textbox_modified(self, event=None):
+        """用户编辑了文本框后，改为解析文本框内容"""
+        if self.json_file_path is not None and self.json_textbox.edit_modified():
+            self.json_file_path = None
+            self.update_info("文本框已修改，将解析文本框内容", None)
+
+    def _on_text_edited(self, lineno):
+        """文本框内容变化：丢弃改动行之后的检查点，停止编辑 VALIDATE_DEBOUNCE_MS 后再校验"""
+        self.validator.edited(lineno)
+        if self._validate_job is not None:
+            self.after_cancel(self._validate_job)
+        self._validate_job = self.after(VALIDATE_DEBOUNCE_MS, self.validate_json)
+
+    def validate_json(self):
+        """在后台线程校验文本框中的JSON：只取出改动之前最近的检查点之后的文本"""
+        self._validate_job = None
+        if self._validate_task is not None:
+            self._validate_task.cancel()
+        # 文本框中只是文件预览时不校验
+        if self.json_file_path is not None:
+            self._show_syntax_error(None)
+            return
+        start = self.validator.resume_point()
+        text = self.json_textbox.get(start.index, "end-1c")
+        if start.lineno == 1 and not text.strip():
+            self._show_syntax_error(None)
+            return
+        self._validate_task = BackgroundTask(
+            self, self._validate_worker, self.validator, text, start, on_success=self._show_syntax_error
+        ).start()
+
+    @staticmethod
+    def _validate_worker(task, validator, text, start):
+        return validator.validate(text, start, task.cancel_event)
+
+    def _show_syntax_error(self, result):
+        """标出（或清除）语法错误（Tk主线程）"""
+        had_error = self._syntax_error is not None
+        if result is None or result.ok:
+            self._syntax_error = None
+            self.highlighter.clear_error()
+            self.error_btn.pack_forget()
+            if had_error and result is not None:
+                self.update_info("JSON格式正确", True)
+            return
+
+        self._syntax_error = result
+        self.highlighter.mark_error(result.lineno, result.colno)
+        if not had_error:
+            self.error_btn.pack(side="right", padx=(0, 10), before=self.info_label)
+        if self.task is None or not self.task.running:
+            message = f"JSON格式错误：第 {result.lineno} 行第 {result.colno} 列，{result.error}"
+            self.update_info(message, False)
+
+    def jump_to_error(self):
+        """把光标移到语法错误处（展开折叠并滚动到可见）"""
+        index = self.highlighter.error_index()
+        if index is not None:
+            self.highlighter.reveal(index)
+
+    def parse_json(self):
+        """在后台线程解析JSON（已打开文件时读取文件，否则读取文本框）"""
+        if self.task is not None and self.task.running:
+            return
+
+        from_file = self.json_file_path is not None
+        if from_file:
+            source = self.json_file_path
+        else:
+            # 获取文本框内容（Tk控件只能在主线程访问）
+            source = self.json_textbox.get("1.0", END).strip()
+            if not source:
                 messagebox.showwarning("警告", "请输入JSON文本！")
                 self.update_info("请输入JSON文本", False)
                 return
 
-            # 解析JSON
-            self.json_data = json.loads(json_text)
+        self._start_task(
+            "正在解析JSON…",
+            self._parse_worker,
+            source,
+            from_file,
+            bool(self.lazy_switch.get()),
+            get_backend(BACKEND_LABELS[self.backend_menu.get()]),
+            on_success=lambda result: self._on_parse_success(*result),
+        )
+
+    def _start_task(self, message, worker, *args, on_success, error_prefix="解析失败", wait_on_cancel=False):
+        """启动后台任务；wait_on_cancel 为 True 时取消后等工作线程停止才恢复按钮"""
+        self.parse_btn.configure(state="disabled")
+        self.open_btn.configure(state="disabled")
+        self.generate_btn.configure(state="disabled")
+        self.cancel_btn.grid()
+        self.task_error_prefix = error_prefix
+        self.update_info(message, None)
+        self.task_message = message
+        self.task = BackgroundTask(
+            self,
+            worker,
+            *args,
+            on_success=on_success,
+            on_error=self._on_task_error,
+            on_progress=self._on_task_progress,
+            on_cancel=self._on_task_cancel,
+            wait_on_cancel=wait_on_cancel,
+        ).start()
+
+    @staticmethod
+    def _parse_worker(task, source, from_file, lazy, backend):
+        """工作线程：完整解析或只建立顶层索引，支持进度回报与取消
 
+        Args:
+            source: JSON文本，from_file 为 True 时为文件路径（内存映射读取）
+            lazy: True 时只扫描顶层Key，值在访问时才解析
+            backend: JSON解码后端
+
+        Returns:
+            (解析结果, 导航器, 是否来自缓存, 待写入磁盘缓存的 (Key, 结果, 源长度) 或 None)
+        """
+        if lazy:
+            # 流式索引持有文件映射、本身也只扫描顶层，不进缓存
+            json_data = (index_file if from_file else index_text)(
+                source, progress=task.report, cancel_event=task.cancel_event, backend=backend
+            )
+            navigator = PathNavigator(json_data).prepare() if isinstance(json_data, LazyJsonObject) else None
+            return json_data, navigator, False, None
+
+        # 同样的内容用同一个后端解析过：直接复用解析结果和派生的索引
+        key = f"{backend.name}-{file_hash(source) if from_file else content_hash(source)}"
+        cached = documents.get(key)
+        if cached is not None:
+            json_data, navigator = cached
+            return json_data, navigator and navigator.fresh(), True, None
+
+        parse = parse_file if from_file else parse_incremental
+        json_data = parse(source, progress=task.report, cancel_event=task.cancel_event, backend=backend)
+        # 根节点的显示文本和Key检索索引也在工作线程中建好；界面用缓存中导航器的副本
+        navigator = PathNavigator(json_data).prepare() if isinstance(json_data, dict) else None
+        entry = (key, (json_data, navigator), os.path.getsize(source) if from_file else len(source))
+        documents.put(*entry)
+        return json_data, navigator and navigator.fresh(), False, entry
+
+    def cancel_task(self):
+        """取消正在进行的后台任务"""
+        if self.task is not None:
+            self.task.cancel()
+            if self.task.cancelling:
+                self.cancel_btn.configure(state="disabled")
+                self.update_info("正在取消，等待后台任务停止…", None)
+
+    def _finish_task(self):
+        """恢复后台任务期间禁用的按钮"""
+        self.parse_btn.configure(state="normal")
+        self.open_btn.configure(state="normal")
+        self.generate_btn.configure(state="normal")
+        self.cancel_btn.configure(state="normal")
+        self.cancel_btn.grid_remove()
+
+    def _on_task_progress(self, done, total, elapsed):
+        percent = done * 100 / total if total else 0
+        self.update_info(f"{self.task_message} {percent:.0f}%  已用时 {elapsed:.1f} 秒", None)
+
+    def _on_task_cancel(self):
+        self._finish_task()
+        self.update_info("已取消", False)
+
+    def _on_task_error(self, e):
+        self._finish_task()
+        if isinstance(e, (ParseCancelled, ExportCancelled)):
+            return
+        if isinstance(e, json.JSONDecodeError):
+            err_msg = f"JSON格式错误：{e!s}"
+        else:
+            err_msg = f"{self.task_error_prefix}：{e!s}"
+        messagebox.showerror("错误", err_msg)
+        self.update_info(err_msg, False)
+
+    def _on_parse_success(self, json_data, navigator, from_cache=False, spill=None):
+        """解析完成后刷新Key列表（Tk主线程），之后再在后台把解析结果写入磁盘缓存"""
+        elapsed = self.task.elapsed
+        self._finish_task()
+        try:
             # 检查是否为字典类型
-            if not isinstance(self.json_data, dict):
+            if not isinstance(json_data, (dict, LazyJsonObject)):
                 messagebox.showwarning("警告", "JSON根节点必须是对象（字典）类型！")
                 self.update_info("JSON根节点必须是对象类型", False)
                 return
 
-            # 获取所有原始主Key并显示
+            # 获取所有原始主Key并显示（释放上一份流式索引的文件映射）
+            if isinstance(getattr(self, "json_data", None), LazyJsonObject):
+                self.json_data.close()
+            self.json_data = json_data
+            self.navigator = navigator
             self.original_main_keys = list(self.json_data.keys())
-            self.current_selected_list_key = None
-            self.current_list_data = None
-            self.current_list_keys = []
+            self._reset_list_state()
+            self._clear_filter()
 
             # 显示原始主Key（标记列表类型）
-            for key in self.original_main_keys:
-                value_type = " [LIST]" if isinstance(self.json_data[key], list) else ""
-                self.key_listbox.insert(END, f"{key}{value_type}")
+            self._show_keys(self.original_main_keys, self.navigator.root_labels)
+            if spill is not None:
+                documents.spill(*spill)  # 结果已经显示出来，写磁盘不再拖慢解析
 
             # 更新UI状态
             self.key_label.configure(text="JSON 主Key列表（拖动排序）")
             self.back_btn.configure(state="disabled")
+            self._render_breadcrumb()
 
             messagebox.showinfo("成功", "JSON解析成功！")
-            self.update_info("JSON解析成功", True)
+            source = "使用缓存的解析结果，" if from_cache else ""
+            self.update_info(f"JSON解析成功（{source}耗时 {elapsed:.2f} 秒）", True)
 
-        except json.JSONDecodeError as e:
-            err_msg = f"JSON格式错误：{e!s}"
-            messagebox.showerror("错误", err_msg)
-            self.update_info(err_msg, False)
         except Exception as e:
             err_msg = f"解析失败：{e!s}"
             messagebox.showerror("错误", err_msg)
@@ -297,56 +651,262 @@ class JsonPanel(ctk.CTkFrame):
         """选中Key后的回调函数"""
         selected_indices = self.key_listbox.curselection()
         if not selected_indices:
+            if self.current_node is not None:
+                self.hide_preview()
             return
 
         selected_index = selected_indices[0]
         selected_key_display = self.key_listbox.get(selected_index)
 
         # 如果当前显示的是原始主Key
-        if self.current_selected_list_key is None:
+        if self.current_node is None:
             # 清理类型标记，获取纯Key名称
-            pure_key = re.sub(r" \[LIST\]$", "", selected_key_display)
+            pure_key = strip_list_tag(selected_key_display)
 
             # 检查该Key是否为列表类型
-            if pure_key in self.json_data and isinstance(self.json_data[pure_key], list):
-                list_data = self.json_data[pure_key]
-                # 确保列表非空且第一个元素是字典
-                if len(list_data) > 0 and isinstance(list_data[0], dict):
-                    self.current_selected_list_key = pure_key
-                    self.current_list_data = list_data
-                    self.current_list_keys = list(list_data[0].keys())
-
-                    # 清空列表并显示该列表的内部Key
-                    self.key_listbox.delete(0, END)
-                    for key in self.current_list_keys:
-                        self.key_listbox.insert(END, key)
-
-                    # 更新UI
-                    self.key_label.configure(text=f"{pure_key} 内部Key")
-                    self.back_btn.configure(state="normal")
-                    self.update_info(f"已选择列表：{pure_key}", True)
+            if pure_key not in self.json_data or not self.navigator.is_root_list(pure_key):
+                return
+            self._open_node((pure_key,))
+        else:
+            # 列表内部：预览选中的Key；只选中一个Key时统计该列
+            self.show_preview([self.visible_keys[idx] for idx in selected_indices])
+            if len(selected_indices) == 1:
+                self._show_column_stats(self.visible_keys[selected_index])
+
+    def show_preview(self, keys):
+        """在文本框下方按表格预览当前列表中选中的Key（按需从列中解码可见的行）"""
+        store = self.current_node.store
+        self.preview_table.set_source(keys, len(store), lambda start, stop: store.rows(keys, start, stop))
+        title = f"数据预览：{self.current_node.title}（{len(store)} 行，{len(keys)} 列）"
+        self.preview_label.configure(text=title)
+        self.left_frame.grid_rowconfigure(2, weight=1)
+        self.preview_frame.grid()
+
+    def hide_preview(self):
+        self.preview_frame.grid_remove()
+        self.left_frame.grid_rowconfigure(2, weight=0)
+
+    def _show_column_stats(self, key):
+        """在后台统计该列并显示在信息栏；新的点击会取消尚未完成的上一次统计"""
+        if self.task is not None and self.task.running:
+            return
+        if self._stats_task is not None:
+            self._stats_task.cancel()
+        node = self.current_node
+        self._stats_task = BackgroundTask(
+            self,
+            self._stats_worker,
+            node.store,
+            key,
+            on_success=lambda stats: self._on_column_stats(node, key, stats),
+        ).start()
+
+    @staticmethod
+    def _stats_worker(task, store, key):
+        return store.column(key).stats(task.cancel_event)
+
+    def _on_column_stats(self, node, key, stats):
+        if node is self.current_node:
+            self.update_info(f"{key}：{stats.summary()}", True)
+
+    def on_key_double_click(self, event):
+        """列表内部双击 [LIST] 字段：进入下一层列表"""
+        if self.current_node is None:
+            return
+        index = self.key_listbox.nearest(event.y)
+        if index < 0:
+            return
+        key = strip_list_tag(self.key_listbox.get(index))
+        if self.current_node.is_list(key):
+            self._open_node(self.current_node.path + (key,))
+
+    def _open_node(self, path):
+        """进入路径对应的列表：访问过的节点直接显示，否则后台加载并推断结构"""
+        if self.task is not None and self.task.running:
+            return
+        flatten = bool(self.flatten_switch.get())
+        node = self.navigator.node(path, flatten)
+        if node is not None:
+            self._show_node(node)
+            return
+
+        self._start_task(
+            f"正在加载列表 {format_node_path(path)}…",
+            self._node_worker,
+            self.navigator,
+            path,
+            flatten,
+            on_success=self._on_node_loaded,
+        )
+
+    @staticmethod
+    def _node_worker(task, navigator, path, flatten):
+        """工作线程：按需解析列表、展开路径并推断其结构"""
+        return navigator.build(path, flatten, progress=task.report, cancel_event=task.cancel_event)
+
+    def _on_node_loaded(self, node):
+        self._finish_task()
+        self.navigator.remember(node)
+        self._show_node(node)
+
+    def on_flatten_toggle(self):
+        """切换展开嵌套：当前在列表内部时按新模式重新显示内部Key"""
+        if self.current_node is None:
+            return
+        if self.task is not None and self.task.running:
+            # 正在执行其他任务，恢复开关状态（select / deselect 不会再次触发回调）
+            if self.flatten_switch.get():
+                self.flatten_switch.deselect()
+            else:
+                self.flatten_switch.select()
+            return
+        self._open_node(self.current_node.path)
+
+    def _show_node(self, node):
+        """进入列表节点，显示其内部Key（所有记录Key的并集，列表类型加标记）"""
+        if not node.schema.fields:
+            self.update_info(f"列表 {node.title} 中没有对象类型的元素", False)
+            return
+
+        self.navigator.path = node.path
+        self.hide_preview()
+        self.current_node = node
+        self.current_selected_list_key = node.key
+        self.current_list_data = node.records
+        self.current_list_keys = node.order
+        self._clear_filter()
+
+        # 显示该列表的内部Key
+        self._show_keys(self.current_list_keys, node.labels)
+
+        # 更新UI
+        self.key_label.configure(text=f"{node.key} 内部Key")
+        self.back_btn.configure(state="normal")
+        self._render_breadcrumb()
+        self.update_info(f"已选择列表：{node.title}（{node.schema.summary()}）", True)
+
+    def _show_keys(self, keys, labels):
+        """按 keys 的顺序显示预先算好的显示文本，有筛选条件时只显示匹配的Key"""
+        index = self.current_node.index if self.current_node is not None else self.navigator.root_index
+        matches = index.search(self._filter_query)
+        self.visible_keys = keys if matches is None else list(filter(matches.__contains__, keys))
+        self.key_listbox.set_items(map(labels.__getitem__, self.visible_keys))
+
+    def _current_keys(self):
+        """当前层级的完整Key列表（显示顺序）及其显示文本"""
+        if self.current_node is not None:
+            return self.current_list_keys, self.current_node.labels
+        return self.original_main_keys, self.navigator.root_labels
+
+    def _on_filter_changed(self, *_args):
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+        self._filter_job = self.after(FILTER_DEBOUNCE_MS, self.apply_filter)
+
+    def apply_filter(self):
+        """按筛选框内容刷新Key列表（查索引，不逐个扫描Key）"""
+        self._filter_job = None
+        query = self.filter_entry.get()
+        if self.navigator is None or query == self._filter_query:
+            return
+        self._filter_query = query
+        keys, labels = self._current_keys()
+        self._show_keys(keys, labels)
+        if query.strip():
+            self.update_info(f"筛选出 {len(self.visible_keys)} / {len(keys)} 个Key", True)
+
+    def _clear_filter(self):
+        """切换层级时清空筛选条件"""
+        self.filter_entry.delete(0, END)
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+            self._filter_job = None
+        self._filter_query = ""
+
+    def on_keys_reordered(self, indices, dst):
+        """拖动排序后同步Key顺序，导出列顺序与显示顺序一致"""
+        keys, _labels = self._current_keys()
+        sorter = self.current_node.sorter if self.current_node is not None else self.navigator.root_sorter
+        sorter.invalidate()
+        if self.visible_keys is keys:
+            move_block(keys, indices, dst)
+            return
+        # 筛选状态下：拖动的Key整体插到完整列表中紧随其后的那个可见Key之前
+        moved = [self.visible_keys[i] for i in indices]
+        move_block(self.visible_keys, indices, dst)
+        end = dst + len(moved)
+        following = self.visible_keys[end] if end < len(self.visible_keys) else None
+        moved_set = set(moved)
+        rest = [key for key in keys if key not in moved_set]
+        position = rest.index(following) if following is not None else len(rest)
+        keys[:] = rest[:position] + moved + rest[position:]
+
+    def _reset_list_state(self):
+        self.hide_preview()
+        self.current_node = None
+        self.current_selected_list_key = None
+        self.current_list_data = None
+        self.current_list_keys = []
+
+    def _render_breadcrumb(self):
+        """按当前路径重建面包屑：主Key › orders[*] › items[*]"""
+        for child in self.breadcrumb_frame.winfo_children():
+            child.destroy()
+        path = self.current_node.path if self.current_node is not None else ()
+        crumbs = ["主Key"] + [f"{key}[*]" for key in path]
+        for depth, text in enumerate(crumbs):
+            if depth:
+                ctk.CTkLabel(self.breadcrumb_frame, text="›", font=CTK_FONT_SMALL, text_color="#aaaaaa").pack(
+                    side="left", padx=2
+                )
+            is_current = depth == len(crumbs) - 1
+            ctk.CTkButton(
+                self.breadcrumb_frame,
+                text=text,
+                command=lambda d=depth: self.go_to_depth(d),
+                font=CTK_FONT_SMALL,
+                fg_color="transparent",
+                hover_color=BG_COLOR_SELECT,
+                text_color="#ffffff" if is_current else "#64b5f6",
+                state="disabled" if is_current else "normal",
+                width=0,
+                height=24,
+            ).pack(side="left")
+
+    def go_to_depth(self, depth):
+        """跳到面包屑中的第 depth 层（0 为主Key列表）"""
+        if self.current_node is None or depth >= len(self.current_node.path):
+            return
+        if depth == 0:
+            self.back_to_main_keys()
+        else:
+            self._open_node(self.current_node.path[:depth])
+
+    def go_back(self):
+        """返回上一层"""
+        if self.current_node is not None:
+            self.go_to_depth(len(self.current_node.path) - 1)
 
     def back_to_main_keys(self):
         """返回显示原始主Key列表"""
-        # 清空列表
-        self.key_listbox.delete(0, END)
+        # 重置状态
+        self.navigator.path = ()
+        self._reset_list_state()
+        self._clear_filter()
 
         # 重新显示原始主Key
-        for key in self.original_main_keys:
-            value_type = " [LIST]" if isinstance(self.json_data[key], list) else ""
-            self.key_listbox.insert(END, f"{key}{value_type}")
-
-        # 重置状态
+        self._show_keys(self.original_main_keys, self.navigator.root_labels)
         self.key_label.configure(text="JSON 主Key列表（拖动排序）")
         self.back_btn.configure(state="disabled")
-        self.current_selected_list_key = None
-        self.current_list_data = None
-        self.current_list_keys = []
+        self._render_breadcrumb()
         self.update_info("已返回主Key列表", True)
 
     def sort_keys(self, sort_type):
-        """对当前显示的Key进行升序/降序排序"""
+        """按选中的排序方式对当前显示的Key进行升序/降序排序"""
         try:
+            mode = self.sort_menu.get()
+            reverse = sort_type == "desc"
+            direction = "降序" if reverse else "升序"
             if self.current_selected_list_key:
                 # 排序列表内部Key
                 if not self.current_list_keys:
@@ -354,48 +914,34 @@ class JsonPanel(ctk.CTkFrame):
                     self.update_info("暂无Key可排序", False)
                     return
 
-                if sort_type == "asc":
-                    self.current_list_keys.sort()
-                    self.update_info("内部Key已升序排列", True)
-                else:
-                    self.current_list_keys.sort(reverse=True)
-                    self.update_info("内部Key已降序排列", True)
-
-                # 重新显示
-                self.key_listbox.delete(0, END)
-                for key in self.current_list_keys:
-                    self.key_listbox.insert(END, key)
+                # 顺序有变化时才重新显示
+                if self.current_node.sorter.sort(self.current_list_keys, mode, reverse):
+                    self._show_keys(self.current_list_keys, self.current_node.labels)
+                self.update_info(f"内部Key已按{mode}{direction}排列", True)
             else:
                 # 排序原始主Key
-                if not self.original_main_keys:
+                if self.navigator is None or not self.original_main_keys:
                     messagebox.showwarning("警告", "暂无Key可排序！")
                     self.update_info("暂无Key可排序", False)
                     return
 
-                if sort_type == "asc":
-                    self.original_main_keys.sort()
-                    self.update_info("主Key已升序排列", True)
-                else:
-                    self.original_main_keys.sort(reverse=True)
-                    self.update_info("主Key已降序排列", True)
-
-                # 重新显示
-                self.key_listbox.delete(0, END)
-                for key in self.original_main_keys:
-                    value_type = " [LIST]" if isinstance(self.json_data[key], list) else ""
-                    self.key_listbox.insert(END, f"{key}{value_type}")
+                if self.navigator.root_sorter.sort(self.original_main_keys, mode, reverse):
+                    self._show_keys(self.original_main_keys, self.navigator.root_labels)
+                self.update_info(f"主Key已按{mode}{direction}排列", True)
         except Exception as e:
             err_msg = f"排序失败：{e!s}"
             messagebox.showerror("错误", err_msg)
             self.update_info(err_msg, False)
 
     def generate_excel(self):
-        """根据选中的Key生成Excel文件"""
+        """根据选中的Key生成Excel / CSV / Parquet / Arrow 文件（后台写出）"""
         try:
             if not hasattr(self, "json_data") or not self.json_data:
                 messagebox.showwarning("警告", "请先解析有效的JSON数据！")
                 self.update_info("请先解析JSON数据", False)
                 return
+            if self.task is not None and self.task.running:
+                return
 
             # 情况1：选中了列表Key（如authors），显示的是列表内部Key
             if self.current_selected_list_key and self.current_list_data:
@@ -406,44 +952,43 @@ class JsonPanel(ctk.CTkFrame):
                     self.update_info("请选择至少一个内部Key", False)
                     return
 
-                # 收集选中的Key
-                selected_keys = [self.key_listbox.get(idx) for idx in selected_indices]
+                # 收集选中的Key（按当前显示顺序，即拖动排序后的列顺序）
+                selected_keys = [self.visible_keys[idx] for idx in selected_indices]
 
-                # 提取数据
-                excel_data = []
-                for item in self.current_list_data:
-                    if isinstance(item, dict):
-                        row_data = {k: item.get(k, "") for k in selected_keys}
-                        excel_data.append(row_data)
-
-                if not excel_data:
+                store = self.current_node.store
+                if not has_rows(store):
                     messagebox.showwarning("警告", "没有可导出的数据！")
                     self.update_info("无数据可导出", False)
                     return
 
-                # 转换为DataFrame
-                df = pd.DataFrame(excel_data)
-
-                # 选择保存路径
+                # 选择保存路径（默认使用选中的导出格式）
+                fmt = self.format_menu.get()
+                ext, label, _writer = EXPORT_FORMATS[fmt]
                 file_path = filedialog.asksaveasfilename(
-                    defaultextension=".xlsx",
-                    filetypes=[("Excel文件", "*.xlsx"), ("所有文件", "*.*")],
-                    title="保存Excel文件",
-                    initialfile=f"{self.current_selected_list_key}.xlsx",
+                    defaultextension=ext,
+                    filetypes=[(label, f"*{ext}"), ("所有文件", "*.*")],
+                    title=f"保存{label}",
+                    initialfile=f"{self.current_selected_list_key}{ext}",
                 )
 
                 if not file_path:
                     self.update_info("已取消保存", False)
                     return
 
-                # 写入Excel文件（工作表名使用选中的列表Key）
-                with pd.ExcelWriter(file_path, engine="openpyxl") as writer:
-                    safe_sheet_name = self.current_selected_list_key[:31]
-                    df.to_excel(writer, sheet_name=safe_sheet_name, index=False)
-
-                success_msg = f"生成成功：{file_path}"
-                messagebox.showinfo("成功", success_msg)
-                self.update_info(success_msg, True)
+                # 后台写入文件（Excel工作表名使用选中的列表Key；格式以实际扩展名为准）
+                fmt = format_for_path(file_path, default=fmt)
+                self._start_task(
+                    f"正在生成{fmt}…",
+                    self._export_worker,
+                    file_path,
+                    store,
+                    selected_keys,
+                    self.current_selected_list_key,
+                    fmt,
+                    on_success=lambda rows: self._on_export_success(file_path, rows),
+                    error_prefix="生成失败",
+                    wait_on_cancel=True,
+                )
 
             # 情况2：显示的是原始主Key
             else:
@@ -454,3 +999,17 @@ class JsonPanel(ctk.CTkFrame):
             err_msg = f"生成失败：{e!s}"
             messagebox.showerror("错误", err_msg)
             self.update_info(err_msg, False)
+
+    @staticmethod
+    def _export_worker(task, file_path, records, columns, sheet_name, fmt):
+        """工作线程：按格式写出文件"""
+        return export_records(
+            file_path, records, columns, sheet_name, progress=task.report, cancel_event=task.cancel_event, fmt=fmt
+        )
+
+    def _on_export_success(self, file_path, rows):
+        elapsed = self.task.elapsed
+        self._finish_task()
+        success_msg = f"生成成功：{file_path}"
+        messagebox.showinfo("成功", success_msg)
+        self.update_info(f"{success_msg}（{rows} 行，耗时 {elapsed:.2f} 秒）", True)
@@ -0,0 +1,294 @@
+"""可拖动排序的虚拟列表：数据保存在Python列表中，只绘制可见的几十行
+
+tk.Listbox 每插入一行都是一次Tcl调用，十万行要数秒；这里换成 Canvas，
+行数只影响滚动条比例，刷新 / 排序都只是替换Python列表后重绘可见区域。
+支持多选后整体拖动、拖到边缘自动滚动，松开时一次性批量移动。
+只依赖 tkinter，JSON面板与 test.py 共用。
+"""
+
+import tkinter as tk
+from tkinter import font as tkfont
+
+ROW_PADDING = 4  # 行高 = 字体行距 + ROW_PADDING
+TEXT_INDENT = 4  # 文字左侧留白（像素）
+FRAME_MS = 16  # 拖动时最多每帧（约60fps）重绘一次插入标记
+DROP_MARKER_COLOR = "#64b5f6"
+AUTOSCROLL_EDGE = 16  # 拖到距上下边缘这么多像素以内时自动滚动
+AUTOSCROLL_MS = 40  # 自动滚动的间隔
+
+
+def move_block(seq, indices, dst):
+    """把 seq 中下标为 indices 的元素（保持相对顺序）整体移动到下标 dst 处（原地修改）
+
+    dst 是移动后第一个元素的下标；单个元素时等价于 seq.insert(dst, seq.pop(src))。
+    """
+    moving = set(indices)
+    block = [seq[i] for i in sorted(moving)]
+    rest = [item for i, item in enumerate(seq) if i not in moving]
+    dst = min(max(dst, 0), len(rest))
+    seq[:] = rest[:dst] + block + rest[dst:]
+
+
+def drop_position(indices, anchor, row):
+    """把以 anchor 行为抓手的 indices 拖放到 row 行时，move_block 的 dst
+
+    向下拖放到目标行之后，向上拖放到目标行之前（与插入标记的位置一致）。
+    """
+    insert_at = row + 1 if row > anchor else row
+    return insert_at - sum(1 for i in indices if i < insert_at)
+
+
+class VirtualListbox(tk.Canvas):
+    """只绘制可见行的多选列表，可拖动排序；松开时调用 on_reorder(indices, dst)"""
+
+    def __init__(
+        self,
+        master,
+        font=("Consolas", 11),
+        bg="#1a1a1a",
+        fg="#ffffff",
+        selectbackground="#3a3a3a",
+        selectforeground="#ffffff",
+        yscrollcommand=None,
+        on_reorder=None,
+        **kwargs,
+    ):
+        kwargs.setdefault("highlightthickness", 0)
+        kwargs.setdefault("bd", 0)
+        super().__init__(master, bg=bg, **kwargs)
+        self.font = font
+        self.fg = fg
+        self.select_bg = selectbackground
+        self.select_fg = selectforeground
+        self.yscrollcommand = yscrollcommand
+        self.on_reorder = on_reorder
+        self.row_height = tkfont.Font(self, font=font).metrics("linespace") + ROW_PADDING
+
+        self._items = []  # 每行的显示文本
+        self._selected = set()  # 选中行的下标
+        self._top = 0  # 可见区域顶部对应的像素偏移
+        self._pool = []  # 复用的 (背景矩形, 文字) 画布对象，数量等于可见行数
+        self._redraw_pending = False
+        self.drag_index = None  # 按下鼠标的行（拖动的抓手）
+        self.drag_rows = ()  # 拖动的全部行
+        self.drop_index = None  # 松开鼠标时拖放到的行
+        self._dragged = False  # 按下后是否发生了拖动
+        self._deselect_on_release = False  # 按下已选中的行：没有拖动时松开才取消选中
+        self._drag_y = 0  # 最近一次拖动的纵坐标（自动滚动时使用）
+        self._autoscroll_job = None
+        self._marker_pending = False
+        self._marker = self.create_line(0, 0, 0, 0, fill=DROP_MARKER_COLOR, width=2, state="hidden")
+
+        self.bind("<Configure>", lambda e: self._schedule_redraw())
+        self.bind("<Button-1>", self._on_click)
+        self.bind("<B1-Motion>", self._on_drag)
+        self.bind("<ButtonRelease-1>", self._on_release)
+        self.bind("<MouseWheel>", self._on_wheel)
+        self.bind("<Button-4>", lambda e: self.yview_scroll(-3, "units"))
+        self.bind("<Button-5>", lambda e: self.yview_scroll(3, "units"))
+
+    # ---------- 数据 ----------
+
+    def set_items(self, items):
+        """替换全部行（清空选中，回到顶部）"""
+        self._items = list(items)
+        self._selected.clear()
+        self._top = 0
+        self.drag_index = self.drop_index = None
+        self._schedule_redraw()
+
+    @property
+    def items(self) -> list:
+        return self._items
+
+    def size(self) -> int:
+        return len(self._items)
+
+    def get(self, index):
+        return self._items[index]
+
+    def curselection(self) -> tuple:
+        return tuple(sorted(self._selected))
+
+    def selection_set(self, index):
+        self._selected.add(index)
+        self._schedule_redraw()
+
+    def selection_clear(self):
+        self._selected.clear()
+        self._schedule_redraw()
+
+    def nearest(self, y) -> int:
+        """离画布纵坐标 y 最近的行，列表为空时返回 -1"""
+        if not self._items:
+            return -1
+        return min(max(int((y + self._top) // self.row_height), 0), len(self._items) - 1)
+
+    # ---------- 滚动 ----------
+
+    def _max_top(self) -> int:
+        return max(len(self._items) * self.row_height - self.winfo_height(), 0)
+
+    def _scroll_to(self, top):
+        top = min(max(int(top), 0), self._max_top())
+        if top != self._top:
+            self._top = top
+            self._schedule_redraw()
+
+    def yview(self, *args):
+        """供滚动条调用：yview("moveto", 比例) / yview("scroll", n, "units"|"pages")"""
+        if not args:
+            total = len(self._items) * self.row_height or 1
+            return self._top / total, min((self._top + self.winfo_height()) / total, 1.0)
+        if args[0] == "moveto":
+            self._scroll_to(float(args[1]) * len(self._items) * self.row_height)
+        elif args[0] == "scroll":
+            self.yview_scroll(int(args[1]), args[2])
+        return None
+
+    def yview_scroll(self, number, what):
+        step = self.winfo_height() if what == "pages" else self.row_height
+        self._scroll_to(self._top + number * step)
+
+    def see(self, index):
+        """滚动到使第 index 行可见"""
+        y = index * self.row_height
+        if y < self._top:
+            self._scroll_to(y)
+        elif y + self.row_height > self._top + self.winfo_height():
+            self._scroll_to(y + self.row_height - self.winfo_height())
+
+    def _on_wheel(self, event):
+        self.yview_scroll(-3 if event.delta > 0 else 3, "units")
+
+    # ---------- 绘制 ----------
+
+    def _schedule_redraw(self):
+        """合并同一轮事件中的多次刷新请求，空闲时只重绘一次"""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._redraw)
+
+    def _redraw(self):
+        self._redraw_pending = False
+        height = self.winfo_height()
+        width = self.winfo_width()
+        visible = height // self.row_height + 2
+        while len(self._pool) < visible:
+            rect = self.create_rectangle(0, 0, 0, 0, width=0)
+            text = self.create_text(0, 0, anchor="nw", font=self.font)
+            self._pool.append((rect, text))
+
+        first = self._top // self.row_height
+        offset = first * self.row_height - self._top
+        for slot, (rect, text) in enumerate(self._pool):
+            index = first + slot
+            if slot >= visible or index >= len(self._items):
+                self.itemconfigure(rect, state="hidden")
+                self.itemconfigure(text, state="hidden")
+                continue
+            y = offset + slot * self.row_height
+            selected = index in self._selected
+            self.coords(rect, 0, y, width, y + self.row_height)
+            self.itemconfigure(rect, state="normal", fill=self.select_bg if selected else self["bg"])
+            self.coords(text, TEXT_INDENT, y + ROW_PADDING // 2)
+            self.itemconfigure(
+                text, state="normal", text=self._items[index], fill=self.select_fg if selected else self.fg
+            )
+
+        self._draw_drop_marker()
+        if self.yscrollcommand is not None:
+            self.yscrollcommand(*self.yview())
+
+    def _draw_drop_marker(self):
+        """在拖放目标处画插入线（向下拖画在目标行下沿，向上拖画在上沿）"""
+        self._marker_pending = False
+        if self.drag_index is None or self.drop_index is None or self.drop_index == self.drag_index:
+            self.itemconfigure(self._marker, state="hidden")
+            return
+        row = self.drop_index + (self.drop_index > self.drag_index)
+        y = row * self.row_height - self._top
+        self.coords(self._marker, 0, y, self.winfo_width(), y)
+        self.itemconfigure(self._marker, state="normal")
+        self.tag_raise(self._marker)
+
+    # ---------- 鼠标 ----------
+
+    def _on_click(self, event):
+        """按下鼠标：未选中的行立即选中；已选中的行等松开时再判断（以便拖动多行）"""
+        self.focus_set()
+        index = self.nearest(event.y)
+        self.drag_index = index if index >= 0 else None
+        self.drop_index = None
+        self._dragged = False
+        self._deselect_on_release = False
+        if self.drag_index is None:
+            return
+        if index in self._selected:
+            self._deselect_on_release = True
+            self.drag_rows = tuple(sorted(self._selected))
+        else:
+            self._selected.add(index)
+            self.drag_rows = (index,)
+            self._schedule_redraw()
+            self.event_generate("<<ListboxSelect>>")
+
+    def _on_drag(self, event):
+        """拖动时只记录目标位置，插入标记每帧最多重绘一次；靠近边缘时自动滚动"""
+        if self.drag_index is None:
+            return
+        self._dragged = True
+        self._drag_y = event.y
+        self.drop_index = self.nearest(event.y)
+        if not self._marker_pending:
+            self._marker_pending = True
+            self.after(FRAME_MS, self._draw_drop_marker)
+        if self._autoscroll_job is None and self._autoscroll_step():
+            self._autoscroll_job = self.after(AUTOSCROLL_MS, self._auto_scroll)
+
+    def _autoscroll_step(self) -> int:
+        if self._drag_y < AUTOSCROLL_EDGE:
+            return -1
+        if self._drag_y > self.winfo_height() - AUTOSCROLL_EDGE:
+            return 1
+        return 0
+
+    def _auto_scroll(self):
+        """鼠标停在边缘时持续滚动（不需要继续移动鼠标）"""
+        step = self._autoscroll_step() if self.drag_index is not None else 0
+        if not step:
+            self._autoscroll_job = None
+            return
+        self.yview_scroll(step, "units")
+        self.drop_index = self.nearest(self._drag_y)
+        self._autoscroll_job = self.after(AUTOSCROLL_MS, self._auto_scroll)
+
+    def _on_release(self, event):
+        """松开鼠标：一次性批量移动拖动的行并同步选中状态"""
+        anchor, row, rows = self.drag_index, self.drop_index, self.drag_rows
+        dragged, deselect = self._dragged, self._deselect_on_release
+        self.drag_index = self.drop_index = None
+        self.drag_rows = ()
+        self.itemconfigure(self._marker, state="hidden")
+        if self._autoscroll_job is not None:
+            self.after_cancel(self._autoscroll_job)
+            self._autoscroll_job = None
+        if anchor is None:
+            return
+        if not dragged or row is None or row == anchor:
+            if deselect and not dragged:
+                self._selected.discard(anchor)
+                self._schedule_redraw()
+                self.event_generate("<<ListboxSelect>>")
+            return
+
+        dst = drop_position(rows, anchor, row)
+        order = list(range(len(self._items)))
+        move_block(order, rows, dst)
+        if order == sorted(order):
+            return  # 位置没有变化
+        move_block(self._items, rows, dst)
+        self._selected = {new for new, old in enumerate(order) if old in self._selected}
+        self._schedule_redraw()
+        if self.on_reorder is not None:
+            self.on_reorder(rows, dst)
@@ -0,0 +1,49 @@
+"""面板注册表：面板声明自己的名称、侧边栏文字、图标和工厂，主窗口据此生成侧边栏
+
+工厂写成 "模块:类" 字符串，注册时不导入面板模块，
+首次显示（或空闲预热）时才导入并创建。
+"""
+
+import importlib
+
+
+class PanelSpec:
+    """一个面板的声明"""
+
+    def __init__(self, name, title, icon, factory, options=None, order=0):
+        self.name = name  # 唯一名称（select_frame_by_name 使用）
+        self.title = title  # 侧边栏按钮文字
+        self.icon = icon  # (浅色主题图标, 深色主题图标) 素材名
+        self.factory = factory  # "模块:类" 或 callable(parent, **options)
+        self.options = options or {}  # 创建面板时额外传入的参数
+        self.order = order  # 侧边栏中的顺序，越小越靠前
+
+    def create(self, parent):
+        """导入（如有必要）并创建面板"""
+        factory = self.factory
+        if isinstance(factory, str):
+            module_name, _, attr = factory.partition(":")
+            factory = getattr(importlib.import_module(module_name), attr)
+        return factory(parent, **self.options)
+
+
+_PANELS = {}
+
+
+def register_panel(name, title, icon, factory, options=None, order=None) -> PanelSpec:
+    """注册面板；同名面板会被替换。order 省略时排在已注册面板之后
+
+    Raises:
+        ValueError: 工厂字符串不是 "模块:类" 格式
+    """
+    if isinstance(factory, str) and ":" not in factory:
+        raise ValueError(f"面板工厂格式应为 \"模块:类\"：{factory}")
+    if order is None:
+        order = max((spec.order for spec in _PANELS.values()), default=-1) + 1
+    spec = _PANELS[name] = PanelSpec(name, title, icon, factory, options, order)
+    return spec
+
+
+def registered_panels() -> list:
+    """按侧边栏顺序返回所有已注册的面板"""
+    return sorted(_PANELS.values(), key=lambda spec: spec.order)
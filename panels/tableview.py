@@ -0,0 +1,364 @@
+"""只绘制可见单元格的表格预览：百万行的列表也能立即打开
+
+数据不复制进控件：调用方给出行数和取数函数 fetch(start, stop)，表格按块（BLOCK_ROWS 行）
+取可见区域附近的行，只缓存最近的几块。等宽字体下单元格文字按列宽截断；
+拖动表头分隔线调整列宽时只重新截断该列可见的几十个单元格，右侧各列整体平移，
+不重绘整个表格。只依赖 tkinter。
+"""
+
+import json
+import tkinter as tk
+import unicodedata
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import accumulate
+from tkinter import font as tkfont
+
+ROW_PADDING = 4  # 行高 = 字体行距 + ROW_PADDING
+CELL_PADDING = 6  # 单元格文字左右留白（像素）
+MIN_COLUMN_WIDTH = 40
+MAX_AUTO_CHARS = 40  # 自动列宽最多容纳的字符数
+SAMPLE_ROWS = 50  # 按前这么多行估算自动列宽
+BLOCK_ROWS = 200  # 每次取数的行数
+CACHED_BLOCKS = 8  # 缓存最近取过的块数
+RESIZE_MARGIN = 4  # 距表头分隔线这么多像素以内可以拖动调整列宽
+FRAME_MS = 16  # 调整列宽时最多每帧（约60fps）更新一次
+INDEX_COLUMN = "#"  # 行号列的表头
+
+
+def format_value(value) -> str:
+    """单元格显示文本：null 为空，嵌套值为JSON文本，换行显示为空格"""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    text = value if isinstance(value, str) else str(value)
+    return text.replace("\n", " ") if "\n" in text else text
+
+
+def display_width(text) -> int:
+    """等宽字体下的显示宽度（以半角字符计，中日韩全角字符占两格）"""
+    if text.isascii():
+        return len(text)
+    return sum(2 if unicodedata.east_asian_width(char) in "WF" else 1 for char in text)
+
+
+def clip_text(text, chars) -> str:
+    """截断到不超过 chars 个半角字符宽，被截断时以 … 结尾"""
+    if display_width(text) <= chars:
+        return text
+    if chars <= 1:
+        return ""
+    if text.isascii():
+        return text[: chars - 1] + "…"
+    used = 0
+    for i, char in enumerate(text):
+        used += 2 if unicodedata.east_asian_width(char) in "WF" else 1
+        if used > chars - 1:
+            return text[:i] + "…"
+    return text
+
+
+class VirtualTable(tk.Canvas):
+    """虚拟滚动的只读表格（首列为行号）
+
+    纵向、横向滚动都只改变偏移量后重绘可见单元格；单元格画布对象放在池中复用。
+    """
+
+    def __init__(
+        self,
+        master,
+        font=("Consolas", 11),
+        bg="#1a1a1a",
+        fg="#ffffff",
+        header_bg="#404040",
+        header_fg="#64b5f6",
+        grid_color="#333333",
+        yscrollcommand=None,
+        xscrollcommand=None,
+        **kwargs,
+    ):
+        kwargs.setdefault("highlightthickness", 0)
+        kwargs.setdefault("bd", 0)
+        super().__init__(master, bg=bg, **kwargs)
+        self.font = font
+        self.fg = fg
+        self.header_bg = header_bg
+        self.header_fg = header_fg
+        self.grid_color = grid_color
+        self.yscrollcommand = yscrollcommand
+        self.xscrollcommand = xscrollcommand
+        metrics = tkfont.Font(self, font=font)
+        self.char_width = metrics.measure("0")
+        self.row_height = metrics.metrics("linespace") + ROW_PADDING
+
+        self.columns = []  # 表头（首列为行号）
+        self.widths = []  # 各列宽度（像素）
+        self._edges = [0]  # 各列左边界的前缀和，最后一项为总宽度
+        self._known_widths = {}  # 列名 -> 宽度，重新设置数据源时保留调整过的列宽
+        self._count = 0
+        self._fetch = None
+        self._blocks = OrderedDict()  # 块号 -> 该块的行
+        self._top = 0  # 可见区域顶部对应的像素偏移（不含表头）
+        self._left = 0  # 可见区域左侧对应的像素偏移
+        self._cells = []  # 复用的单元格文字对象
+        self._full_text = {}  # 画布对象 -> 未截断的文字
+        self._redraw_pending = False
+        self._resize = None  # 正在调整的 (列, 按下时的横坐标, 按下时的列宽)
+        self._resize_pending = False
+        self._applied_width = 0  # 已经画到画布上的被调整列的宽度
+
+        self._header_rect = self.create_rectangle(0, 0, 0, 0, width=0, fill=header_bg, tags=("header",))
+        self._header_items = []  # 每列的 (表头文字, 右侧分隔线)
+
+        self.bind("<Configure>", lambda e: self._schedule_redraw())
+        self.bind("<Motion>", self._on_motion)
+        self.bind("<Button-1>", self._on_press)
+        self.bind("<B1-Motion>", self._on_drag)
+        self.bind("<ButtonRelease-1>", self._on_release)
+        self.bind("<MouseWheel>", self._on_wheel)
+        self.bind("<Shift-MouseWheel>", self._on_shift_wheel)
+        self.bind("<Button-4>", lambda e: self.yview_scroll(-3, "units"))
+        self.bind("<Button-5>", lambda e: self.yview_scroll(3, "units"))
+        self.bind("<Shift-Button-4>", lambda e: self.xview_scroll(-3, "units"))
+        self.bind("<Shift-Button-5>", lambda e: self.xview_scroll(3, "units"))
+
+    # ---------- 数据 ----------
+
+    def set_source(self, columns, count, fetch):
+        """替换数据源：columns 为列名，count 为行数，fetch(start, stop) 按行返回值"""
+        self._count = count
+        self._fetch = fetch
+        self._blocks.clear()
+        self._top = self._left = 0
+        self.columns = [INDEX_COLUMN] + list(columns)
+
+        sample = self._rows(0, min(count, SAMPLE_ROWS))
+        self.widths = [self._known_widths.get(INDEX_COLUMN) or self._chars_to_width(len(str(count)))]
+        for j, name in enumerate(columns, start=1):
+            width = self._known_widths.get(name)
+            if width is None:
+                chars = max([display_width(name)] + [display_width(format_value(row[j])) for row in sample])
+                width = self._chars_to_width(min(chars, MAX_AUTO_CHARS))
+            self.widths.append(width)
+        self._edges = list(accumulate(self.widths, initial=0))
+
+        for text, line in self._header_items:
+            self.delete(text, line)
+        self._header_items = [
+            (
+                self.create_text(0, 0, anchor="nw", font=self.font, fill=self.header_fg, tags=("header",)),
+                self.create_line(0, 0, 0, 0, fill=self.grid_color, tags=("header", f"divider{j}")),
+            )
+            for j in range(len(self.columns))
+        ]
+        self._schedule_redraw()
+
+    def _chars_to_width(self, chars):
+        return max(chars * self.char_width + 2 * CELL_PADDING, MIN_COLUMN_WIDTH)
+
+    def _width_to_chars(self, width):
+        return (width - 2 * CELL_PADDING) // self.char_width
+
+    def _rows(self, start, stop) -> list:
+        """[start, stop) 行的显示文本（首列为行号），按块从数据源取并缓存"""
+        rows = []
+        for block in range(start // BLOCK_ROWS, (stop - 1) // BLOCK_ROWS + 1 if stop > start else 0):
+            cached = self._blocks.get(block)
+            if cached is None:
+                first = block * BLOCK_ROWS
+                values = self._fetch(first, min(first + BLOCK_ROWS, self._count))
+                cached = self._blocks[block] = [
+                    [str(first + i + 1), *map(format_value, row)] for i, row in enumerate(values)
+                ]
+                if len(self._blocks) > CACHED_BLOCKS:
+                    self._blocks.popitem(last=False)
+            else:
+                self._blocks.move_to_end(block)
+            base = block * BLOCK_ROWS
+            rows.extend(cached[max(start - base, 0) : stop - base])
+        return rows
+
+    # ---------- 滚动 ----------
+
+    def _body_height(self) -> int:
+        return max(self.winfo_height() - self.row_height, 0)
+
+    def _scroll_to(self, top=None, left=None):
+        max_top = max(self._count * self.row_height - self._body_height(), 0)
+        max_left = max(self._edges[-1] - self.winfo_width(), 0)
+        top = self._top if top is None else min(max(int(top), 0), max_top)
+        left = self._left if left is None else min(max(int(left), 0), max_left)
+        if (top, left) != (self._top, self._left):
+            self._top, self._left = top, left
+            self._schedule_redraw()
+
+    def yview(self, *args):
+        """供纵向滚动条调用，参数同 VirtualListbox.yview"""
+        total = self._count * self.row_height or 1
+        if not args:
+            return self._top / total, min((self._top + self._body_height()) / total, 1.0)
+        if args[0] == "moveto":
+            self._scroll_to(top=float(args[1]) * total)
+        elif args[0] == "scroll":
+            self.yview_scroll(int(args[1]), args[2])
+        return None
+
+    def yview_scroll(self, number, what):
+        step = self._body_height() if what == "pages" else self.row_height
+        self._scroll_to(top=self._top + number * step)
+
+    def xview(self, *args):
+        """供横向滚动条调用"""
+        total = self._edges[-1] or 1
+        if not args:
+            return self._left / total, min((self._left + self.winfo_width()) / total, 1.0)
+        if args[0] == "moveto":
+            self._scroll_to(left=float(args[1]) * total)
+        elif args[0] == "scroll":
+            self.xview_scroll(int(args[1]), args[2])
+        return None
+
+    def xview_scroll(self, number, what):
+        step = self.winfo_width() if what == "pages" else self.char_width * 4
+        self._scroll_to(left=self._left + number * step)
+
+    def _on_wheel(self, event):
+        self.yview_scroll(-3 if event.delta > 0 else 3, "units")
+
+    def _on_shift_wheel(self, event):
+        self.xview_scroll(-3 if event.delta > 0 else 3, "units")
+
+    # ---------- 绘制 ----------
+
+    def _schedule_redraw(self):
+        """合并同一轮事件中的多次刷新请求，空闲时只重绘一次"""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._redraw)
+
+    def _visible_columns(self) -> range:
+        """与可见区域相交的列"""
+        first = max(bisect_right(self._edges, self._left) - 1, 0)
+        last = bisect_right(self._edges, self._left + self.winfo_width())
+        return range(first, min(last, len(self.columns)))
+
+    def _redraw(self):
+        self._redraw_pending = False
+        width, height = self.winfo_width(), self.winfo_height()
+        row_height = self.row_height
+        first = self._top // row_height
+        rows = self._rows(first, min(first + self._body_height() // row_height + 2, self._count))
+        offset = row_height + first * row_height - self._top
+        columns = self._visible_columns()
+
+        needed = len(rows) * len(columns)
+        while len(self._cells) < needed:
+            self._cells.append(self.create_text(0, 0, anchor="nw", font=self.font, fill=self.fg))
+        self._full_text.clear()
+        cells = iter(self._cells)
+        for slot, row in enumerate(rows):
+            y = offset + slot * row_height + ROW_PADDING // 2
+            for j in columns:
+                item = next(cells)
+                self._full_text[item] = row[j]
+                self.coords(item, self._edges[j] - self._left + CELL_PADDING, y)
+                self.itemconfigure(
+                    item,
+                    state="normal",
+                    text=clip_text(row[j], self._width_to_chars(self.widths[j])),
+                    tags=("cell", f"col{j}"),
+                )
+        for item in cells:
+            self.itemconfigure(item, state="hidden", tags=("cell",))
+
+        # 表头盖在滚动到一半的第一行上面
+        self.coords(self._header_rect, 0, 0, width, row_height)
+        for j, (text, line) in enumerate(self._header_items):
+            if j not in columns:
+                self.itemconfigure(text, state="hidden")
+                self.itemconfigure(line, state="hidden")
+                continue
+            x = self._edges[j] - self._left
+            self._full_text[text] = self.columns[j]
+            self.coords(text, x + CELL_PADDING, ROW_PADDING // 2)
+            self.itemconfigure(
+                text, state="normal", text=clip_text(self.columns[j], self._width_to_chars(self.widths[j]))
+            )
+            self.addtag_withtag(f"col{j}", text)
+            self.coords(line, x + self.widths[j], 0, x + self.widths[j], height)
+            self.itemconfigure(line, state="normal")
+        self.tag_raise("header")
+
+        if self.yscrollcommand is not None:
+            self.yscrollcommand(*self.yview())
+        if self.xscrollcommand is not None:
+            self.xscrollcommand(*self.xview())
+
+    # ---------- 调整列宽 ----------
+
+    def _divider_at(self, x, y):
+        """表头中位于 x 附近的列分隔线所属的列，没有时返回 None"""
+        if y > self.row_height or not self.columns:
+            return None
+        x += self._left
+        j = bisect_right(self._edges, x + RESIZE_MARGIN) - 2
+        if 0 <= j < len(self.columns) and abs(self._edges[j + 1] - x) <= RESIZE_MARGIN:
+            return j
+        return None
+
+    def _on_motion(self, event):
+        if self._resize is None:
+            self.configure(cursor="sb_h_double_arrow" if self._divider_at(event.x, event.y) is not None else "")
+
+    def _on_press(self, event):
+        column = self._divider_at(event.x, event.y)
+        if column is None:
+            return
+        self._resize = (column, event.x, self.widths[column])
+        self._applied_width = self.widths[column]
+        # 右侧的列（单元格、表头、分隔线）和本列的分隔线一起平移
+        self.addtag_withtag("resize_shift", f"divider{column}")
+        for j in range(column + 1, len(self.columns)):
+            self.addtag_withtag("resize_shift", f"col{j}")
+            self.addtag_withtag("resize_shift", f"divider{j}")
+
+    def _on_drag(self, event):
+        if self._resize is None:
+            return
+        column, x0, width0 = self._resize
+        self.widths[column] = max(width0 + event.x - x0, MIN_COLUMN_WIDTH)
+        if not self._resize_pending:
+            self._resize_pending = True
+            self.after(FRAME_MS, self._apply_resize)
+
+    def _apply_resize(self):
+        """把列宽变化画到画布上：右侧整体平移，只重新截断本列可见的单元格"""
+        self._resize_pending = False
+        if self._resize is None:
+            return
+        column = self._resize[0]
+        width = self.widths[column]
+        self.move("resize_shift", width - self._applied_width, 0)
+        self._applied_width = width
+        chars = self._width_to_chars(width)
+        for item in self.find_withtag(f"col{column}"):
+            full = self._full_text.get(item)
+            if full is not None:
+                self.itemconfigure(item, text=clip_text(full, chars))
+        self._edges = list(accumulate(self.widths, initial=0))
+        if self.xscrollcommand is not None:
+            self.xscrollcommand(*self.xview())
+
+    def _on_release(self, event):
+        if self._resize is None:
+            return
+        self._apply_resize()
+        column = self._resize[0]
+        self._known_widths[self.columns[column]] = self.widths[column]
+        self._resize = None
+        self.dtag("resize_shift", "resize_shift")
+        self._scroll_to(left=self._left)  # 列宽变小后不留空白
+        self._schedule_redraw()  # 补上右侧新露出来的列
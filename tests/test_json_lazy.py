@@ -0,0 +1,88 @@
+"""core.json_lazy：流式顶层索引按需解析的结果与 json.loads 一致"""
+
+import json
+import random
+
+import pytest
+
+from core.json_lazy import LazyJsonObject, index_file, index_text
+
+DOCUMENTS = [
+    "{}",
+    '{"a": 1, "b": "x", "c": null, "d": true, "e": -1.5e3}',
+    '{"list": [1, [2, [3, []]], {}], "obj": {"x": {"y": {"z": [{}]}}}}',
+    # 字符串中的括号、引号、反斜杠不能影响括号配对
+    r'{"s": "}]{[", "t": "a\"b", "u": "\\", "v": "\\\"}", "w": ["]", "\\]"], "x": {"k}": "{"}}',
+    r'{"esc": "\n\té😀\/", "key\"quoted": [1], "中文": {"值": "测试"}}',
+    '  {\n  "a" : [ 1 ,\n 2 ] ,\r\n "b" : { }\t}  ',
+    '{"dup": 1, "dup": 2}',
+]
+
+
+def materialize(doc):
+    return {key: doc[key] for key in doc}
+
+
+@pytest.mark.parametrize("text", DOCUMENTS)
+def test_index_text_matches_json_loads(text):
+    doc = index_text(text)
+    assert isinstance(doc, LazyJsonObject)
+    assert materialize(doc) == json.loads(text)
+
+
+@pytest.mark.parametrize("text", DOCUMENTS)
+def test_index_file_matches_json_loads(tmp_path, text):
+    path = tmp_path / "doc.json"
+    path.write_text(text, encoding="utf-8")
+    doc = index_file(path)
+    try:
+        assert materialize(doc) == json.loads(text)
+    finally:
+        doc.close()
+
+
+def test_index_file_skips_bom(tmp_path):
+    path = tmp_path / "bom.json"
+    path.write_bytes(b"\xef\xbb\xbf" + '{"a": ["é"]}'.encode())
+    doc = index_file(path)
+    try:
+        assert doc.load("a") == ["é"]
+    finally:
+        doc.close()
+
+
+def test_non_object_root_is_parsed_directly():
+    assert index_text("[1, {\"a\": 2}]") == [1, {"a": 2}]
+
+
+@pytest.mark.parametrize("text", ['{"a": [1, 2}', '{"a": "x}', '{"a" 1}', '{"a": 1,}', '{"a": 1} x', ""])
+def test_invalid_documents_raise(text):
+    with pytest.raises(json.JSONDecodeError):
+        materialize(index_text(text))
+
+
+def random_value(rng, depth=0):
+    kind = rng.randrange(6 if depth < 4 else 3)
+    if kind == 0:
+        return rng.choice([None, True, False, 0, -12, 3.25, 10**30])
+    if kind in (1, 2):
+        return "".join(rng.choice('ab{}[]"\\/,:\n\té😀 ') for _ in range(rng.randint(0, 8)))
+    if kind == 3:
+        return [random_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    return {random_value(rng, 4) if rng.random() < 0.9 else "k": random_value(rng, depth + 1) for _ in range(3)}
+
+
+def test_random_documents_match_json_loads(tmp_path):
+    rng = random.Random(0)
+    for i in range(200):
+        value = {f"k{j}{random_value(rng, 4)}": random_value(rng) for j in range(rng.randint(0, 6))}
+        text = json.dumps(value, ensure_ascii=rng.random() < 0.5, indent=rng.choice([None, 1]))
+        value = json.loads(text)  # 非字符串的Key在 dumps 时变成了字符串
+        assert materialize(index_text(text)) == value
+        path = tmp_path / f"doc{i}.json"
+        path.write_text(text, encoding="utf-8")
+        doc = index_file(path)
+        try:
+            assert materialize(doc) == value
+        finally:
+            doc.close()
@@ -0,0 +1,42 @@
+"""core.key_index：前缀与子串检索和逐个扫描的结果一致"""
+
+import random
+
+import pytest
+
+from core.key_index import KeyIndex
+
+KEYS = ["id", "userId", "user_name", "UserEmail", "address", "addr", "名称", "名字", "a", "ab", "", "Ä-key"]
+
+
+@pytest.fixture(scope="module")
+def index():
+    return KeyIndex(KEYS)
+
+
+@pytest.mark.parametrize("query", ["u", "us", "user", "USER", "ser", "name", "ad", "addr", "名", "a", "-k", "zz"])
+def test_substring_matches_scan(index, query):
+    expected = {key for key in KEYS if query.casefold() in key.casefold()}
+    assert index.search(query) == expected
+
+
+@pytest.mark.parametrize("query", ["u", "user", "ADD", "名", "a", "ä", "x"])
+def test_prefix_matches_scan(index, query):
+    expected = {key for key in KEYS if key.casefold().startswith(query.casefold())}
+    assert index.search("^" + query) == expected
+
+
+def test_empty_query_does_not_filter(index):
+    assert index.search("") is None
+    assert index.search("  ") is None
+    assert index.search("^") is None
+
+
+def test_random_keys_match_scan():
+    rng = random.Random(0)
+    keys = ["".join(rng.choice("abcAB_") for _ in range(rng.randint(1, 8))) for _ in range(500)]
+    index = KeyIndex(keys)
+    for _ in range(200):
+        query = "".join(rng.choice("abAB_") for _ in range(rng.randint(1, 5)))
+        assert index.search(query) == {key for key in keys if query.casefold() in key.casefold()}
+        assert index.search("^" + query) == {key for key in keys if key.casefold().startswith(query.casefold())}
@@ -0,0 +1,52 @@
+"""panels.listview：多选整体移动与拖放位置的计算"""
+
+import random
+
+import pytest
+
+from panels.listview import drop_position, move_block
+
+
+@pytest.mark.parametrize(
+    ("indices", "dst", "expected"),
+    [
+        ([0], 2, "bcade"),
+        ([4], 0, "eabcd"),
+        ([1, 3], 0, "bdace"),
+        ([1, 3], 3, "acebd"),
+        ([0, 1, 2, 3, 4], 0, "abcde"),
+        ([2], 99, "abdec"),
+        ([2], -5, "cabde"),
+    ],
+)
+def test_move_block(indices, dst, expected):
+    seq = list("abcde")
+    move_block(seq, indices, dst)
+    assert "".join(seq) == expected
+
+
+def test_move_block_single_item_matches_insert_pop():
+    rng = random.Random(0)
+    for _ in range(200):
+        seq = list(range(rng.randint(1, 10)))
+        src, dst = rng.randrange(len(seq)), rng.randrange(len(seq))
+        expected = seq[:]
+        expected.insert(dst, expected.pop(src))
+        move_block(seq, [src], dst)
+        assert seq == expected
+
+
+@pytest.mark.parametrize(
+    ("indices", "anchor", "row", "expected"),
+    [
+        ([1], 1, 3, "acdbe"),  # 向下：放到目标行之后
+        ([3], 3, 1, "adbce"),  # 向上：放到目标行之前
+        ([1, 2], 1, 4, "adebc"),
+        ([1, 3], 3, 0, "bdace"),
+        ([2], 2, 2, "abcde"),
+    ],
+)
+def test_drop_position(indices, anchor, row, expected):
+    seq = list("abcde")
+    move_block(seq, indices, drop_position(indices, anchor, row))
+    assert "".join(seq) == expected
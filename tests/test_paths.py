@@ -0,0 +1,82 @@
+"""core.paths：路径格式化 / 解析、取值函数与记录展开"""
+
+import pytest
+
+from core.paths import compile_path, flatten_record, format_path, parse_path
+
+RECORD = {
+    "id": 7,
+    "address": {"city": "Paris", "geo": {"lat": 1.5}},
+    "tags": ["a", "b"],
+    "a.b": "top",
+    "odd": {"x.y": [10, 20]},
+    "text": "abc",
+}
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("id", 7),
+        ("address.city", "Paris"),
+        ("address.geo.lat", 1.5),
+        ("tags[1]", "b"),
+        ("a.b", "top"),
+        ('["a.b"]', "top"),
+        ('odd["x.y"][1]', 20),
+    ],
+)
+def test_compile_path_reads_values(path, expected):
+    assert compile_path(path)(RECORD) == expected
+
+
+@pytest.mark.parametrize("path", ["missing", "address.zip", "tags[5]", "text[0]", "id.x", "address[0]"])
+def test_compile_path_returns_default_when_missing(path):
+    assert compile_path(path, None)(RECORD) is None
+    assert compile_path(path)(RECORD) == ""
+
+
+def test_compile_path_accepts_raw_top_level_keys():
+    assert compile_path("weird[key")({"weird[key": 1}) == 1
+
+
+@pytest.mark.parametrize("steps", [("a",), ("a", "b", 0), ("a", "x.y", 2, "z"), ("orders", 0, 'q"')])
+def test_format_path_round_trips(steps):
+    if len(steps) > 1:
+        assert parse_path(format_path(steps)) == steps
+
+
+def test_format_path_keeps_top_level_keys_raw():
+    assert format_path(("a.b",)) == "a.b"
+    assert format_path(("a.b", "c")) == '["a.b"].c'
+
+
+@pytest.mark.parametrize("path", ["", ".a", "a..b", "a[", "a[x]"])
+def test_parse_path_rejects_invalid(path):
+    with pytest.raises(ValueError):
+        parse_path(path)
+
+
+def test_flatten_record():
+    flat = flatten_record(RECORD)
+    assert flat["address.geo.lat"] == 1.5
+    assert flat["tags[0]"] == "a"
+    assert flat['odd["x.y"][1]'] == 20
+    assert flat["a.b"] == "top"
+    for path, value in flat.items():
+        assert compile_path(path)(RECORD) == value
+
+
+def test_flatten_record_keeps_colliding_paths_apart():
+    record = {"a.b": 1, "a": {"b": 2}}
+    flat = flatten_record(record)
+    assert flat == {"a.b": 1, '["a"]["b"]': 2}
+    assert [compile_path(path)(record) for path in flat] == [1, 2]
+
+
+def test_flatten_record_limits():
+    record = {"deep": {"a": {"b": {"c": {"d": 1}}}}, "long": list(range(10)), "empty": {}}
+    flat = flatten_record(record, max_depth=3, max_list_items=2)
+    assert flat["deep.a.b"] == {"c": {"d": 1}}
+    assert [key for key in flat if key.startswith("long")] == ["long[0]", "long[1]"]
+    assert flat["empty"] == {}